@@ -1,24 +1,39 @@
 """
 API Routes
 Toutes les routes de l'API
+
+Les modules de routes ne sont importés qu'à la construction de l'application
+(include_routers) et leurs routes sont ajoutées directement à l'application :
+chaque route n'est recopiée qu'une fois (pas de router intermédiaire).
 """
 
-from fastapi import APIRouter
+from fastapi import FastAPI
+
 
-from backend.api import auth, users, exercises, sessions, routes, goals, running, programs, stats
+def include_routers(app: FastAPI, prefix: str = "/api"):
+    """Importe tous les modules de routes et les ajoute à l'application"""
+    from backend.api import (
+        auth, users, exercises, sessions, routes, goals, running, programs,
+        stats, media, coach, search, locations
+    )
 
-# Router principal de l'API
-api_router = APIRouter()
+    routers = (
+        (auth, "/auth", "Authentication"),
+        (users, "/users", "Users"),
+        (exercises, "/exercises", "Exercises"),
+        (sessions, "/sessions", "Sessions"),
+        (routes, "/routes", "Routes"),
+        (goals, "/goals", "Goals"),
+        (running, "/running", "Running"),
+        (programs, "/programs", "Programs"),
+        (stats, "/stats", "Stats"),
+        (media, "/media", "Media"),
+        (coach, "/coach", "Coach"),
+        (search, "/search", "Search"),
+        (locations, "/locations", "Locations"),
+    )
+    for module, router_prefix, tag in routers:
+        app.include_router(module.router, prefix=f"{prefix}{router_prefix}", tags=[tag])
 
-# Inclure tous les routers
-api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
-api_router.include_router(users.router, prefix="/users", tags=["Users"])
-api_router.include_router(exercises.router, prefix="/exercises", tags=["Exercises"])
-api_router.include_router(sessions.router, prefix="/sessions", tags=["Sessions"])
-api_router.include_router(routes.router, prefix="/routes", tags=["Routes"])
-api_router.include_router(goals.router, prefix="/goals", tags=["Goals"])
-api_router.include_router(running.router, prefix="/running", tags=["Running"])
-api_router.include_router(programs.router, prefix="/programs", tags=["Programs"])
-api_router.include_router(stats.router, prefix="/stats", tags=["Stats"])
 
-__all__ = ["api_router"]
\ No newline at end of file
+__all__ = ["include_routers"]
@@ -1,26 +1,33 @@
 """
 Routes d'authentification
-Login, register, refresh token, logout
+Login, register, refresh token, logout, vérification email, reset password
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr
 
+from backend.config import settings
 from backend.database import get_db
 from backend.auth import (
     verify_password,
     get_password_hash,
-    create_access_token,
-    create_refresh_token,
-    decode_refresh_token,
     validate_password_strength
 )
 from backend.dependencies import get_current_user
 from backend.models.user import User, UserRole
 from backend.models.user_config import UserConfig
+from backend.models.email_verification import EmailVerificationToken
+from backend.models.password_reset import PasswordResetToken
+from backend.services.mailer import queue_email, notify_outbox
+from backend.services.refresh_tokens import (
+    TokenError,
+    issue_tokens,
+    rotate_refresh_token,
+    revoke_user_sessions,
+)
 
 router = APIRouter()
 
@@ -45,6 +52,19 @@ class RefreshRequest(BaseModel):
     refresh_token: str
 
 
+class VerifyEmailRequest(BaseModel):
+    token: str
+
+
+class ForgotPasswordRequest(BaseModel):
+    email: EmailStr
+
+
+class ResetPasswordRequest(BaseModel):
+    token: str
+    new_password: str
+
+
 class UserResponse(BaseModel):
     id: int
     email: str
@@ -60,6 +80,24 @@ class UserResponse(BaseModel):
         from_attributes = True
 
 
+# === EMAILS ===
+
+def queue_verification_email(db: Session, user: User):
+    """Crée un token de vérification et met l'email en outbox (commit par l'appelant)"""
+    token = EmailVerificationToken(
+        user_id=user.id,
+        token=EmailVerificationToken.generate_token(),
+        expires_at=datetime.utcnow() + timedelta(hours=settings.EMAIL_VERIFICATION_TOKEN_EXPIRE_HOURS)
+    )
+    db.add(token)
+    
+    queue_email(db, "verification", user.email, {
+        "username": user.username,
+        "verify_url": f"{settings.APP_URL}/verify-email?token={token.token}",
+        "expire_hours": settings.EMAIL_VERIFICATION_TOKEN_EXPIRE_HOURS,
+    }, user_id=user.id)
+
+
 # === ROUTES ===
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -124,8 +162,13 @@ def register(
     )
     
     db.add(config)
+    
+    # Email de vérification : même transaction que l'utilisateur, envoi en tâche de fond
+    queue_verification_email(db, user)
+    
     db.commit()
     db.refresh(user)
+    notify_outbox()
     
     return user
 
@@ -160,17 +203,12 @@ def login(
     
     # Mettre à jour la date de dernière connexion
     user.last_login_at = datetime.utcnow()
-    db.commit()
     
-    # Créer les tokens
-    access_token = create_access_token(data={"sub": user.email})
-    refresh_token = create_refresh_token(data={"sub": user.email})
+    # Créer les tokens (nouvelle famille de refresh tokens)
+    tokens = issue_tokens(db, user)
+    db.commit()
     
-    return {
-        "access_token": access_token,
-        "refresh_token": refresh_token,
-        "token_type": "bearer"
-    }
+    return tokens
 
 
 @router.post("/refresh", response_model=TokenResponse)
@@ -180,32 +218,15 @@ def refresh_token(
 ):
     """
     Rafraîchit le token d'accès avec un refresh token
+    Rotation : le refresh token utilisé est remplacé, le réutiliser révoque la session
     """
-    # Vérifier le refresh token
-    email = decode_refresh_token(data.refresh_token)
-    if not email:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid refresh token"
-        )
-    
-    # Vérifier que l'utilisateur existe
-    user = db.query(User).filter(User.email == email).first()
-    if not user or not user.is_active:
+    try:
+        return rotate_refresh_token(db, data.refresh_token)
+    except TokenError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found or inactive"
+            detail=str(e)
         )
-    
-    # Créer de nouveaux tokens
-    access_token = create_access_token(data={"sub": user.email})
-    refresh_token = create_refresh_token(data={"sub": user.email})
-    
-    return {
-        "access_token": access_token,
-        "refresh_token": refresh_token,
-        "token_type": "bearer"
-    }
 
 
 @router.get("/me", response_model=UserResponse)
@@ -219,8 +240,135 @@ def get_current_user_info(
 
 
 @router.post("/logout")
-def logout(current_user: User = Depends(get_current_user)):
+def logout(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Déconnexion : révoque toutes les sessions de l'utilisateur
+    (refresh tokens et tokens d'accès en cours)
+    """
+    revoke_user_sessions(db, current_user)
+    db.commit()
+    
+    return {"message": "Successfully logged out"}
+
+
+@router.post("/verify-email")
+def verify_email(
+    data: VerifyEmailRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Vérifie l'adresse email avec le token reçu par email
+    """
+    token = db.query(EmailVerificationToken).filter(
+        EmailVerificationToken.token == data.token
+    ).first()
+    
+    if not token or not token.is_valid():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid or expired verification token"
+        )
+    
+    user = token.user
+    token.mark_as_verified()
+    
+    if not user.is_verified:
+        user.is_verified = True
+        user.updated_at = datetime.utcnow()
+        queue_email(db, "welcome", user.email, {"username": user.username}, user_id=user.id)
+    
+    db.commit()
+    notify_outbox()
+    
+    return {"message": "Email verified"}
+
+
+@router.post("/resend-verification")
+def resend_verification(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Renvoie l'email de vérification de l'utilisateur connecté
+    """
+    if current_user.is_verified:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already verified"
+        )
+    
+    queue_verification_email(db, current_user)
+    db.commit()
+    notify_outbox()
+    
+    return {"message": "Verification email sent"}
+
+
+@router.post("/forgot-password")
+def forgot_password(
+    data: ForgotPasswordRequest,
+    db: Session = Depends(get_db)
+):
     """
-    Déconnexion (côté client, suppression du token)
+    Demande de réinitialisation du mot de passe
+    Réponse identique que l'email existe ou non (pas d'énumération des comptes)
     """
-    return {"message": "Successfully logged out"}
\ No newline at end of file
+    user = db.query(User).filter(User.email == data.email).first()
+    
+    if user and user.is_active:
+        token = PasswordResetToken(
+            user_id=user.id,
+            token=PasswordResetToken.generate_token(),
+            expires_at=datetime.utcnow() + timedelta(hours=settings.PASSWORD_RESET_TOKEN_EXPIRE_HOURS)
+        )
+        db.add(token)
+        
+        queue_email(db, "password_reset", user.email, {
+            "username": user.username,
+            "reset_url": f"{settings.APP_URL}/reset-password?token={token.token}",
+            "expire_hours": settings.PASSWORD_RESET_TOKEN_EXPIRE_HOURS,
+        }, user_id=user.id)
+        
+        db.commit()
+        notify_outbox()
+    
+    return {"message": "If this email is registered, a reset link has been sent"}
+
+
+@router.post("/reset-password")
+def reset_password(
+    data: ResetPasswordRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Réinitialise le mot de passe avec le token reçu par email
+    """
+    token = db.query(PasswordResetToken).filter(
+        PasswordResetToken.token == data.token
+    ).first()
+    
+    if not token or not token.is_valid():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid or expired reset token"
+        )
+    
+    is_valid, error_msg = validate_password_strength(data.new_password)
+    if not is_valid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_msg
+        )
+    
+    user = token.user
+    user.password_hash = get_password_hash(data.new_password)
+    user.updated_at = datetime.utcnow()
+    token.mark_as_used()
+    revoke_user_sessions(db, user)
+    
+    db.commit()
+    
+    return {"message": "Password reset successfully"}
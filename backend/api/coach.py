@@ -0,0 +1,242 @@
+"""
+Routes de coaching
+Autorisations athlète -> coach et tableau de bord multi-athlètes
+"""
+
+from datetime import datetime
+from datetime import date as date_type
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from sqlalchemy import or_
+from pydantic import BaseModel
+
+from backend.database import get_db
+from backend.dependencies import get_current_user, require_coach
+from backend.models.user import User
+from backend.models.coach_athlete import CoachAthlete
+from backend.services.coaching import coach_dashboard
+
+router = APIRouter()
+
+
+# === SCHEMAS ===
+
+class LinkedUserResponse(BaseModel):
+    id: int
+    username: str
+    first_name: str | None
+    last_name: str | None
+    linked_at: datetime
+
+
+class GrantCoachRequest(BaseModel):
+    coach: str  # Email ou nom d'utilisateur du coach
+
+
+class WeekVolume(BaseModel):
+    training_sessions: int
+    training_minutes: int
+    climbs: int
+    sends: int
+    running_sessions: int
+    running_distance_km: float
+    running_elevation_m: int
+
+
+class AthleteLoad(BaseModel):
+    load_7d: int
+    acute_load: float
+    chronic_load: float
+    acwr: float | None
+
+
+class AthleteDashboard(BaseModel):
+    athlete_id: int
+    username: str
+    full_name: str
+    total_training_sessions: int
+    total_running_sessions: int
+    total_routes: int
+    current_month_sessions: int
+    current_week_sessions: int
+    week_volume: WeekVolume
+    load: AthleteLoad
+    last_session_date: date_type | None
+    goal_progress: list[dict]
+
+
+def _linked_users(db: Session, user_column, link_filter) -> list[dict]:
+    """Utilisateurs liés (coachs ou athlètes) avec la date d'autorisation"""
+    rows = db.query(User, CoachAthlete.created_at).join(
+        CoachAthlete, user_column == User.id
+    ).filter(link_filter).order_by(User.username).all()
+
+    return [
+        {
+            "id": user.id,
+            "username": user.username,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "linked_at": linked_at
+        }
+        for user, linked_at in rows
+    ]
+
+
+# === CÔTÉ ATHLÈTE ===
+
+@router.get("/coaches", response_model=list[LinkedUserResponse])
+def list_my_coaches(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Liste les coachs autorisés à voir mes données
+    """
+    return _linked_users(db, CoachAthlete.coach_id, CoachAthlete.athlete_id == current_user.id)
+
+
+@router.post("/coaches", response_model=LinkedUserResponse, status_code=status.HTTP_201_CREATED)
+def grant_coach(
+    request: GrantCoachRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Autorise un coach à voir mes données
+    """
+    coach = db.query(User).filter(
+        or_(User.email == request.coach, User.username == request.coach)
+    ).first()
+
+    # Même règle que require_coach : coachs et admins
+    if not coach or not coach.is_active or not (coach.is_coach or coach.is_admin):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Coach not found"
+        )
+
+    if coach.id == current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot grant access to yourself"
+        )
+
+    existing = db.query(CoachAthlete).filter(
+        CoachAthlete.coach_id == coach.id,
+        CoachAthlete.athlete_id == current_user.id
+    ).first()
+
+    if existing:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Coach already has access"
+        )
+
+    link = CoachAthlete(coach_id=coach.id, athlete_id=current_user.id)
+    db.add(link)
+    db.commit()
+    db.refresh(link)
+
+    return {
+        "id": coach.id,
+        "username": coach.username,
+        "first_name": coach.first_name,
+        "last_name": coach.last_name,
+        "linked_at": link.created_at
+    }
+
+
+@router.delete("/coaches/{coach_id}")
+def revoke_coach(
+    coach_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Retire l'accès d'un coach à mes données
+    """
+    deleted = db.query(CoachAthlete).filter(
+        CoachAthlete.coach_id == coach_id,
+        CoachAthlete.athlete_id == current_user.id
+    ).delete(synchronize_session=False)
+
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Coach not found"
+        )
+
+    db.commit()
+
+    return {"message": "Coach access revoked"}
+
+
+# === CÔTÉ COACH ===
+
+@router.get("/athletes", response_model=list[LinkedUserResponse])
+def list_athletes(
+    current_user: User = Depends(require_coach),
+    db: Session = Depends(get_db)
+):
+    """
+    Liste les athlètes suivis
+    """
+    return _linked_users(db, CoachAthlete.athlete_id, CoachAthlete.coach_id == current_user.id)
+
+
+@router.delete("/athletes/{athlete_id}")
+def remove_athlete(
+    athlete_id: int,
+    current_user: User = Depends(require_coach),
+    db: Session = Depends(get_db)
+):
+    """
+    Arrête le suivi d'un athlète
+    """
+    deleted = db.query(CoachAthlete).filter(
+        CoachAthlete.coach_id == current_user.id,
+        CoachAthlete.athlete_id == athlete_id
+    ).delete(synchronize_session=False)
+
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Athlete not found"
+        )
+
+    db.commit()
+
+    return {"message": "Athlete removed"}
+
+
+@router.get("/dashboard", response_model=list[AthleteDashboard])
+def get_coach_dashboard(
+    current_user: User = Depends(require_coach),
+    db: Session = Depends(get_db)
+):
+    """
+    Dashboard de tous les athlètes suivis
+    Nombre de requêtes fixe (agrégats GROUP BY user_id), quel que soit le nombre d'athlètes
+    """
+    return coach_dashboard(db, current_user.id)
+
+
+@router.get("/athletes/{athlete_id}/dashboard", response_model=AthleteDashboard)
+def get_athlete_dashboard(
+    athlete_id: int,
+    current_user: User = Depends(require_coach),
+    db: Session = Depends(get_db)
+):
+    """
+    Dashboard d'un athlète suivi
+    """
+    dashboards = coach_dashboard(db, current_user.id, athlete_id=athlete_id)
+
+    if not dashboards:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Athlete not found"
+        )
+
+    return dashboards[0]
@@ -0,0 +1,109 @@
+"""
+Routes des lieux
+Autocomplétion et statistiques par lieu (salles, falaises, sorties)
+"""
+
+from datetime import date as date_type
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from pydantic import BaseModel
+
+from backend.database import get_db
+from backend.dependencies import get_current_user
+from backend.responses import response_columns, rows_response
+from backend.models.user import User
+from backend.models.location import Location
+from backend.services.locations import autocomplete
+
+router = APIRouter()
+
+
+# === SCHEMAS ===
+
+class LocationSuggestion(BaseModel):
+    id: int
+    name: str
+    usage_count: int
+
+    class Config:
+        from_attributes = True
+
+
+class LocationStatsResponse(BaseModel):
+    id: int
+    name: str
+    training_sessions: int
+    running_sessions: int
+    routes: int
+    meters_climbed: int
+    last_date: date_type | None
+
+    class Config:
+        from_attributes = True
+
+
+# === ROUTES ===
+
+@router.get("/autocomplete", response_model=list[LocationSuggestion])
+def autocomplete_locations(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Suggestions de lieux (préfixe, sans accents ni casse), les plus utilisés d'abord
+    """
+    return autocomplete(db, current_user.id, q, limit)
+
+
+@router.get("", response_model=list[LocationStatsResponse])
+def list_locations(
+    sort: Literal["usage", "recent", "name", "meters"] = "usage",
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Statistiques par lieu (séances, grandes voies, mètres grimpés)
+    Lecture des compteurs de la table locations, sans regroupement sur les activités
+    """
+    if sort == "recent":
+        order = (Location.last_date.desc(), Location.id.desc())
+    elif sort == "name":
+        order = (Location.name_key,)
+    elif sort == "meters":
+        order = (Location.meters_climbed.desc(), Location.name_key)
+    else:
+        usage = Location.training_sessions + Location.running_sessions + Location.routes
+        order = (usage.desc(), Location.name_key)
+
+    rows = db.query(*response_columns(Location, LocationStatsResponse)).filter(
+        Location.user_id == current_user.id
+    ).order_by(*order).offset(skip).limit(limit).all()
+    return rows_response(rows)
+
+
+@router.get("/{location_id}", response_model=LocationStatsResponse)
+def get_location(
+    location_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Statistiques d'un lieu
+    """
+    location = db.query(Location).filter(
+        Location.id == location_id,
+        Location.user_id == current_user.id
+    ).first()
+
+    if not location:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Location not found"
+        )
+
+    return location
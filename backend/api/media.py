@@ -0,0 +1,89 @@
+"""
+Routes des médias
+Signature des URLs (utilisateur connecté) et service des fichiers signés
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from pydantic import BaseModel, Field
+
+from backend.dependencies import get_current_user
+from backend.models.user import User
+from backend.services.media import (
+    MediaError,
+    normalize_media_path,
+    media_owner_id,
+    sign_media_path,
+    verify_media_signature,
+    media_response,
+)
+
+router = APIRouter()
+
+
+# === SCHEMAS ===
+
+class SignMediaRequest(BaseModel):
+    paths: list[str] = Field(..., min_length=1, max_length=100)  # Chemins ou URLs /uploads/...
+
+
+class SignMediaResponse(BaseModel):
+    urls: dict[str, str]  # Chemin demandé -> URL signée
+
+
+# === ROUTES ===
+
+@router.post("/sign", response_model=SignMediaResponse)
+def sign_media(
+    data: SignMediaRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Signe les URLs de médias de l'utilisateur connecté
+    (aucune requête base : la propriété se lit dans le chemin)
+    """
+    urls = {}
+    for requested in data.paths:
+        try:
+            path = normalize_media_path(requested)
+        except MediaError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid media path: {requested}"
+            )
+
+        if media_owner_id(path) != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Not allowed to access: {requested}"
+            )
+
+        urls[requested] = sign_media_path(path)
+
+    return {"urls": urls}
+
+
+@router.api_route("/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+def get_media(
+    path: str,
+    request: Request,
+    expires: int = Query(...),
+    signature: str = Query(...)
+):
+    """
+    Sert un média via une URL signée (Range, requêtes conditionnelles, cache)
+    """
+    try:
+        path = normalize_media_path(path)
+    except MediaError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media not found")
+
+    if not verify_media_signature(path, expires, signature):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid or expired media signature"
+        )
+
+    try:
+        return media_response(request, path, expires)
+    except MediaError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media not found")
@@ -1,17 +1,20 @@
 """
 Routes de gestion des programmes d'entraînement
-CRUD sur les programmes
+CRUD sur les programmes, catalogue des programmes publics
 """
 
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
+from sqlalchemy import or_
 from pydantic import BaseModel
 
 from backend.database import get_db
 from backend.dependencies import get_current_user
 from backend.models.user import User
 from backend.models.program import Program
+from backend.services.program_catalog import catalog
 
 router = APIRouter()
 
@@ -27,12 +30,34 @@ class ProgramResponse(BaseModel):
     structure_json: str | None
     is_active: bool | None
     is_public: bool | None
+    copy_count: int
+    source_program_id: int | None
     created_at: datetime
     
     class Config:
         from_attributes = True
 
 
+class PublicProgramSummary(BaseModel):
+    id: int
+    name: str
+    description: str | None
+    duration_weeks: int | None
+    copy_count: int
+    author: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class PublicProgramDetail(PublicProgramSummary):
+    structure_json: str | None
+
+
+class ProgramCatalogResponse(BaseModel):
+    items: list[PublicProgramSummary]
+    total: int
+
+
 class CreateProgramRequest(BaseModel):
     name: str
     description: str | None = None
@@ -73,6 +98,63 @@ def list_programs(
     return programs
 
 
+@router.get("/public", response_model=ProgramCatalogResponse)
+def list_public_programs(
+    q: str | None = Query(None, max_length=100),
+    sort: Literal["popular", "recent", "name"] = "popular",
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Catalogue des programmes publics
+    Recherche sur le nom et la description, tri par popularité (copies),
+    date ou nom. Servi depuis le cache partagé du processus.
+    """
+    return Response(
+        content=catalog.search(db, q, sort, skip, limit),
+        media_type="application/json"
+    )
+
+
+@router.get("/public/{program_id}", response_model=PublicProgramDetail)
+def get_public_program(
+    program_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Détail d'un programme public (avec sa structure)
+    """
+    row = db.query(Program, User.username).join(
+        User, User.id == Program.user_id
+    ).filter(
+        Program.id == program_id,
+        Program.is_public == True,
+        User.is_active == True
+    ).first()
+    
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Program not found"
+        )
+    
+    program, author = row
+    return {
+        "id": program.id,
+        "name": program.name,
+        "description": program.description,
+        "duration_weeks": program.duration_weeks,
+        "copy_count": program.copy_count,
+        "author": author,
+        "created_at": program.created_at,
+        "updated_at": program.updated_at,
+        "structure_json": program.structure_json
+    }
+
+
 @router.get("/{program_id}", response_model=ProgramResponse)
 def get_program(
     program_id: int,
@@ -123,6 +205,9 @@ def create_program(
     db.commit()
     db.refresh(program)
     
+    if program.is_public:
+        catalog.invalidate()
+    
     return program
 
 
@@ -147,6 +232,8 @@ def update_program(
             detail="Program not found"
         )
     
+    was_public = program.is_public
+    
     # Mettre à jour les champs fournis
     if data.name is not None:
         program.name = data.name
@@ -171,6 +258,9 @@ def update_program(
     db.commit()
     db.refresh(program)
     
+    if was_public or program.is_public:
+        catalog.invalidate()
+    
     return program
 
 
@@ -194,12 +284,66 @@ def delete_program(
             detail="Program not found"
         )
     
+    was_public = program.is_public
+    
     db.delete(program)
     db.commit()
     
+    if was_public:
+        catalog.invalidate()
+    
     return {"message": "Program deleted successfully"}
 
 
+@router.post("/{program_id}/copy", response_model=ProgramResponse, status_code=status.HTTP_201_CREATED)
+def copy_program(
+    program_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Copie un programme public (ou un de mes programmes) dans mes programmes
+    La copie est privée et inactive ; le compteur de copies du programme
+    source n'est incrémenté que pour la copie d'un programme d'un autre utilisateur
+    """
+    source = db.query(Program).filter(
+        Program.id == program_id,
+        or_(Program.is_public == True, Program.user_id == current_user.id)
+    ).first()
+    
+    if not source:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Program not found"
+        )
+    
+    program = Program(
+        user_id=current_user.id,
+        source_program_id=source.id,
+        name=source.name,
+        description=source.description,
+        duration_weeks=source.duration_weeks,
+        structure_json=source.structure_json,
+        is_active=False,
+        is_public=False,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+    db.add(program)
+    
+    if source.user_id != current_user.id:
+        # Incrément atomique (copies simultanées), sans toucher updated_at
+        db.query(Program).filter(Program.id == source.id).update(
+            {Program.copy_count: Program.copy_count + 1, Program.updated_at: Program.updated_at},
+            synchronize_session=False
+        )
+    
+    db.commit()
+    db.refresh(program)
+    
+    return program
+
+
 @router.post("/{program_id}/activate")
 def activate_program(
     program_id: int,
@@ -5,12 +5,27 @@ CRUD sur les voies d'escalade
 
 from datetime import datetime
 from datetime import date as date_type
-from fastapi import APIRouter, Depends, HTTPException, status
+from pathlib import Path
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from backend.database import get_db
 from backend.dependencies import get_current_user
+from backend.responses import response_columns, rows_response
+from backend.services.images import (
+    UploadError,
+    UploadTooLarge,
+    receive_image,
+    ready_derivatives,
+    check_image,
+    public_url,
+)
+from backend.services.image_jobs import enqueue_route_photo, latest_route_job
+from backend.services.locations import record_route_location, prune_location
+from backend.services.search import index_object, remove_object
+from backend.models.image_job import ImageJobStatus
 from backend.models.user import User
 from backend.models.route import Route, RouteType
 
@@ -41,6 +56,25 @@ class RouteResponse(BaseModel):
         from_attributes = True
 
 
+class RouteSummaryResponse(BaseModel):
+    """Vue liste des grandes voies (sans commentaires)"""
+    id: int
+    goal_category_id: int | None
+    name: str
+    location: str
+    grade: str
+    type: str
+    length_m: int | None
+    pitch_count: int | None
+    date_completed: date_type | None
+    style: str | None
+    rating: int | None
+    validated_for_de: int | None
+    
+    class Config:
+        from_attributes = True
+
+
 class CreateRouteRequest(BaseModel):
     goal_category_id: int | None = None
     name: str
@@ -73,6 +107,53 @@ class UpdateRouteRequest(BaseModel):
     validated_for_de: bool | None = None
 
 
+class PhotoUploadResponse(BaseModel):
+    """Suivi du traitement d'une photo (file image_jobs)"""
+    route_id: int
+    job_id: int | None
+    status: str  # pending, running, done, failed, none
+    photo_url: str | None  # Photo actuelle (mise à jour quand les dérivés sont prêts)
+    error: str | None = None
+
+
+# Documentation OpenAPI de l'upload (le corps est lu en streaming, hors FastAPI)
+PHOTO_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                }
+            }
+        },
+    }
+}
+
+
+# === REQUÊTES ===
+
+def _query_routes(
+    db: Session,
+    schema: type[BaseModel],
+    user_id: int,
+    route_type: RouteType | None,
+    validated_only: bool
+):
+    """Requête par colonnes sur les grandes voies, limitée aux champs du schéma"""
+    query = db.query(*response_columns(Route, schema)).filter(Route.user_id == user_id)
+    
+    if route_type:
+        query = query.filter(Route.type == route_type)
+    
+    if validated_only:
+        query = query.filter(Route.validated_for_de == True)
+    
+    return query.order_by(Route.date_completed.desc())
+
+
 # === ROUTES ===
 
 @router.get("", response_model=list[RouteResponse])
@@ -87,16 +168,26 @@ def list_routes(
     """
     Liste les grandes voies de l'utilisateur
     """
-    query = db.query(Route).filter(Route.user_id == current_user.id)
-    
-    if route_type:
-        query = query.filter(Route.type == route_type)
-    
-    if validated_only:
-        query = query.filter(Route.validated_for_de == True)
-    
-    routes = query.order_by(Route.date_completed.desc()).offset(skip).limit(limit).all()
-    return routes
+    query = _query_routes(db, RouteResponse, current_user.id, route_type, validated_only)
+    rows = query.offset(skip).limit(limit).all()
+    return rows_response(rows)
+
+
+@router.get("/summary", response_model=list[RouteSummaryResponse])
+def list_routes_summary(
+    route_type: RouteType | None = None,
+    validated_only: bool = False,
+    skip: int = 0,
+    limit: int = 100,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Liste allégée des grandes voies (sans commentaires)
+    """
+    query = _query_routes(db, RouteSummaryResponse, current_user.id, route_type, validated_only)
+    rows = query.offset(skip).limit(limit).all()
+    return rows_response(rows)
 
 
 @router.get("/{route_id}", response_model=RouteResponse)
@@ -151,6 +242,10 @@ def create_route(
     )
     
     db.add(route)
+    db.flush()  # Pour obtenir l'ID
+    record_route_location(db, route)
+    index_object(db, route)
+    
     db.commit()
     db.refresh(route)
     
@@ -178,6 +273,10 @@ def update_route(
             detail="Route not found"
         )
     
+    # Retirer l'ancien lieu (lieu, longueur ou date peuvent changer)
+    record_route_location(db, route, sign=-1, prune=False)
+    previous_location = route.location
+    
     # Mettre à jour les champs fournis
     if data.goal_category_id is not None:
         route.goal_category_id = data.goal_category_id
@@ -207,6 +306,9 @@ def update_route(
         route.validated_for_de = data.validated_for_de
     
     route.updated_at = datetime.utcnow()
+    record_route_location(db, route)
+    prune_location(db, current_user.id, previous_location)
+    index_object(db, route)
     
     db.commit()
     db.refresh(route)
@@ -214,6 +316,98 @@ def update_route(
     return route
 
 
+@router.post(
+    "/{route_id}/photo",
+    response_model=PhotoUploadResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra=PHOTO_UPLOAD_OPENAPI
+)
+async def upload_route_photo(
+    route_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Upload de la photo d'une grande voie (multipart, champ "file")
+    Lecture en streaming avec limite de taille, stockage par empreinte.
+    Les dérivés WebP sont générés par le worker (run_worker.py) : photo_url
+    est mis à jour quand ils sont prêts (suivi via GET /{route_id}/photo).
+    """
+    def get_owned_route():
+        return db.query(Route).filter(
+            Route.id == route_id,
+            Route.user_id == current_user.id
+        ).first()
+    
+    route = await run_in_threadpool(get_owned_route)
+    if not route:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Route not found"
+        )
+    
+    try:
+        image = await receive_image(request, current_user.id)
+        derivatives = ready_derivatives(image.path) if image.deduplicated else None
+        if derivatives is None:
+            await run_in_threadpool(check_image, image)
+    except UploadTooLarge as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+    except UploadError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    def save_upload():
+        if derivatives is not None:
+            # Doublon déjà traité : rien à mettre en file
+            route.photo_url = public_url(Path(derivatives["medium"]))
+            route.updated_at = datetime.utcnow()
+            db.commit()
+            return {"route_id": route.id, "job_id": None, "status": "done", "photo_url": route.photo_url}
+        
+        job = enqueue_route_photo(db, route, image)
+        db.commit()
+        return {"route_id": route.id, "job_id": job.id, "status": job.status, "photo_url": route.photo_url}
+    
+    return await run_in_threadpool(save_upload)
+
+
+@router.get("/{route_id}/photo", response_model=PhotoUploadResponse)
+def get_route_photo_status(
+    route_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    État du traitement de la dernière photo envoyée pour une voie
+    """
+    route = db.query(Route).filter(
+        Route.id == route_id,
+        Route.user_id == current_user.id
+    ).first()
+    
+    if not route:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Route not found"
+        )
+    
+    job = latest_route_job(db, route.id)
+    return {
+        "route_id": route.id,
+        "job_id": job.id if job else None,
+        "status": job.status if job else ("done" if route.photo_url else "none"),
+        "photo_url": route.photo_url,
+        "error": job.last_error if job and job.status == ImageJobStatus.FAILED.value else None
+    }
+
+
 @router.delete("/{route_id}")
 def delete_route(
     route_id: int,
@@ -234,6 +428,8 @@ def delete_route(
             detail="Route not found"
         )
     
+    record_route_location(db, route, sign=-1)
+    remove_object(db, route)
     db.delete(route)
     db.commit()
     
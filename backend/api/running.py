@@ -5,14 +5,25 @@ CRUD sur les running sessions
 
 from datetime import datetime
 from datetime import date as date_type
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
+from backend.config import settings
 from backend.database import get_db
 from backend.dependencies import get_current_user
+from backend.responses import response_columns, rows_response
+from backend.services.training_load import record_running_session
+from backend.services.week_summary import record_running_week
+from backend.services.running_analytics import invalidate_running_analytics
+from backend.services.locations import record_running_location, prune_location
+from backend.services.search import index_object, remove_object
+from backend.services.images import UploadError, UploadTooLarge
+from backend.services.tracks import receive_track, build_track, apply_track_summary, track_polyline
 from backend.models.user import User
 from backend.models.running_session import RunningSession
+from backend.models.running_track import RunningTrack
 
 router = APIRouter()
 
@@ -39,6 +50,23 @@ class RunningSessionResponse(BaseModel):
         from_attributes = True
 
 
+class RunningSessionSummaryResponse(BaseModel):
+    """Vue liste des séances de course (sans commentaires)"""
+    id: int
+    date: date_type
+    duration_min: int | None
+    distance_km: float | None
+    elevation_gain_m: int | None
+    average_pace_min_km: float | None
+    average_heart_rate: int | None
+    session_type: str | None
+    location: str | None
+    rpe: int | None
+    
+    class Config:
+        from_attributes = True
+
+
 class CreateRunningSessionRequest(BaseModel):
     date: date_type
     duration_min: int | None = None
@@ -67,6 +95,77 @@ class UpdateRunningSessionRequest(BaseModel):
     rpe: int | None = None
 
 
+class TrackSummaryResponse(BaseModel):
+    """Trace GPS d'une sortie (résumé dérivé des points)"""
+    session_id: int
+    source_format: str
+    point_count: int
+    has_elevation: bool
+    has_time: bool
+    has_heart_rate: bool
+    started_at: datetime | None
+    duration_s: int | None
+    distance_m: int
+    elevation_gain_m: int | None
+    average_heart_rate: int | None
+    max_heart_rate: int | None
+    
+    class Config:
+        from_attributes = True
+
+
+class TrackPolylineResponse(BaseModel):
+    """Polyligne simplifiée pour la carte ([lat, lon] par point)"""
+    session_id: int
+    source_format: str
+    point_count: int
+    returned_points: int
+    tolerance_m: float
+    bounds: list[list[float]]
+    points: list[list[float]]
+    elevation_m: list[float] | None
+
+
+# Documentation OpenAPI de l'upload (le corps est lu en streaming, hors FastAPI)
+TRACK_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary", "description": "GPX ou TCX"}},
+                }
+            }
+        },
+    }
+}
+
+
+# === REQUÊTES ===
+
+def _query_running_sessions(
+    db: Session,
+    schema: type[BaseModel],
+    user_id: int,
+    date_from: date_type | None,
+    date_to: date_type | None
+):
+    """Requête par colonnes sur les séances de course, limitée aux champs du schéma"""
+    query = db.query(*response_columns(RunningSession, schema)).filter(
+        RunningSession.user_id == user_id
+    )
+    
+    if date_from:
+        query = query.filter(RunningSession.date >= date_from)
+    
+    if date_to:
+        query = query.filter(RunningSession.date <= date_to)
+    
+    return query.order_by(RunningSession.date.desc())
+
+
 # === ROUTES ===
 
 @router.get("", response_model=list[RunningSessionResponse])
@@ -81,16 +180,28 @@ def list_running_sessions(
     """
     Liste les séances de course
     """
-    query = db.query(RunningSession).filter(RunningSession.user_id == current_user.id)
-    
-    if date_from:
-        query = query.filter(RunningSession.date >= date_from)
-    
-    if date_to:
-        query = query.filter(RunningSession.date <= date_to)
-    
-    sessions = query.order_by(RunningSession.date.desc()).offset(skip).limit(limit).all()
-    return sessions
+    query = _query_running_sessions(db, RunningSessionResponse, current_user.id, date_from, date_to)
+    rows = query.offset(skip).limit(limit).all()
+    return rows_response(rows)
+
+
+@router.get("/summary", response_model=list[RunningSessionSummaryResponse])
+def list_running_sessions_summary(
+    date_from: date_type | None = None,
+    date_to: date_type | None = None,
+    skip: int = 0,
+    limit: int = 100,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Liste allégée des séances de course (sans commentaires)
+    """
+    query = _query_running_sessions(
+        db, RunningSessionSummaryResponse, current_user.id, date_from, date_to
+    )
+    rows = query.offset(skip).limit(limit).all()
+    return rows_response(rows)
 
 
 @router.get("/{session_id}", response_model=RunningSessionResponse)
@@ -143,6 +254,13 @@ def create_running_session(
     )
     
     db.add(session)
+    db.flush()  # Pour obtenir l'ID
+    
+    record_running_session(db, session)
+    record_running_week(db, session)
+    record_running_location(db, session)
+    index_object(db, session)
+    invalidate_running_analytics(db, current_user.id)
     db.commit()
     db.refresh(session)
     
@@ -170,6 +288,12 @@ def update_running_session(
             detail="Running session not found"
         )
     
+    # Retirer l'ancienne charge et l'ancien lieu (date, RPE, FC, durée ou lieu peuvent changer)
+    record_running_session(db, session, sign=-1)
+    record_running_week(db, session, sign=-1)
+    record_running_location(db, session, sign=-1, prune=False)
+    previous_location = session.location
+    
     # Mettre à jour les champs fournis
     if data.date is not None:
         session.date = data.date
@@ -195,6 +319,12 @@ def update_running_session(
         session.rpe = data.rpe
     
     session.updated_at = datetime.utcnow()
+    record_running_session(db, session)
+    record_running_week(db, session)
+    record_running_location(db, session)
+    prune_location(db, current_user.id, previous_location)
+    index_object(db, session)
+    invalidate_running_analytics(db, current_user.id)
     
     db.commit()
     db.refresh(session)
@@ -222,7 +352,134 @@ def delete_running_session(
             detail="Running session not found"
         )
     
+    record_running_session(db, session, sign=-1)
+    record_running_week(db, session, sign=-1)
+    record_running_location(db, session, sign=-1)
+    remove_object(db, session)
+    invalidate_running_analytics(db, current_user.id)
     db.delete(session)
     db.commit()
     
-    return {"message": "Running session deleted successfully"}
\ No newline at end of file
+    return {"message": "Running session deleted successfully"}
+
+
+# === ROUTES - TRACE GPS ===
+
+def _get_owned_session(db: Session, session_id: int, user_id: int) -> RunningSession:
+    """Sortie de l'utilisateur ou 404"""
+    session = db.query(RunningSession).filter(
+        RunningSession.id == session_id,
+        RunningSession.user_id == user_id
+    ).first()
+    
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Running session not found"
+        )
+    return session
+
+
+@router.post(
+    "/{session_id}/track",
+    response_model=TrackSummaryResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=TRACK_UPLOAD_OPENAPI
+)
+async def upload_running_track(
+    session_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Upload de la trace GPS d'une sortie (multipart, champ "file", GPX ou TCX)
+    Lecture en streaming ; remplace la trace existante. Distance, durée,
+    allure, dénivelé et FC de la sortie sont recalculés depuis les points.
+    """
+    await run_in_threadpool(_get_owned_session, db, session_id, current_user.id)
+    
+    try:
+        parsed = await receive_track(request)
+    except UploadTooLarge as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+    except UploadError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    def save_track():
+        session = _get_owned_session(db, session_id, current_user.id)
+        
+        # Retirer l'ancienne charge (durée, distance, FC vont changer)
+        record_running_session(db, session, sign=-1)
+        record_running_week(db, session, sign=-1)
+        
+        track = build_track(session, parsed, session.track)
+        session.track = track
+        apply_track_summary(session, track)
+        
+        record_running_session(db, session)
+        record_running_week(db, session)
+        index_object(db, session)
+        invalidate_running_analytics(db, current_user.id)
+        
+        db.commit()
+        db.refresh(track)
+        return track
+    
+    return await run_in_threadpool(save_track)
+
+
+@router.get("/{session_id}/track", response_model=TrackPolylineResponse)
+def get_running_track(
+    session_id: int,
+    tolerance_m: float = Query(settings.TRACK_POLYLINE_TOLERANCE_M, gt=0, le=1000),
+    max_points: int = Query(settings.TRACK_POLYLINE_MAX_POINTS, ge=2, le=10000),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Trace d'une sortie pour la carte : polyligne simplifiée (Douglas-Peucker)
+    La tolérance est augmentée si besoin pour ne pas dépasser max_points
+    """
+    track = db.query(RunningTrack).filter(
+        RunningTrack.session_id == session_id,
+        RunningTrack.user_id == current_user.id
+    ).first()
+    
+    if not track:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Track not found"
+        )
+    
+    return track_polyline(track, tolerance_m, max_points)
+
+
+@router.delete("/{session_id}/track")
+def delete_running_track(
+    session_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Supprime la trace d'une sortie (le résumé de la sortie est conservé)
+    """
+    deleted = db.query(RunningTrack).filter(
+        RunningTrack.session_id == session_id,
+        RunningTrack.user_id == current_user.id
+    ).delete(synchronize_session=False)
+    
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Track not found"
+        )
+    
+    db.commit()
+    return {"message": "Track deleted successfully"}
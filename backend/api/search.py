@@ -0,0 +1,51 @@
+"""
+Route de recherche plein texte
+Séances, grandes voies et sorties course
+"""
+
+from datetime import date as date_type
+from typing import Literal
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from pydantic import BaseModel
+
+from backend.database import get_db
+from backend.dependencies import get_current_user
+from backend.models.user import User
+from backend.services.search import search
+
+router = APIRouter()
+
+
+# === SCHEMAS ===
+
+class SearchResult(BaseModel):
+    kind: str  # training, route, running
+    id: int
+    date: date_type | None
+    title: str
+    snippet: str
+    score: float
+
+
+class SearchResponse(BaseModel):
+    items: list[SearchResult]
+    has_more: bool
+
+
+# === ROUTES ===
+
+@router.get("", response_model=SearchResponse)
+def search_documents(
+    q: str = Query(..., min_length=1, max_length=200),
+    kind: Literal["training", "route", "running"] | None = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Recherche dans mes séances, grandes voies et sorties course
+    (noms, lieux, notes, commentaires), résultats classés par pertinence
+    """
+    return search(db, current_user.id, q, kind=kind, skip=skip, limit=limit)
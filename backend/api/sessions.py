@@ -11,6 +11,12 @@ from pydantic import BaseModel
 
 from backend.database import get_db
 from backend.dependencies import get_current_user
+from backend.responses import response_columns, rows_response
+from backend.services.climbs import replace_session_climbs
+from backend.services.training_load import record_training_session
+from backend.services.week_summary import record_training_week
+from backend.services.locations import record_training_location, prune_location
+from backend.services.search import index_object, remove_object
 from backend.models.user import User
 from backend.models.session_template import SessionTemplate, SessionType
 from backend.models.planning import Planning, ActivityType, TimeSlot
@@ -71,6 +77,20 @@ class PlanningResponse(BaseModel):
         from_attributes = True
 
 
+class PlanningSummaryResponse(BaseModel):
+    """Vue liste du planning (sans description ni notes)"""
+    id: int
+    date: date_type
+    time_slot: str
+    activity_type: str
+    activity_id: int | None
+    title: str | None
+    completed: bool
+    
+    class Config:
+        from_attributes = True
+
+
 class CreatePlanningRequest(BaseModel):
     date: date_type
     time_slot: TimeSlot
@@ -113,6 +133,22 @@ class TrainingSessionResponse(BaseModel):
         from_attributes = True
 
 
+class TrainingSessionSummaryResponse(BaseModel):
+    """Vue liste des séances (sans routes_json ni notes)"""
+    id: int
+    date: date_type
+    duration_min: int | None
+    session_type: str | None
+    location: str | None
+    best_grade: str | None
+    best_style: str | None
+    rpe: int | None
+    fatigue: int | None
+    
+    class Config:
+        from_attributes = True
+
+
 class CreateTrainingSessionRequest(BaseModel):
     planning_id: int | None = None
     date: date_type
@@ -127,6 +163,20 @@ class CreateTrainingSessionRequest(BaseModel):
     notes: str | None = None
 
 
+class UpdateTrainingSessionRequest(BaseModel):
+    planning_id: int | None = None
+    date: date_type | None = None
+    duration_min: int | None = None
+    session_type: str | None = None
+    location: str | None = None
+    routes_json: str | None = None
+    best_grade: str | None = None
+    best_style: ClimbingStyle | None = None
+    rpe: int | None = None
+    fatigue: int | None = None
+    notes: str | None = None
+
+
 # === ROUTES - SESSION TEMPLATES ===
 
 @router.get("/templates", response_model=list[SessionTemplateResponse])
@@ -196,6 +246,25 @@ def delete_session_template(
 
 # === ROUTES - PLANNING ===
 
+def _query_planning(
+    db: Session,
+    schema: type[BaseModel],
+    user_id: int,
+    date_from: date_type | None,
+    date_to: date_type | None
+):
+    """Requête par colonnes sur le planning, limitée aux champs du schéma"""
+    query = db.query(*response_columns(Planning, schema)).filter(Planning.user_id == user_id)
+    
+    if date_from:
+        query = query.filter(Planning.date >= date_from)
+    
+    if date_to:
+        query = query.filter(Planning.date <= date_to)
+    
+    return query.order_by(Planning.date)
+
+
 @router.get("/planning", response_model=list[PlanningResponse])
 def list_planning(
     date_from: date_type | None = None,
@@ -206,16 +275,24 @@ def list_planning(
     db: Session = Depends(get_db)
 ):
     """Liste les activités planifiées"""
-    query = db.query(Planning).filter(Planning.user_id == current_user.id)
-    
-    if date_from:
-        query = query.filter(Planning.date >= date_from)
-    
-    if date_to:
-        query = query.filter(Planning.date <= date_to)
-    
-    planning = query.order_by(Planning.date).offset(skip).limit(limit).all()
-    return planning
+    query = _query_planning(db, PlanningResponse, current_user.id, date_from, date_to)
+    rows = query.offset(skip).limit(limit).all()
+    return rows_response(rows)
+
+
+@router.get("/planning/summary", response_model=list[PlanningSummaryResponse])
+def list_planning_summary(
+    date_from: date_type | None = None,
+    date_to: date_type | None = None,
+    skip: int = 0,
+    limit: int = 100,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Liste allégée du planning (calendrier) : ne charge pas les colonnes texte"""
+    query = _query_planning(db, PlanningSummaryResponse, current_user.id, date_from, date_to)
+    rows = query.offset(skip).limit(limit).all()
+    return rows_response(rows)
 
 
 @router.post("/planning", response_model=PlanningResponse, status_code=status.HTTP_201_CREATED)
@@ -318,6 +395,27 @@ def delete_planning(
 
 # === ROUTES - TRAINING SESSIONS ===
 
+def _query_training_sessions(
+    db: Session,
+    schema: type[BaseModel],
+    user_id: int,
+    date_from: date_type | None,
+    date_to: date_type | None
+):
+    """Requête par colonnes sur les séances, limitée aux champs du schéma"""
+    query = db.query(*response_columns(TrainingSession, schema)).filter(
+        TrainingSession.user_id == user_id
+    )
+    
+    if date_from:
+        query = query.filter(TrainingSession.date >= date_from)
+    
+    if date_to:
+        query = query.filter(TrainingSession.date <= date_to)
+    
+    return query.order_by(TrainingSession.date.desc())
+
+
 @router.get("/training", response_model=list[TrainingSessionResponse])
 def list_training_sessions(
     date_from: date_type | None = None,
@@ -328,16 +426,26 @@ def list_training_sessions(
     db: Session = Depends(get_db)
 ):
     """Liste les séances d'entraînement réalisées"""
-    query = db.query(TrainingSession).filter(TrainingSession.user_id == current_user.id)
-    
-    if date_from:
-        query = query.filter(TrainingSession.date >= date_from)
-    
-    if date_to:
-        query = query.filter(TrainingSession.date <= date_to)
-    
-    sessions = query.order_by(TrainingSession.date.desc()).offset(skip).limit(limit).all()
-    return sessions
+    query = _query_training_sessions(db, TrainingSessionResponse, current_user.id, date_from, date_to)
+    rows = query.offset(skip).limit(limit).all()
+    return rows_response(rows)
+
+
+@router.get("/training/summary", response_model=list[TrainingSessionSummaryResponse])
+def list_training_sessions_summary(
+    date_from: date_type | None = None,
+    date_to: date_type | None = None,
+    skip: int = 0,
+    limit: int = 100,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Liste allégée des séances : ne charge ni routes_json ni notes"""
+    query = _query_training_sessions(
+        db, TrainingSessionSummaryResponse, current_user.id, date_from, date_to
+    )
+    rows = query.offset(skip).limit(limit).all()
+    return rows_response(rows)
 
 
 @router.post("/training", response_model=TrainingSessionResponse, status_code=status.HTTP_201_CREATED)
@@ -365,6 +473,81 @@ def create_training_session(
     )
     
     db.add(session)
+    db.flush()  # Pour obtenir l'ID
+    
+    # Voies détaillées (table session_climbs), charge journalière et hebdomadaire, recherche
+    replace_session_climbs(db, session)
+    record_training_session(db, session)
+    record_training_week(db, session)
+    record_training_location(db, session)
+    index_object(db, session)
+    
+    db.commit()
+    db.refresh(session)
+    
+    return session
+
+
+@router.put("/training/{session_id}", response_model=TrainingSessionResponse)
+def update_training_session(
+    session_id: int,
+    data: UpdateTrainingSessionRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Met à jour une séance d'entraînement"""
+    session = db.query(TrainingSession).filter(
+        TrainingSession.id == session_id,
+        TrainingSession.user_id == current_user.id
+    ).first()
+    
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Training session not found"
+        )
+    
+    # Retirer l'ancienne charge et l'ancien lieu (date, RPE, durée ou lieu peuvent changer)
+    record_training_session(db, session, sign=-1)
+    record_training_week(db, session, sign=-1)
+    record_training_location(db, session, sign=-1, prune=False)
+    previous_location = session.location
+    
+    # Mettre à jour les champs fournis
+    if data.planning_id is not None:
+        session.planning_id = data.planning_id
+    if data.date is not None:
+        session.date = data.date
+    if data.duration_min is not None:
+        session.duration_min = data.duration_min
+    if data.session_type is not None:
+        session.session_type = data.session_type
+    if data.location is not None:
+        session.location = data.location
+    if data.routes_json is not None:
+        session.routes_json = data.routes_json
+    if data.best_grade is not None:
+        session.best_grade = data.best_grade
+    if data.best_style is not None:
+        session.best_style = data.best_style
+    if data.rpe is not None:
+        session.rpe = data.rpe
+    if data.fatigue is not None:
+        session.fatigue = data.fatigue
+    if data.notes is not None:
+        session.notes = data.notes
+    
+    session.updated_at = datetime.utcnow()
+    
+    # Les voies dépendent de routes_json et de la date (dénormalisée)
+    if data.routes_json is not None or data.date is not None:
+        replace_session_climbs(db, session)
+    record_training_session(db, session)
+    record_training_week(db, session)
+    record_training_location(db, session)
+    prune_location(db, current_user.id, previous_location)
+    index_object(db, session)
+    
     db.commit()
     db.refresh(session)
     
@@ -389,6 +572,10 @@ def delete_training_session(
             detail="Training session not found"
         )
     
+    record_training_session(db, session, sign=-1)
+    record_training_week(db, session, sign=-1)
+    record_training_location(db, session, sign=-1)
+    remove_object(db, session)
     db.delete(session)
     db.commit()
     
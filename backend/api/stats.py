@@ -5,18 +5,25 @@ Dashboard, progression, analytics
 
 from datetime import datetime, timedelta
 from datetime import date as date_type
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, case, extract
 from pydantic import BaseModel
 
 from backend.database import get_db
 from backend.dependencies import get_current_user
 from backend.models.user import User
-from backend.models.training_session import TrainingSession
+from backend.models.session_climb import SessionClimb
 from backend.models.running_session import RunningSession
 from backend.models.route import Route
 from backend.models.goal_category import GoalCategory
+from backend.models.user_week_summary import UserWeekSummary
+from backend.services.climbs import SEND_STYLES
+from backend.services.grades import rank_to_grade
+from backend.services.progression import load_climb_arrays, compute_progression
+from backend.services import running_analytics
+from backend.services.training_load import compute_load_series
+from backend.services.week_summary import week_start_of, weekly_summaries, monthly_summaries
 
 router = APIRouter()
 
@@ -40,6 +47,150 @@ class MonthlyVolume(BaseModel):
     total_elevation_m: int
 
 
+class WeeklySummary(BaseModel):
+    week_start: date_type
+    iso_year: int
+    iso_week: int
+    training_sessions: int
+    training_minutes: int
+    climbs: int
+    sends: int
+    best_grade: str | None
+    running_sessions: int
+    running_minutes: int
+    distance_km: float
+    elevation_gain_m: int
+    load: int
+
+
+class GradePyramidLevel(BaseModel):
+    grade: str
+    grade_rank: int
+    climbs: int
+    sends: int
+    tries: int
+
+
+class ClimbingVolume(BaseModel):
+    month: str
+    sessions: int
+    climbs: int
+    sends: int
+    tries: int
+    max_grade: str | None
+
+
+class ProgressionPyramidLevel(BaseModel):
+    grade: str
+    grade_rank: int
+    climbs: int
+    sends: int
+    onsight: int
+    flash: int
+    redpoint: int
+    project: int
+
+
+class ProgressionRatios(BaseModel):
+    climbs: int
+    sends: int
+    onsight: float
+    flash: float
+    redpoint: float
+    send: float
+
+
+class ProgressionWeek(BaseModel):
+    week_start: date_type
+    climbs: int
+    sends: int
+    max_grade: str | None
+    rolling_max_grade: str | None
+    best_grade_to_date: str | None
+
+
+class ProgressionResponse(BaseModel):
+    pyramid: list[ProgressionPyramidLevel]
+    ratios: ProgressionRatios
+    weekly: list[ProgressionWeek]
+
+
+class TrainingLoadDay(BaseModel):
+    date: date_type
+    climbing_load: int
+    running_load: int
+    load: int
+    acute_load: float
+    chronic_load: float
+    acwr: float | None
+    monotony: float | None
+    strain: float | None
+
+
+class RunningRecordDetail(BaseModel):
+    session_id: int
+    date: date_type
+    time_min: float
+    pace_min_km: float
+    actual_distance_km: float | None
+    attempts: int
+
+
+class RunningRecord(BaseModel):
+    distance: str
+    distance_km: float
+    record: RunningRecordDetail | None
+
+
+class WeeklyMileage(BaseModel):
+    week_start: date_type
+    runs: int
+    distance_km: float
+    elevation_gain_m: int
+    rolling_km: float
+    change_pct: float | None
+
+
+class HeartRateZone(BaseModel):
+    zone: str
+    min_bpm: int
+    max_bpm: int | None
+    sessions: int
+    minutes: int
+    percentage: float
+
+
+class HeartRateZones(BaseModel):
+    hr_max: int | None
+    sessions: int
+    zones: list[HeartRateZone]
+
+
+class AdjustedPaceRun(BaseModel):
+    session_id: int
+    date: date_type
+    pace_min_km: float
+    adjusted_pace_min_km: float
+    distance_km: float | None
+    elevation_gain_m: int
+
+
+class PaceSummary(BaseModel):
+    sessions: int
+    average_pace_min_km: float | None
+    adjusted_pace_min_km: float | None
+    best_adjusted: AdjustedPaceRun | None
+
+
+class RunningAnalyticsResponse(BaseModel):
+    runs: int
+    total_distance_km: float
+    records: list[RunningRecord]
+    weekly: list[WeeklyMileage]
+    heart_rate_zones: HeartRateZones
+    pace: PaceSummary
+
+
 # === ROUTES ===
 
 @router.get("/dashboard", response_model=DashboardStats)
@@ -50,35 +201,24 @@ def get_dashboard_stats(
     """
     Récupère les statistiques du dashboard
     """
-    # Total séances d'entraînement
-    total_training = db.query(func.count(TrainingSession.id)).filter(
-        TrainingSession.user_id == current_user.id
-    ).scalar()
-    
-    # Total séances course
-    total_running = db.query(func.count(RunningSession.id)).filter(
-        RunningSession.user_id == current_user.id
-    ).scalar()
+    # Totaux, semaine et mois en cours : lignes user_week_summary (quelques dizaines par an)
+    today = date_type.today()
+    start_of_week = week_start_of(today)
+    first_day_month = today.replace(day=1)
+    total_training, total_running, current_month, current_week = db.query(
+        func.sum(UserWeekSummary.training_sessions),
+        func.sum(UserWeekSummary.running_sessions),
+        func.sum(case((UserWeekSummary.month_start == first_day_month, UserWeekSummary.training_sessions), else_=0)),
+        func.sum(case((UserWeekSummary.week_start == start_of_week, UserWeekSummary.training_sessions), else_=0)),
+    ).filter(
+        UserWeekSummary.user_id == current_user.id
+    ).one()
     
     # Total grandes voies
     total_routes = db.query(func.count(Route.id)).filter(
         Route.user_id == current_user.id
     ).scalar()
     
-    # Séances du mois en cours
-    first_day_month = date_type.today().replace(day=1)
-    current_month = db.query(func.count(TrainingSession.id)).filter(
-        TrainingSession.user_id == current_user.id,
-        TrainingSession.date >= first_day_month
-    ).scalar()
-    
-    # Séances de la semaine en cours
-    start_of_week = date_type.today() - timedelta(days=date_type.today().weekday())
-    current_week = db.query(func.count(TrainingSession.id)).filter(
-        TrainingSession.user_id == current_user.id,
-        TrainingSession.date >= start_of_week
-    ).scalar()
-    
     # Progression objectifs
     goal_categories = db.query(GoalCategory).filter(
         GoalCategory.user_id == current_user.id
@@ -103,60 +243,196 @@ def get_dashboard_stats(
 
 @router.get("/monthly-volume", response_model=list[MonthlyVolume])
 def get_monthly_volume(
-    months: int = 12,
+    months: int = Query(12, ge=1, le=120),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Récupère le volume mensuel d'entraînement
+    Mois entiers depuis le mois d'il y a 30 x months jours (lignes user_week_summary)
     """
-    # Calculer la date de début
     start_date = date_type.today() - timedelta(days=30 * months)
+    rows = monthly_summaries(db, current_user.id, start_date)
     
-    # Récupérer toutes les séances depuis cette date
-    training_sessions = db.query(TrainingSession).filter(
-        TrainingSession.user_id == current_user.id,
-        TrainingSession.date >= start_date
-    ).all()
+    return [
+        {
+            "month": row.month_start.strftime("%B %Y"),
+            "training_sessions": row.training_sessions,
+            "running_sessions": row.running_sessions,
+            "total_distance_km": round(row.distance_m / 1000, 2),
+            "total_elevation_m": row.elevation_gain_m
+        }
+        for row in rows
+        if row.training_sessions or row.running_sessions
+    ]
+
+
+@router.get("/weekly", response_model=list[WeeklySummary])
+def get_weekly_summary(
+    weeks: int = Query(12, ge=1, le=260),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Résumé par semaine ISO : séances, minutes, kilomètres, dénivelé, charge,
+    meilleure cotation (lignes user_week_summary)
+    """
+    since = week_start_of(date_type.today()) - timedelta(weeks=weeks - 1)
+    rows = weekly_summaries(db, current_user.id, since)
     
-    running_sessions = db.query(RunningSession).filter(
-        RunningSession.user_id == current_user.id,
-        RunningSession.date >= start_date
-    ).all()
+    result = []
+    for row in rows:
+        if not (row.training_sessions or row.running_sessions):
+            continue
+        iso_year, iso_week, _ = row.week_start.isocalendar()
+        result.append({
+            "week_start": row.week_start,
+            "iso_year": iso_year,
+            "iso_week": iso_week,
+            "training_sessions": row.training_sessions,
+            "training_minutes": row.training_minutes,
+            "climbs": row.climbs,
+            "sends": row.sends,
+            "best_grade": rank_to_grade(row.best_grade_rank),
+            "running_sessions": row.running_sessions,
+            "running_minutes": row.running_minutes,
+            "distance_km": round(row.distance_m / 1000, 2),
+            "elevation_gain_m": row.elevation_gain_m,
+            "load": row.climbing_load + row.running_load
+        })
+    return result
+
+
+@router.get("/grade-pyramid", response_model=list[GradePyramidLevel])
+def get_grade_pyramid(
+    date_from: date_type | None = None,
+    date_to: date_type | None = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Pyramide des cotations (voies grimpées en séance)
+    Agrégat SQL sur session_climbs (index user_id, grade_rank)
+    """
+    is_send = case((SessionClimb.style.in_(SEND_STYLES), 1), else_=0)
     
-    # Agréger par mois
-    monthly_data = {}
-    
-    for session in training_sessions:
-        month_key = session.date.strftime("%Y-%m")
-        if month_key not in monthly_data:
-            monthly_data[month_key] = {
-                "month": session.date.strftime("%B %Y"),
-                "training_sessions": 0,
-                "running_sessions": 0,
-                "total_distance_km": 0.0,
-                "total_elevation_m": 0
-            }
-        monthly_data[month_key]["training_sessions"] += 1
-    
-    for session in running_sessions:
-        month_key = session.date.strftime("%Y-%m")
-        if month_key not in monthly_data:
-            monthly_data[month_key] = {
-                "month": session.date.strftime("%B %Y"),
-                "training_sessions": 0,
-                "running_sessions": 0,
-                "total_distance_km": 0.0,
-                "total_elevation_m": 0
-            }
-        monthly_data[month_key]["running_sessions"] += 1
-        monthly_data[month_key]["total_distance_km"] += session.distance_km or 0
-        monthly_data[month_key]["total_elevation_m"] += session.elevation_gain_m or 0
+    query = db.query(
+        SessionClimb.grade_rank,
+        func.count(SessionClimb.id),
+        func.sum(is_send),
+        func.sum(SessionClimb.tries)
+    ).filter(
+        SessionClimb.user_id == current_user.id,
+        SessionClimb.grade_rank != None
+    )
     
-    # Convertir en liste triée
-    result = sorted(monthly_data.values(), key=lambda x: x["month"])
+    if date_from:
+        query = query.filter(SessionClimb.date >= date_from)
     
-    return result
+    if date_to:
+        query = query.filter(SessionClimb.date <= date_to)
+    
+    rows = query.group_by(SessionClimb.grade_rank).order_by(SessionClimb.grade_rank.desc()).all()
+    
+    return [
+        {
+            "grade": rank_to_grade(grade_rank),
+            "grade_rank": grade_rank,
+            "climbs": climbs,
+            "sends": sends or 0,
+            "tries": tries or 0
+        }
+        for grade_rank, climbs, sends, tries in rows
+    ]
+
+
+@router.get("/climbing-volume", response_model=list[ClimbingVolume])
+def get_climbing_volume(
+    months: int = Query(12, ge=1, le=120),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Volume de grimpe mensuel (voies, enchaînements, essais, cotation max)
+    Agrégat SQL sur session_climbs (index user_id, date)
+    """
+    start_date = date_type.today() - timedelta(days=30 * months)
+    year = extract("year", SessionClimb.date)
+    month = extract("month", SessionClimb.date)
+    is_send = case((SessionClimb.style.in_(SEND_STYLES), 1), else_=0)
+    
+    rows = db.query(
+        year,
+        month,
+        func.count(func.distinct(SessionClimb.session_id)),
+        func.count(SessionClimb.id),
+        func.sum(is_send),
+        func.sum(SessionClimb.tries),
+        func.max(SessionClimb.grade_rank)
+    ).filter(
+        SessionClimb.user_id == current_user.id,
+        SessionClimb.date >= start_date
+    ).group_by(year, month).order_by(year, month).all()
+    
+    return [
+        {
+            "month": f"{int(y):04d}-{int(m):02d}",
+            "sessions": sessions,
+            "climbs": climbs,
+            "sends": sends or 0,
+            "tries": tries or 0,
+            "max_grade": rank_to_grade(max_rank)
+        }
+        for y, m, sessions, climbs, sends, tries, max_rank in rows
+    ]
+
+
+@router.get("/progression", response_model=ProgressionResponse)
+def get_progression(
+    date_from: date_type | None = None,
+    date_to: date_type | None = None,
+    window_weeks: int = Query(12, ge=1, le=260),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Progression complète (grandes voies + voies de séance)
+    Pyramide, ratios à vue / flash / après travail, série hebdomadaire
+    avec cotation max glissante sur window_weeks semaines
+    """
+    arrays = load_climb_arrays(db, current_user.id, date_from, date_to)
+    return compute_progression(arrays, window_weeks)
+
+
+@router.get("/training-load", response_model=list[TrainingLoadDay])
+def get_training_load(
+    days: int = Query(90, ge=1, le=3650),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Charge d'entraînement journalière (escalade + course)
+    Session-RPE, ACWR (7/28 jours), monotonie et strain
+    Lit les agrégats daily_loads : O(jours), sans relire les séances
+    """
+    date_to = date_type.today()
+    date_from = date_to - timedelta(days=days - 1)
+    return compute_load_series(db, current_user.id, date_from, date_to)
+
+
+@router.get("/running", response_model=RunningAnalyticsResponse)
+def get_running_analytics(
+    weeks: int = Query(12, ge=1, le=520),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Analyse course : records par distance, kilométrage hebdomadaire (weeks
+    dernières semaines), zones cardiaques, allure corrigée du dénivelé
+    Calcul NumPy mis en cache (stats_cache), invalidé à chaque écriture de sortie
+    """
+    analytics = running_analytics.get_running_analytics(db, current_user.id)
+    return {**analytics, "weekly": analytics["weekly"][-weeks:]}
 
 
 @router.get("/progression/{grade}")
@@ -208,6 +484,9 @@ def get_best_performances(
         RunningSession.distance_km != None
     ).order_by(RunningSession.distance_km.desc()).limit(limit).all()
     
+    # Records par distance (analyse course en cache)
+    records = running_analytics.get_running_analytics(db, current_user.id)["records"]
+    
     return {
         "best_routes": [
             {
@@ -226,5 +505,6 @@ def get_best_performances(
                 "duration_min": r.duration_min
             }
             for r in best_runs
-        ]
+        ],
+        "running_records": records
     }
\ No newline at end of file
@@ -4,15 +4,26 @@ Profil, configuration, mise à jour
 """
 
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Iterator, Literal
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, func, literal, union_all, and_, or_
 from sqlalchemy.orm import Session
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
+import orjson
 
-from backend.database import get_db
+from backend.database import get_db, SessionLocal
 from backend.dependencies import get_current_user, require_admin
 from backend.auth import get_password_hash, verify_password, validate_password_strength
-from backend.models.user import User
+from backend.responses import response_columns
+from backend.models.user import User, UserRole
 from backend.models.user_config import UserConfig
+from backend.models.training_session import TrainingSession
+from backend.models.route import Route
+from backend.models.running_session import RunningSession
+from backend.models.program import Program
+from backend.services.refresh_tokens import revoke_user_sessions
+from backend.services.accounts import delete_users, remove_user_files
 
 router = APIRouter()
 
@@ -74,6 +85,146 @@ class UpdateConfigRequest(BaseModel):
     target_date: str | None = None
 
 
+class UserActivityCounts(BaseModel):
+    training_sessions: int = 0
+    routes: int = 0
+    running_sessions: int = 0
+    programs: int = 0
+
+
+class UserDirectoryEntry(BaseModel):
+    """Ligne de l'annuaire admin"""
+    id: int
+    email: str
+    username: str
+    first_name: str | None
+    last_name: str | None
+    role: str
+    is_active: bool
+    is_verified: bool
+    created_at: datetime
+    last_login_at: datetime | None
+
+
+class UserDirectoryItem(UserDirectoryEntry):
+    activity: UserActivityCounts
+
+
+class UserDirectoryResponse(BaseModel):
+    items: list[UserDirectoryItem]
+    next_after_id: int | None  # Curseur de la page suivante (None = dernière page)
+
+
+class PurgeUsersRequest(BaseModel):
+    user_ids: list[int] = Field(default_factory=list, max_length=10000)
+    unverified_before: datetime | None = None  # Comptes jamais vérifiés créés avant cette date
+
+
+class PurgeUsersResponse(BaseModel):
+    deleted: int
+
+
+# === ANNUAIRE (requêtes) ===
+
+# Tables comptées dans l'activité (clé de UserActivityCounts -> modèle)
+ACTIVITY_MODELS = {
+    "training_sessions": TrainingSession,
+    "routes": Route,
+    "running_sessions": RunningSession,
+    "programs": Program,
+}
+
+# Taille des lots de l'export NDJSON
+EXPORT_CHUNK_SIZE = 500
+
+
+def _prefix_filter(column, prefix: str):
+    """
+    Recherche par préfixe sous forme d'intervalle (col >= 'abc' AND col < 'abd')
+    Utilise l'index de la colonne sur SQLite comme MySQL, contrairement à LIKE
+    (sensible à la casse sur SQLite, insensible avec la collation MySQL)
+    """
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return and_(column >= prefix, column < upper)
+
+
+def _directory_filters(
+    q: str | None,
+    role: UserRole | None,
+    is_active: bool | None,
+    is_verified: bool | None
+) -> list:
+    """Filtres de l'annuaire"""
+    filters = []
+    if q:
+        filters.append(or_(_prefix_filter(User.email, q), _prefix_filter(User.username, q)))
+    if role is not None:
+        filters.append(User.role == role)
+    if is_active is not None:
+        filters.append(User.is_active == is_active)
+    if is_verified is not None:
+        filters.append(User.is_verified == is_verified)
+    return filters
+
+
+def _query_directory_page(db: Session, filters: list, after_id: int, limit: int) -> list[dict]:
+    """
+    Une page de l'annuaire (pagination par clé, id croissant) avec l'activité
+    Deux requêtes par page : les utilisateurs, puis tous les comptes en un GROUP BY
+    """
+    rows = db.execute(
+        select(*response_columns(User, UserDirectoryEntry))
+        .where(User.id > after_id, *filters)
+        .order_by(User.id)
+        .limit(limit)
+    ).all()
+
+    items = []
+    for row in rows:
+        item = row._asdict()
+        item["role"] = item["role"].value if isinstance(item["role"], UserRole) else item["role"]
+        item["activity"] = dict.fromkeys(ACTIVITY_MODELS, 0)
+        items.append(item)
+
+    if not items:
+        return items
+
+    user_ids = [item["id"] for item in items]
+    activity = union_all(*[
+        select(model.user_id.label("user_id"), literal(kind).label("kind")).where(model.user_id.in_(user_ids))
+        for kind, model in ACTIVITY_MODELS.items()
+    ]).subquery()
+
+    by_id = {item["id"]: item for item in items}
+    for user_id, kind, count in db.execute(
+        select(activity.c.user_id, activity.c.kind, func.count())
+        .group_by(activity.c.user_id, activity.c.kind)
+    ):
+        by_id[user_id]["activity"][kind] = count
+
+    return items
+
+
+def _export_directory(filters: list) -> Iterator[bytes]:
+    """
+    Export NDJSON de tout l'annuaire, par lots (session dédiée : le flux
+    continue après la fin de la requête)
+    """
+    db = SessionLocal()
+    try:
+        after_id = 0
+        while True:
+            items = _query_directory_page(db, filters, after_id, EXPORT_CHUNK_SIZE)
+            if not items:
+                break
+            yield b"".join(orjson.dumps(item) + b"\n" for item in items)
+            after_id = items[-1]["id"]
+            # Ne pas garder la transaction ouverte entre deux lots
+            db.rollback()
+    finally:
+        db.close()
+
+
 # === ROUTES ===
 
 @router.get("/profile", response_model=UserProfileResponse)
@@ -134,9 +285,10 @@ def change_password(
             detail=error_msg
         )
     
-    # Mettre à jour le mot de passe
+    # Mettre à jour le mot de passe et fermer toutes les sessions
     current_user.password_hash = get_password_hash(data.new_password)
     current_user.updated_at = datetime.utcnow()
+    revoke_user_sessions(db, current_user)
     
     db.commit()
     
@@ -214,21 +366,24 @@ def update_config(
 
 @router.delete("/account")
 def delete_account(
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Supprime le compte de l'utilisateur
+    Une seule instruction DELETE (cascade en base), fichiers supprimés en tâche de fond
     """
-    db.delete(current_user)
-    db.commit()
+    user_id = current_user.id
+    delete_users(db, [user_id])
+    background_tasks.add_task(remove_user_files, [user_id])
     
     return {"message": "Account deleted successfully"}
 
 
 # === ADMIN ROUTES ===
 
-@router.get("/list", dependencies=[Depends(require_admin)])
+@router.get("/list", response_model=list[UserProfileResponse], dependencies=[Depends(require_admin)])
 def list_users(
     skip: int = 0,
     limit: int = 100,
@@ -241,23 +396,84 @@ def list_users(
     return users
 
 
+@router.get("/directory", response_model=UserDirectoryResponse, dependencies=[Depends(require_admin)])
+def user_directory(
+    q: str | None = Query(None, min_length=1, max_length=255, description="Préfixe d'email ou de username"),
+    role: UserRole | None = None,
+    is_active: bool | None = None,
+    is_verified: bool | None = None,
+    after_id: int = Query(0, ge=0, description="Curseur : next_after_id de la page précédente"),
+    limit: int = Query(50, ge=1, le=500),
+    format: Literal["json", "ndjson"] = "json",
+    db: Session = Depends(get_db)
+):
+    """
+    Annuaire des utilisateurs (admin uniquement)
+    Recherche par préfixe indexée, filtres, pagination par clé, activité par utilisateur.
+    format=ndjson : export de tous les résultats en flux (une ligne JSON par utilisateur)
+    """
+    filters = _directory_filters(q, role, is_active, is_verified)
+    
+    if format == "ndjson":
+        return StreamingResponse(_export_directory(filters), media_type="application/x-ndjson")
+    
+    items = _query_directory_page(db, filters, after_id, limit)
+    return {
+        "items": items,
+        "next_after_id": items[-1]["id"] if len(items) == limit else None
+    }
+
+
+@router.post("/purge", response_model=PurgeUsersResponse)
+def purge_users(
+    data: PurgeUsersRequest,
+    background_tasks: BackgroundTasks,
+    current_admin: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    Suppression en masse (admin uniquement)
+    Par liste d'IDs et/ou comptes jamais vérifiés créés avant une date
+    """
+    if not data.user_ids and data.unverified_before is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide user_ids or unverified_before"
+        )
+    
+    user_ids = set(data.user_ids)
+    if data.unverified_before is not None:
+        user_ids.update(db.execute(
+            select(User.id).where(
+                User.is_verified == False,
+                User.created_at < data.unverified_before
+            )
+        ).scalars().all())
+    
+    # Un admin ne se supprime pas lui-même par erreur
+    user_ids.discard(current_admin.id)
+    
+    deleted = delete_users(db, user_ids)
+    background_tasks.add_task(remove_user_files, sorted(user_ids))
+    
+    return {"deleted": deleted}
+
+
 @router.delete("/{user_id}", dependencies=[Depends(require_admin)])
 def delete_user(
     user_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
     Supprime un utilisateur (admin uniquement)
     """
-    user = db.query(User).filter(User.id == user_id).first()
-    
-    if not user:
+    if not delete_users(db, [user_id]):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    db.delete(user)
-    db.commit()
+    background_tasks.add_task(remove_user_files, [user_id])
     
     return {"message": "User deleted successfully"}
\ No newline at end of file
@@ -4,14 +4,18 @@ JWT tokens, hash passwords, vérification
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from backend.config import settings
 
-# Context pour hasher les mots de passe
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@lru_cache(maxsize=None)
+def get_pwd_context() -> CryptContext:
+    """Context pour hasher les mots de passe (créé au premier usage)"""
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -25,7 +29,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True si le mot de passe correspond
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
@@ -38,7 +42,7 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hash du mot de passe
     """
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -104,15 +108,15 @@ def verify_token(token: str) -> Optional[dict]:
         return None
 
 
-def decode_access_token(token: str) -> Optional[str]:
+def decode_access_payload(token: str) -> Optional[dict]:
     """
-    Décode un token d'accès et retourne l'email de l'utilisateur
+    Décode un token d'accès
     
     Args:
         token: Token JWT d'accès
     
     Returns:
-        Email de l'utilisateur si token valide, None sinon
+        Payload (sub = email, ver = version des tokens de l'utilisateur) si valide, None sinon
     """
     payload = verify_token(token)
     if payload is None:
@@ -122,6 +126,23 @@ def decode_access_token(token: str) -> Optional[str]:
     if payload.get("type") == "refresh":
         return None
     
+    return payload
+
+
+def decode_access_token(token: str) -> Optional[str]:
+    """
+    Décode un token d'accès et retourne l'email de l'utilisateur
+    
+    Args:
+        token: Token JWT d'accès
+    
+    Returns:
+        Email de l'utilisateur si token valide, None sinon
+    """
+    payload = decode_access_payload(token)
+    if payload is None:
+        return None
+    
     email: str = payload.get("sub")
     return email
 
@@ -27,12 +27,15 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     ENVIRONMENT: str = "production"
     APP_URL: str = "https://training.climbingthenet.fr"
+    WEB_WORKERS: int = 0  # Workers gunicorn (0 = 2 x CPU + 1)
+    WEB_MAX_REQUESTS: int = 2000  # Recyclage d'un worker après N requêtes (0 = jamais)
     
     # === SÉCURITÉ ===
     SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_HOURS: int = 24
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    REFRESH_REVOCATION_CACHE_SIZE: int = 10000  # jti révoqués gardés en mémoire (LRU)
     
     # === BASE DE DONNÉES ===
     DATABASE_TYPE: str = "sqlite"  # mysql ou sqlite
@@ -64,6 +67,14 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str
     SMTP_FROM_EMAIL: EmailStr = "noreply@climbingthenet.fr"
     SMTP_FROM_NAME: str = "Training Escalade"
+    SMTP_TIMEOUT_SECONDS: int = 10
+    SMTP_IDLE_SECONDS: int = 30  # Connexion SMTP gardée ouverte entre deux lots
+    
+    # === OUTBOX EMAILS (envoi asynchrone) ===
+    EMAIL_OUTBOX_BATCH_SIZE: int = 20
+    EMAIL_OUTBOX_POLL_SECONDS: float = 10.0
+    EMAIL_MAX_ATTEMPTS: int = 6
+    EMAIL_RETRY_SECONDS: int = 60  # Premier délai, doublé à chaque tentative
     
     # === VÉRIFICATION EMAIL ===
     EMAIL_VERIFICATION_REQUIRED: bool = True
@@ -77,6 +88,17 @@ class Settings(BaseSettings):
     MAX_UPLOAD_SIZE_MB: int = 10
     ALLOWED_IMAGE_EXTENSIONS: str = "jpg,jpeg,png,webp"
     
+    # === FILE DE TRAITEMENT DES PHOTOS (run_worker.py) ===
+    IMAGE_JOB_MAX_ATTEMPTS: int = 5
+    IMAGE_JOB_RETRY_SECONDS: int = 30  # Premier délai, doublé à chaque tentative
+    IMAGE_JOB_POLL_SECONDS: float = 2.0
+    IMAGE_JOB_TIMEOUT_MINUTES: int = 10  # Tâche "running" considérée abandonnée
+    
+    # === MÉDIAS (URLs signées) ===
+    MEDIA_URL_EXPIRE_MINUTES: int = 60
+    MEDIA_SENDFILE_HEADER: Optional[str] = None  # X-Accel-Redirect (nginx) ou X-Sendfile (Apache)
+    MEDIA_SENDFILE_PREFIX: str = "/protected-uploads/"  # Location interne nginx
+    
     @property
     def MAX_UPLOAD_SIZE_BYTES(self) -> int:
         """Taille max upload en bytes"""
@@ -87,10 +109,31 @@ class Settings(BaseSettings):
         """Parse les extensions autorisées en liste"""
         return [ext.strip() for ext in self.ALLOWED_IMAGE_EXTENSIONS.split(",")]
     
+    # === TRACES GPS (GPX/TCX des sorties course) ===
+    TRACK_MAX_UPLOAD_MB: int = 25
+    TRACK_MAX_POINTS: int = 100000  # ~28 h à un point par seconde
+    TRACK_POLYLINE_TOLERANCE_M: float = 5.0  # Tolérance Douglas-Peucker par défaut
+    TRACK_POLYLINE_MAX_POINTS: int = 1000  # Plafond de points envoyés à la carte
+    
     # === RATE LIMITING ===
     RATE_LIMIT_ENABLED: bool = True
     RATE_LIMIT_PER_MINUTE: int = 60
     
+    # === CATALOGUE DE PROGRAMMES PUBLICS ===
+    PROGRAM_CATALOG_CACHE_SECONDS: int = 60  # Durée de vie du cache (partagé entre utilisateurs)
+    
+    # === ANALYSE COURSE (stats_cache) ===
+    RUNNING_ANALYTICS_CACHE_SECONDS: int = 86400  # Invalidé à chaque écriture de sortie course
+    
+    # === MAINTENANCE (purge des lignes expirées) ===
+    MAINTENANCE_ENABLED: bool = True
+    MAINTENANCE_INTERVAL_MINUTES: int = 60
+    MAINTENANCE_BATCH_SIZE: int = 500
+    
+    # === SONDES DE SANTÉ (/readyz) ===
+    HEALTH_PROBE_INTERVAL_SECONDS: int = 10  # Sonde de la base en tâche de fond
+    HEALTH_PROBE_STALE_FACTOR: int = 3  # Résultat périmé après N intervalles (non prêt)
+    
     # === BACKUP ===
     BACKUP_ENABLED: bool = True
     BACKUP_RETENTION_DAYS: int = 30
@@ -136,6 +179,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 UPLOAD_DIR_PATH = BASE_DIR / settings.UPLOAD_DIR
 LOG_DIR_PATH = BASE_DIR / "logs"
 BACKUP_DIR_PATH = BASE_DIR / "backups"
+EMAIL_TEMPLATE_DIR_PATH = BASE_DIR / "backend" / "templates" / "emails"
 
 
 def get_upload_path(user_id: int, upload_type: str = "routes") -> Path:
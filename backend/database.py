@@ -1,18 +1,17 @@
 """
 Gestion de la base de données
 Connexion SQLAlchemy + Session management
-"""
-
-import sys
-from pathlib import Path
 
-# Ajouter le dossier parent au path pour les imports
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+Le moteur est créé au premier usage (get_engine) et non à l'import : importer
+l'application reste rapide, et un processus maître qui la pré-charge avant de
+forker n'ouvre aucune connexion.
+"""
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
 from sqlalchemy.pool import StaticPool
-from typing import Generator
+from typing import Generator, Optional
 import logging
 
 from backend.config import settings
@@ -21,17 +20,22 @@ logger = logging.getLogger(__name__)
 
 # === CONFIGURATION ENGINE ===
 
-if settings.DATABASE_TYPE == "mysql":
-    # Configuration MySQL
-    engine = create_engine(
-        settings.DATABASE_URL,
-        pool_pre_ping=True,  # Vérifie la connexion avant utilisation
-        pool_recycle=3600,   # Recycle les connexions après 1h
-        echo=settings.DEBUG,  # Log les requêtes SQL en mode debug
-    )
-    logger.info(f"✅ Connexion MySQL configurée : {settings.DB_NAME}")
-    
-else:
+_engine: Optional[Engine] = None
+
+
+def _create_engine() -> Engine:
+    """Construit le moteur selon DATABASE_TYPE"""
+    if settings.DATABASE_TYPE == "mysql":
+        # Configuration MySQL
+        engine = create_engine(
+            settings.DATABASE_URL,
+            pool_pre_ping=True,  # Vérifie la connexion avant utilisation
+            pool_recycle=3600,   # Recycle les connexions après 1h
+            echo=settings.DEBUG,  # Log les requêtes SQL en mode debug
+        )
+        logger.info(f"✅ Connexion MySQL configurée : {settings.DB_NAME}")
+        return engine
+
     # Configuration SQLite
     engine = create_engine(
         settings.DATABASE_URL,
@@ -41,12 +45,56 @@ else:
     )
     logger.info(f"✅ Connexion SQLite configurée : {settings.SQLITE_PATH}")
 
+    @event.listens_for(engine, "connect")
+    def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+        """Active les clés étrangères SQLite (ON DELETE CASCADE / SET NULL)"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    return engine
+
+
+def get_engine() -> Engine:
+    """Moteur de l'application (créé au premier appel)"""
+    global _engine
+    if _engine is None:
+        _engine = _create_engine()
+        SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+def reset_engine_after_fork():
+    """
+    À appeler dans un processus forké (worker gunicorn)
+    Les connexions éventuellement héritées du parent ne sont ni réutilisées ni
+    fermées (elles appartiennent au parent) : le worker ouvre les siennes.
+    """
+    if _engine is not None:
+        _engine.dispose(close=False)
+
+
+def __getattr__(name: str):
+    # `from backend.database import engine` reste valable : moteur créé à la demande
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # === SESSION FACTORY ===
-SessionLocal = sessionmaker(
+
+class _LazySessionmaker(sessionmaker):
+    """sessionmaker lié au moteur à la création de la première session"""
+
+    def __call__(self, **local_kw) -> Session:
+        if self.kw.get("bind") is None:
+            get_engine()
+        return super().__call__(**local_kw)
+
+
+SessionLocal = _LazySessionmaker(
     autocommit=False,
-    autoflush=False,
-    bind=engine
+    autoflush=False
 )
 
 # === BASE MODEL ===
@@ -84,13 +132,14 @@ def init_db():
         # Import tous les modèles pour que Base les connaisse
         from backend.models import (
             user, user_config, exercise, session_template,
-            planning, training_session, route, goal_category,
-            running_session, program, stats_cache,
-            password_reset, email_verification
+            planning, training_session, session_climb, route, goal_category,
+            running_session, running_track, program, stats_cache, daily_load, image_job,
+            password_reset, email_verification, refresh_token, email_outbox,
+            coach_athlete, search_document, location, user_week_summary
         )
         
         # Créer toutes les tables
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=get_engine())
         logger.info("✅ Tables créées avec succès")
         
     except Exception as e:
@@ -106,7 +155,7 @@ def drop_all_tables():
     if settings.ENVIRONMENT == "production":
         raise Exception("❌ INTERDIT en production !")
     
-    Base.metadata.drop_all(bind=engine)
+    Base.metadata.drop_all(bind=get_engine())
     logger.warning("⚠️ Toutes les tables ont été supprimées")
 
 
@@ -161,6 +210,7 @@ def get_table_counts() -> dict:
         from backend.models.session_template import SessionTemplate
         from backend.models.planning import Planning
         from backend.models.training_session import TrainingSession
+        from backend.models.session_climb import SessionClimb
         from backend.models.route import Route
         from backend.models.goal_category import GoalCategory
         from backend.models.running_session import RunningSession
@@ -173,6 +223,7 @@ def get_table_counts() -> dict:
             "session_templates": db.query(SessionTemplate).count(),
             "planning": db.query(Planning).count(),
             "training_sessions": db.query(TrainingSession).count(),
+            "session_climbs": db.query(SessionClimb).count(),
             "routes": db.query(Route).count(),
             "goal_categories": db.query(GoalCategory).count(),
             "running_sessions": db.query(RunningSession).count(),
@@ -209,14 +260,8 @@ class DatabaseSession:
         self.db.close()
 
 
-# === LOGGING CONFIGURATION ===
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-
-
 # === TEST AU DÉMARRAGE ===
+# python -m backend.database
 if __name__ == "__main__":
     print("🧪 Test de connexion à la base de données...")
     
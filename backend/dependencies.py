@@ -9,7 +9,7 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
 from backend.database import get_db
-from backend.auth import decode_access_token
+from backend.auth import decode_access_payload
 from backend.models.user import User, UserRole
 
 # Schema OAuth2 pour récupérer le token dans le header Authorization
@@ -40,15 +40,19 @@ def get_current_user(
     )
     
     # Décoder le token
-    email = decode_access_token(token)
-    if email is None:
+    payload = decode_access_payload(token)
+    if payload is None or payload.get("sub") is None:
         raise credentials_exception
     
     # Récupérer l'utilisateur
-    user = db.query(User).filter(User.email == email).first()
+    user = db.query(User).filter(User.email == payload["sub"]).first()
     if user is None:
         raise credentials_exception
     
+    # Token émis avant un logout / changement de mot de passe
+    if payload.get("ver", 0) != (user.token_version or 0):
+        raise credentials_exception
+    
     # Vérifier que le compte est actif
     if not user.is_active:
         raise HTTPException(
@@ -192,11 +196,13 @@ def get_optional_user(
         return None
     
     try:
-        email = decode_access_token(token)
-        if email is None:
+        payload = decode_access_payload(token)
+        if payload is None or payload.get("sub") is None:
             return None
         
-        user = db.query(User).filter(User.email == email).first()
-        return user if user and user.is_active else None
+        user = db.query(User).filter(User.email == payload["sub"]).first()
+        if user is None or payload.get("ver", 0) != (user.token_version or 0):
+            return None
+        return user if user.is_active else None
     except:
         return None
\ No newline at end of file
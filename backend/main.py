@@ -5,43 +5,28 @@ Training Escalade - Suivi d'entraînement escalade
 
 from datetime import datetime
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
-from sqlalchemy import text
+from fastapi.responses import JSONResponse, ORJSONResponse
 import logging
 
 from backend.config import settings
-from backend.database import engine, get_db
 from backend.middleware import setup_middlewares
-from backend.api import api_router
+from backend.api import include_routers
 from backend.schemas import HealthCheckResponse
-
-# Configuration du logging
-logging.basicConfig(
-    level=logging.INFO if settings.DEBUG else logging.WARNING,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from backend.services import health, mailer, maintenance
 
 logger = logging.getLogger(__name__)
 
-# Création de l'application FastAPI
-app = FastAPI(
-    title="Training Escalade API",
-    description="API de suivi d'entraînement pour l'escalade et la course",
-    version="1.0.0",
-    docs_url="/docs" if settings.DEBUG else None,  # Swagger UI uniquement en dev
-    redoc_url="/redoc" if settings.DEBUG else None,  # ReDoc uniquement en dev
-)
-
-# Configuration des middlewares
-setup_middlewares(app)
 
-# Inclusion du router principal de l'API
-app.include_router(api_router, prefix="/api")
+def configure_logging():
+    """Configuration du logging (sans effet si déjà configuré, ex. par le serveur)"""
+    logging.basicConfig(
+        level=logging.INFO if settings.DEBUG else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
 
 
 # === ROUTES PRINCIPALES ===
 
-@app.get("/")
 def root():
     """
     Page d'accueil de l'API
@@ -54,30 +39,43 @@ def root():
     }
 
 
-@app.get("/health", response_model=HealthCheckResponse)
 def health_check():
     """
     Vérification de l'état de l'API et de la base de données
+    Dernier résultat de la sonde de fond ; sonde directe si elle ne tourne
+    pas (application utilisée sans lifespan)
     """
-    # Tester la connexion à la base de données
-    try:
-        db = next(get_db())
-        db.execute(text("SELECT 1"))
-        db_status = "ok"
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        db_status = "error"
-    
+    result = health.probe.result if health.probe is not None else health.probe_database()
+
     return {
-        "status": "ok" if db_status == "ok" else "degraded",
-        "database": db_status,
+        "status": "ok" if result.database == "ok" else "degraded",
+        "database": result.database,
         "timestamp": datetime.utcnow()
     }
 
 
+async def liveness():
+    """
+    Sonde de vie : aucune entrée/sortie (le processus répond)
+    """
+    return {"status": "ok"}
+
+
+async def readiness():
+    """
+    Sonde de disponibilité : dernier résultat de la sonde de base, sans
+    entrée/sortie (503 tant que la base n'a pas répondu ou si le résultat
+    est périmé)
+    """
+    if health.probe is None:
+        return ORJSONResponse(status_code=503, content={"status": "not_started"})
+
+    ready, detail = health.probe.readiness()
+    return ORJSONResponse(status_code=200 if ready else 503, content=detail)
+
+
 # === ÉVÉNEMENTS DE DÉMARRAGE/ARRÊT ===
 
-@app.on_event("startup")
 async def startup_event():
     """
     Actions au démarrage de l'application
@@ -90,13 +88,38 @@ async def startup_event():
     logger.info(f"Database : {settings.DATABASE_TYPE}")
     logger.info(f"Host : {settings.APP_HOST}:{settings.APP_PORT}")
     logger.info("=" * 60)
+    
+    # Sonde de la base pour /readyz (premier résultat immédiatement)
+    health.probe = health.HealthProbe()
+    health.probe.start()
+    
+    # Expéditeur de l'outbox en tâche de fond
+    if settings.SMTP_ENABLED:
+        mailer.sender = mailer.OutboxSender()
+        mailer.sender.start()
+    
+    # Purge périodique des lignes expirées (tokens, cache de stats)
+    if settings.MAINTENANCE_ENABLED:
+        maintenance.task = maintenance.MaintenanceTask()
+        maintenance.task.start()
 
 
-@app.on_event("shutdown")
 async def shutdown_event():
     """
     Actions à l'arrêt de l'application
     """
+    if mailer.sender is not None:
+        await mailer.sender.stop()
+        mailer.sender = None
+    
+    if maintenance.task is not None:
+        await maintenance.task.stop()
+        maintenance.task = None
+    
+    if health.probe is not None:
+        await health.probe.stop()
+        health.probe = None
+    
     logger.info("=" * 60)
     logger.info("🛑 Training Escalade API - Arrêt")
     logger.info("=" * 60)
@@ -104,7 +127,6 @@ async def shutdown_event():
 
 # === GESTIONNAIRE D'ERREURS GLOBAL ===
 
-@app.exception_handler(404)
 async def not_found_handler(request: Request, exc):
     """Gestionnaire pour les 404"""
     return JSONResponse(
@@ -116,6 +138,63 @@ async def not_found_handler(request: Request, exc):
     )
 
 
+
+# === FABRIQUE D'APPLICATION ===
+
+def create_app() -> FastAPI:
+    """
+    Construit l'application (routes, schémas, middlewares, templates email)
+
+    Tout ce qui est statique est construit ici, une fois : un serveur qui
+    pré-charge l'application avant de forker (gunicorn.conf.py) partage ces
+    objets entre ses workers. Le moteur de base de données n'est pas créé
+    ici mais au premier usage, donc dans chaque worker.
+
+    La configuration est celle du module backend.config (settings), lue
+    aussi par les middlewares, les tâches de fond et le moteur.
+    """
+    configure_logging()
+
+    app = FastAPI(
+        title="Training Escalade API",
+        description="API de suivi d'entraînement pour l'escalade et la course",
+        version=settings.APP_VERSION,
+        docs_url="/docs" if settings.DEBUG else None,  # Swagger UI uniquement en dev
+        redoc_url="/redoc" if settings.DEBUG else None,  # ReDoc uniquement en dev
+        default_response_class=ORJSONResponse,  # Sérialisation JSON rapide (orjson)
+    )
+
+    # Configuration des middlewares
+    setup_middlewares(app)
+
+    # Routes de l'API
+    include_routers(app, prefix="/api")
+    app.add_api_route("/", root, methods=["GET"])
+    app.add_api_route("/health", health_check, methods=["GET"], response_model=HealthCheckResponse)
+    app.add_api_route("/livez", liveness, methods=["GET"])
+    app.add_api_route("/readyz", readiness, methods=["GET"])
+
+    app.add_event_handler("startup", startup_event)
+    app.add_event_handler("shutdown", shutdown_event)
+    app.add_exception_handler(404, not_found_handler)
+
+    # Templates email compilés une fois (une erreur de template est vue tout de suite)
+    mailer.load_templates()
+
+    return app
+
+
+def warm_up(app: FastAPI):
+    """
+    Construit à l'avance ce que FastAPI construit au premier appel (schéma
+    OpenAPI). Utile avant un fork : le résultat est partagé par les workers.
+    """
+    app.openapi()
+
+
+app = create_app()
+
+
 if __name__ == "__main__":
     import uvicorn
     
@@ -9,13 +9,23 @@ from backend.models.exercise import Exercise
 from backend.models.session_template import SessionTemplate
 from backend.models.planning import Planning
 from backend.models.training_session import TrainingSession
+from backend.models.session_climb import SessionClimb
 from backend.models.route import Route
 from backend.models.goal_category import GoalCategory
 from backend.models.running_session import RunningSession
+from backend.models.running_track import RunningTrack
 from backend.models.program import Program
 from backend.models.stats_cache import StatsCache
+from backend.models.daily_load import DailyLoad
+from backend.models.image_job import ImageJob
+from backend.models.email_outbox import EmailOutbox
 from backend.models.password_reset import PasswordResetToken
 from backend.models.email_verification import EmailVerificationToken
+from backend.models.refresh_token import RefreshToken
+from backend.models.coach_athlete import CoachAthlete
+from backend.models.search_document import SearchDocument
+from backend.models.location import Location
+from backend.models.user_week_summary import UserWeekSummary
 
 __all__ = [
     "User",
@@ -24,11 +34,21 @@ __all__ = [
     "SessionTemplate",
     "Planning",
     "TrainingSession",
+    "SessionClimb",
     "Route",
     "GoalCategory",
     "RunningSession",
+    "RunningTrack",
     "Program",
     "StatsCache",
+    "DailyLoad",
+    "ImageJob",
+    "EmailOutbox",
     "PasswordResetToken",
     "EmailVerificationToken",
+    "RefreshToken",
+    "CoachAthlete",
+    "SearchDocument",
+    "Location",
+    "UserWeekSummary",
 ]
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""
+Modèle CoachAthlete - Accès d'un coach aux données d'un athlète
+Le lien est créé par l'athlète : un coach ne voit que les athlètes qui l'ont autorisé
+"""
+
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from backend.database import Base
+
+
+class CoachAthlete(Base):
+    """
+    Autorisation d'accès coach -> athlète
+    Une ligne par couple (coach, athlète)
+    """
+    __tablename__ = "coach_athletes"
+    __table_args__ = (
+        UniqueConstraint("coach_id", "athlete_id", name="uq_coach_athletes_coach_athlete"),
+    )
+
+    # === CLÉS ===
+    id = Column(Integer, primary_key=True, index=True)
+    coach_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    athlete_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # === DATES ===
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # === RELATIONS ===
+    coach = relationship("User", foreign_keys=[coach_id], back_populates="athlete_links")
+    athlete = relationship("User", foreign_keys=[athlete_id], back_populates="coach_links")
+
+    def __repr__(self):
+        return f"<CoachAthlete(coach_id={self.coach_id}, athlete_id={self.athlete_id})>"
@@ -0,0 +1,48 @@
+"""
+Modèle DailyLoad - Charge d'entraînement journalière
+Agrégat par utilisateur et par jour, mis à jour à chaque écriture de séance
+"""
+
+from sqlalchemy import Column, Integer, Date, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from backend.database import Base
+
+
+class DailyLoad(Base):
+    """
+    Charge journalière (session-RPE = RPE x durée en minutes)
+    Une ligne par utilisateur et par jour ayant au moins une séance
+    """
+    __tablename__ = "daily_loads"
+    __table_args__ = (
+        UniqueConstraint("user_id", "date", name="uq_daily_loads_user_date"),
+    )
+    
+    # === CLÉS ===
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    date = Column(Date, nullable=False)
+    
+    # === CHARGE (unités arbitraires, RPE x minutes) ===
+    climbing_load = Column(Integer, default=0, nullable=False)
+    running_load = Column(Integer, default=0, nullable=False)
+    
+    # === NOMBRE DE SÉANCES ===
+    climbing_sessions = Column(Integer, default=0, nullable=False)
+    running_sessions = Column(Integer, default=0, nullable=False)
+    
+    # === DATES ===
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    # === RELATION ===
+    user = relationship("User", back_populates="daily_loads")
+    
+    def __repr__(self):
+        return f"<DailyLoad(user_id={self.user_id}, date={self.date}, load={self.total_load})>"
+    
+    @property
+    def total_load(self) -> int:
+        """Charge totale du jour"""
+        return (self.climbing_load or 0) + (self.running_load or 0)
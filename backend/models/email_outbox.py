@@ -0,0 +1,53 @@
+"""
+Modèle EmailOutbox - File d'envoi des emails (outbox transactionnelle)
+Écrit dans la même transaction que l'action qui déclenche l'email
+"""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from datetime import datetime
+import enum
+
+from backend.database import Base
+
+
+class EmailStatus(str, enum.Enum):
+    """États d'un email"""
+    PENDING = "pending"  # À envoyer (ou nouvelle tentative programmée)
+    SENDING = "sending"  # Pris par un expéditeur
+    SENT = "sent"
+    FAILED = "failed"  # Rejet définitif ou tentatives épuisées
+
+
+class EmailOutbox(Base):
+    """
+    Email en attente d'envoi
+    Rendu au moment de l'envoi depuis le template et son contexte JSON
+    """
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+    
+    # === CLÉS ===
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
+    
+    # === MESSAGE ===
+    template = Column(String(50), nullable=False)  # Clé de EMAIL_TEMPLATES
+    to_email = Column(String(255), nullable=False)
+    context_json = Column(Text, nullable=False, default="{}")
+    
+    # === ENVOI ===
+    status = Column(String(20), default=EmailStatus.PENDING.value, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=6, nullable=False)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    
+    # === DATES ===
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    sent_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self):
+        return f"<EmailOutbox(id={self.id}, template='{self.template}', status='{self.status}')>"
@@ -30,7 +30,7 @@ class EmailVerificationToken(Base):
     verified_at = Column(DateTime)
     
     # === EXPIRATION ===
-    expires_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)  # Purge par lots
     
     # === DATES ===
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,54 @@
+"""
+Modèle ImageJob - File de traitement des photos
+Tâches consommées par le worker (run_worker.py) : dérivés WebP, EXIF, réencodage
+"""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from datetime import datetime
+import enum
+
+from backend.database import Base
+
+
+class ImageJobStatus(str, enum.Enum):
+    """États d'une tâche"""
+    PENDING = "pending"  # En attente (ou nouvelle tentative programmée)
+    RUNNING = "running"  # Prise par un worker
+    DONE = "done"
+    FAILED = "failed"  # Abandonnée (image invalide ou tentatives épuisées)
+
+
+class ImageJob(Base):
+    """
+    Tâche de traitement d'une photo de grande voie
+    La clé d'idempotence (voie + empreinte du fichier) évite les doublons
+    """
+    __tablename__ = "image_jobs"
+    __table_args__ = (
+        Index("ix_image_jobs_status_run_after", "status", "run_after"),
+    )
+    
+    # === CLÉS ===
+    id = Column(Integer, primary_key=True, index=True)
+    idempotency_key = Column(String(150), unique=True, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    route_id = Column(Integer, ForeignKey("routes.id", ondelete="CASCADE"), nullable=False, index=True)
+    
+    # === FICHIER ===
+    source_path = Column(String(500), nullable=False)  # Original, relatif au dossier d'upload
+    
+    # === EXÉCUTION ===
+    status = Column(String(20), default=ImageJobStatus.PENDING.value, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=5, nullable=False)
+    run_after = Column(DateTime, default=datetime.utcnow, nullable=False)  # Backoff des nouvelles tentatives
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    
+    # === DATES ===
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self):
+        return f"<ImageJob(id={self.id}, route_id={self.route_id}, status='{self.status}')>"
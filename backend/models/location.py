@@ -0,0 +1,52 @@
+"""
+Modèle Location - Lieux (salles, sites, sorties) d'un utilisateur
+Table de dimension : un lieu par nom normalisé, avec ses compteurs d'utilisation
+"""
+
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from backend.database import Base
+
+
+class Location(Base):
+    """
+    Lieu utilisé par les séances, grandes voies et sorties course
+    Compteurs mis à jour à chaque écriture (cf. services/locations.py)
+    """
+    __tablename__ = "locations"
+    __table_args__ = (
+        # Unicité + autocomplétion par préfixe (user_id = ? AND name_key >= ?)
+        UniqueConstraint("user_id", "name_key", name="uq_locations_user_key"),
+    )
+
+    # === CLÉS ===
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+
+    # === NOM ===
+    name = Column(String(200), nullable=False)  # Première orthographe saisie
+    name_key = Column(String(200), nullable=False)  # Minuscules, sans accents ni ponctuation
+
+    # === COMPTEURS ===
+    training_sessions = Column(Integer, default=0, nullable=False)
+    running_sessions = Column(Integer, default=0, nullable=False)
+    routes = Column(Integer, default=0, nullable=False)
+    meters_climbed = Column(Integer, default=0, nullable=False)  # Longueur cumulée des grandes voies
+
+    # === DATES ===
+    last_date = Column(Date)  # Dernière activité enregistrée (non recalculée à la suppression)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # === RELATION ===
+    user = relationship("User", back_populates="locations")
+
+    def __repr__(self):
+        return f"<Location(id={self.id}, user_id={self.user_id}, name='{self.name}')>"
+
+    @property
+    def usage_count(self) -> int:
+        """Nombre total d'utilisations"""
+        return (self.training_sessions or 0) + (self.running_sessions or 0) + (self.routes or 0)
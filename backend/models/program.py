@@ -3,7 +3,7 @@ Modèle Program - Programmes d'entraînement
 Bibliothèque de programmes pré-définis ou créés par l'utilisateur
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import json
@@ -17,6 +17,10 @@ class Program(Base):
     Ex: "Progression force 8 semaines", "Préparation DE"
     """
     __tablename__ = "programs"
+    __table_args__ = (
+        # Catalogue public trié par popularité
+        Index("ix_programs_public_copies", "is_public", "copy_count"),
+    )
     
     # === CLÉS ===
     id = Column(Integer, primary_key=True, index=True)
@@ -38,6 +42,10 @@ class Program(Base):
     is_active = Column(Boolean, default=False)  # Programme actuellement suivi
     is_public = Column(Boolean, default=False)  # Partageable avec d'autres utilisateurs
     
+    # === PARTAGE ===
+    copy_count = Column(Integer, default=0, nullable=False, server_default="0")  # Copies par d'autres utilisateurs
+    source_program_id = Column(Integer, ForeignKey("programs.id", ondelete="SET NULL"))  # Programme public copié
+    
     # === DATES ===
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -0,0 +1,42 @@
+"""
+Modèle RefreshToken - Refresh tokens émis (rotation par famille)
+Une famille = une connexion ; chaque rafraîchissement remplace le token courant
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from backend.database import Base
+
+
+class RefreshToken(Base):
+    """
+    Refresh token émis (identifié par son jti)
+    Un token déjà remplacé qui revient = réutilisation : toute la famille est révoquée
+    """
+    __tablename__ = "refresh_tokens"
+    
+    # === CLÉS ===
+    id = Column(Integer, primary_key=True, index=True)
+    jti = Column(String(32), unique=True, nullable=False)
+    family_id = Column(String(32), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    
+    # === ROTATION / RÉVOCATION ===
+    replaced_by = Column(String(32), nullable=True)  # jti du token suivant
+    revoked_at = Column(DateTime, nullable=True)
+    
+    # === DATES ===
+    expires_at = Column(DateTime, nullable=False, index=True)  # Purge par lots
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    # === RELATION ===
+    user = relationship("User", back_populates="refresh_tokens")
+    
+    def __repr__(self):
+        return f"<RefreshToken(id={self.id}, user_id={self.user_id}, family='{self.family_id}')>"
+    
+    def is_active(self) -> bool:
+        """Token ni remplacé, ni révoqué, ni expiré"""
+        return self.replaced_by is None and self.revoked_at is None and datetime.utcnow() < self.expires_at
@@ -50,6 +50,7 @@ class RunningSession(Base):
     
     # === RELATION ===
     user = relationship("User", back_populates="running_sessions")
+    track = relationship("RunningTrack", back_populates="session", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
     
     def __repr__(self):
         return f"<RunningSession(id={self.id}, date={self.date}, distance={self.distance_km}km)>"
@@ -0,0 +1,56 @@
+"""
+Modèle RunningTrack - Trace GPS d'une sortie course
+Points (GPX/TCX) stockés en colonnes int32 encodées en delta, résumé dérivé
+"""
+
+from sqlalchemy import Column, Integer, String, Boolean, Float, DateTime, LargeBinary, ForeignKey
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from backend.database import Base
+
+
+class RunningTrack(Base):
+    """
+    Trace GPS d'une sortie (une par sortie)
+    points : voir services/tracks.py (encode_points / decode_points)
+    """
+    __tablename__ = "running_tracks"
+    
+    # === CLÉS ===
+    id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(Integer, ForeignKey("running_sessions.id", ondelete="CASCADE"), unique=True, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    
+    # === SOURCE ===
+    source_format = Column(String(10), nullable=False)  # gpx, tcx
+    
+    # === POINTS ===
+    point_count = Column(Integer, nullable=False)
+    has_elevation = Column(Boolean, default=False, nullable=False)
+    has_time = Column(Boolean, default=False, nullable=False)
+    has_heart_rate = Column(Boolean, default=False, nullable=False)
+    points = Column(LargeBinary(2**24 - 1), nullable=False)  # MEDIUMBLOB sous MySQL
+    
+    # === RÉSUMÉ (dérivé des points) ===
+    started_at = Column(DateTime)  # Heure du premier point (UTC)
+    duration_s = Column(Integer)
+    distance_m = Column(Integer, nullable=False)
+    elevation_gain_m = Column(Integer)
+    average_heart_rate = Column(Integer)
+    max_heart_rate = Column(Integer)
+    
+    # === EMPRISE ===
+    min_lat = Column(Float, nullable=False)
+    max_lat = Column(Float, nullable=False)
+    min_lon = Column(Float, nullable=False)
+    max_lon = Column(Float, nullable=False)
+    
+    # === DATES ===
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    # === RELATION ===
+    session = relationship("RunningSession", back_populates="track")
+    
+    def __repr__(self):
+        return f"<RunningTrack(id={self.id}, session_id={self.session_id}, points={self.point_count})>"
@@ -0,0 +1,83 @@
+"""
+Modèle SearchDocument - Index de recherche plein texte
+Une ligne par séance, grande voie ou sortie course (nom, lieu, notes, commentaires)
+
+Index plein texte selon la base :
+- SQLite : table virtuelle FTS5 search_documents_fts (contenu externe),
+  synchronisée par triggers sur search_documents
+- MySQL : index FULLTEXT sur (title, body)
+"""
+
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey, Index, UniqueConstraint, DDL, event
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from backend.database import Base
+
+
+class SearchDocument(Base):
+    """
+    Document indexé (copie dénormalisée des champs texte d'un objet)
+    Tenu à jour à chaque écriture de l'objet (cf. services/search.py)
+    """
+    __tablename__ = "search_documents"
+    __table_args__ = (
+        UniqueConstraint("kind", "object_id", name="uq_search_documents_object"),
+        Index("ix_search_documents_user_kind", "user_id", "kind"),
+        Index("ft_search_documents", "title", "body", mysql_prefix="FULLTEXT").ddl_if(dialect="mysql"),
+    )
+
+    # === CLÉS ===
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(String(20), nullable=False)  # training, route, running
+    object_id = Column(Integer, nullable=False)
+
+    # === CONTENU ===
+    date = Column(Date)
+    title = Column(String(200), nullable=False, default="")
+    body = Column(Text, nullable=False, default="")
+
+    # === DATES ===
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # === RELATION ===
+    user = relationship("User", back_populates="search_documents")
+
+    def __repr__(self):
+        return f"<SearchDocument(kind='{self.kind}', object_id={self.object_id}, user_id={self.user_id})>"
+
+
+# === FTS5 (SQLite) ===
+# Les triggers répercutent toute écriture (y compris les suppressions en
+# cascade d'un compte) sur la table virtuelle
+
+SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_documents_fts USING fts5("
+    "title, body, content='search_documents', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+
+    "CREATE TRIGGER IF NOT EXISTS search_documents_ai AFTER INSERT ON search_documents BEGIN "
+    "INSERT INTO search_documents_fts(rowid, title, body) VALUES (new.id, new.title, new.body); "
+    "END",
+
+    "CREATE TRIGGER IF NOT EXISTS search_documents_ad AFTER DELETE ON search_documents BEGIN "
+    "INSERT INTO search_documents_fts(search_documents_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); "
+    "END",
+
+    "CREATE TRIGGER IF NOT EXISTS search_documents_au AFTER UPDATE ON search_documents BEGIN "
+    "INSERT INTO search_documents_fts(search_documents_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); "
+    "INSERT INTO search_documents_fts(rowid, title, body) VALUES (new.id, new.title, new.body); "
+    "END",
+)
+
+for statement in SQLITE_FTS_DDL:
+    event.listen(SearchDocument.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+event.listen(
+    SearchDocument.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS search_documents_fts").execute_if(dialect="sqlite")
+)
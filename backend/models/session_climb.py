@@ -0,0 +1,43 @@
+"""
+Modèle SessionClimb - Voies/blocs grimpés pendant une séance
+Une ligne par voie, pour les agrégats par cotation (pyramide, volume, essais)
+"""
+
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index
+from sqlalchemy.orm import relationship
+
+from backend.database import Base
+
+
+class SessionClimb(Base):
+    """
+    Voie ou bloc grimpé pendant une séance d'entraînement
+    Version normalisée de TrainingSession.routes_json
+    """
+    __tablename__ = "session_climbs"
+    __table_args__ = (
+        # Pyramide des cotations et volume par période
+        Index("ix_session_climbs_user_grade", "user_id", "grade_rank"),
+        Index("ix_session_climbs_user_date", "user_id", "date"),
+    )
+    
+    # === CLÉS ===
+    id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(Integer, ForeignKey("training_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    
+    # === DATE (dénormalisée depuis la séance) ===
+    date = Column(Date, nullable=False)
+    
+    # === VOIE ===
+    position = Column(Integer, nullable=False, default=0)  # Ordre dans la séance
+    grade = Column(String(10))  # Cotation saisie (ex: "7a")
+    grade_rank = Column(Integer)  # Rang numérique (voir services/grades.py)
+    style = Column(String(20))  # onsight, flash, redpoint, project
+    tries = Column(Integer, nullable=False, default=1)
+    
+    # === RELATION ===
+    session = relationship("TrainingSession", back_populates="climbs")
+    
+    def __repr__(self):
+        return f"<SessionClimb(id={self.id}, session_id={self.session_id}, grade='{self.grade}')>"
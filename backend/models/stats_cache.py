@@ -34,7 +34,7 @@ class StatsCache(Base):
     data_json = Column(Text, nullable=False)
     
     # === CACHE ===
-    expires_at = Column(DateTime)  # Date d'expiration du cache
+    expires_at = Column(DateTime, index=True)  # Date d'expiration du cache (purge par lots)
     
     # === DATES ===
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -59,8 +59,15 @@ class TrainingSession(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
-    # === RELATION ===
+    # === RELATIONS ===
     user = relationship("User", back_populates="training_sessions")
+    climbs = relationship(
+        "SessionClimb",
+        back_populates="session",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="SessionClimb.position"
+    )
     
     def __repr__(self):
         return f"<TrainingSession(id={self.id}, date={self.date}, type='{self.session_type}')>"
\ No newline at end of file
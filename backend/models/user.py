@@ -41,37 +41,54 @@ class User(Base):
     is_verified = Column(Boolean, default=False, nullable=False)
     role = Column(Enum(UserRole), default=UserRole.USER, nullable=False)
     
+    # === SESSIONS ===
+    # Incrémenté pour invalider tous les tokens (logout, mot de passe, suppression)
+    token_version = Column(Integer, default=0, nullable=False, server_default="0")
+    
     # === DATES ===
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     last_login_at = Column(DateTime)
     
     # === RELATIONS ===
+    # passive_deletes : la suppression d'un utilisateur est faite par la base
+    # (ON DELETE CASCADE), sans charger les lignes enfants
     # Configuration
-    config = relationship("UserConfig", back_populates="user", uselist=False, cascade="all, delete-orphan")
+    config = relationship("UserConfig", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
     
     # Entraînement
-    exercises = relationship("Exercise", back_populates="user", cascade="all, delete-orphan")
-    session_templates = relationship("SessionTemplate", back_populates="user", cascade="all, delete-orphan")
-    planning = relationship("Planning", back_populates="user", cascade="all, delete-orphan")
-    training_sessions = relationship("TrainingSession", back_populates="user", cascade="all, delete-orphan")
+    exercises = relationship("Exercise", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    session_templates = relationship("SessionTemplate", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    planning = relationship("Planning", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    training_sessions = relationship("TrainingSession", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
     
     # Grandes voies
-    routes = relationship("Route", back_populates="user", cascade="all, delete-orphan")
-    goal_categories = relationship("GoalCategory", back_populates="user", cascade="all, delete-orphan")
+    routes = relationship("Route", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    goal_categories = relationship("GoalCategory", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
     
     # Course à pied
-    running_sessions = relationship("RunningSession", back_populates="user", cascade="all, delete-orphan")
+    running_sessions = relationship("RunningSession", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
     
     # Programmes
-    programs = relationship("Program", back_populates="user", cascade="all, delete-orphan")
+    programs = relationship("Program", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
     
     # Stats
-    stats_cache = relationship("StatsCache", back_populates="user", cascade="all, delete-orphan")
+    stats_cache = relationship("StatsCache", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    daily_loads = relationship("DailyLoad", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    week_summaries = relationship("UserWeekSummary", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    
+    # Lieux et recherche
+    locations = relationship("Location", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    search_documents = relationship("SearchDocument", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
     
     # Tokens
-    password_reset_tokens = relationship("PasswordResetToken", back_populates="user", cascade="all, delete-orphan")
-    email_verification_tokens = relationship("EmailVerificationToken", back_populates="user", cascade="all, delete-orphan")
+    password_reset_tokens = relationship("PasswordResetToken", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    email_verification_tokens = relationship("EmailVerificationToken", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    
+    # Coaching (athlètes suivis en tant que coach, coachs autorisés en tant qu'athlète)
+    athlete_links = relationship("CoachAthlete", foreign_keys="CoachAthlete.coach_id", back_populates="coach", cascade="all, delete-orphan", passive_deletes=True)
+    coach_links = relationship("CoachAthlete", foreign_keys="CoachAthlete.athlete_id", back_populates="athlete", cascade="all, delete-orphan", passive_deletes=True)
     
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}', username='{self.username}', role='{self.role}')>"
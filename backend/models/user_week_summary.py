@@ -0,0 +1,55 @@
+"""
+Modèle UserWeekSummary - Résumé hebdomadaire d'activité
+Agrégat par utilisateur et par semaine ISO, mis à jour à chaque écriture de séance
+"""
+
+from sqlalchemy import Column, Integer, Date, DateTime, ForeignKey, UniqueConstraint, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from backend.database import Base
+
+
+class UserWeekSummary(Base):
+    """
+    Activité d'une semaine ISO (lundi-dimanche)
+    Une semaine à cheval sur deux mois a une ligne par mois : les totaux
+    d'une semaine (<= 2 lignes) comme ceux d'un mois (<= 6 lignes) sont exacts
+    """
+    __tablename__ = "user_week_summary"
+    __table_args__ = (
+        UniqueConstraint("user_id", "week_start", "month_start", name="uq_user_week_summary_user_week_month"),
+        Index("ix_user_week_summary_user_month", "user_id", "month_start"),
+    )
+
+    # === CLÉS ===
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    week_start = Column(Date, nullable=False)  # Lundi de la semaine ISO
+    month_start = Column(Date, nullable=False)  # 1er du mois de la partie de semaine
+
+    # === ESCALADE ===
+    training_sessions = Column(Integer, default=0, nullable=False)
+    training_minutes = Column(Integer, default=0, nullable=False)
+    climbs = Column(Integer, default=0, nullable=False)
+    sends = Column(Integer, default=0, nullable=False)
+    best_grade_rank = Column(Integer)  # Meilleure voie enchaînée (rang de cotation)
+
+    # === COURSE ===
+    running_sessions = Column(Integer, default=0, nullable=False)
+    running_minutes = Column(Integer, default=0, nullable=False)
+    distance_m = Column(Integer, default=0, nullable=False)  # Mètres : deltas entiers exacts
+    elevation_gain_m = Column(Integer, default=0, nullable=False)
+
+    # === CHARGE (RPE x minutes) ===
+    climbing_load = Column(Integer, default=0, nullable=False)
+    running_load = Column(Integer, default=0, nullable=False)
+
+    # === DATES ===
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # === RELATION ===
+    user = relationship("User", back_populates="week_summaries")
+
+    def __repr__(self):
+        return f"<UserWeekSummary(user_id={self.user_id}, week_start={self.week_start}, month_start={self.month_start})>"
@@ -0,0 +1,54 @@
+"""
+Réponses HTTP rapides
+Sérialisation ORJSON + chemin rapide depuis des requêtes par colonnes
+"""
+
+from functools import lru_cache
+from typing import Iterable
+
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy.engine import Row
+
+
+# === COLONNES PRÉCALCULÉES ===
+
+@lru_cache(maxsize=None)
+def response_columns(model, schema: type[BaseModel]) -> tuple:
+    """
+    Retourne les colonnes du modèle correspondant aux champs d'un schéma de réponse
+    Calculé une seule fois par couple (modèle, schéma)
+
+    Usage dans les routes :
+        rows = db.query(*response_columns(Route, RouteResponse)).all()
+        return rows_response(rows)
+
+    Args:
+        model: Modèle SQLAlchemy
+        schema: Schéma Pydantic de réponse (response_model de la route)
+
+    Returns:
+        Tuple des attributs de colonnes, dans l'ordre des champs du schéma
+    """
+    return tuple(getattr(model, name) for name in schema.model_fields)
+
+
+# === CHEMIN RAPIDE ===
+
+def rows_response(rows: Iterable[Row], status_code: int = status.HTTP_200_OK) -> ORJSONResponse:
+    """
+    Construit une réponse JSON directement depuis des Row SQLAlchemy
+
+    Pas d'hydratation ORM ni de seconde validation Pydantic : les colonnes
+    sélectionnées via response_columns() correspondent déjà au schéma.
+    Le response_model de la route reste utilisé pour la documentation OpenAPI.
+
+    Args:
+        rows: Lignes retournées par une requête par colonnes
+        status_code: Code HTTP de la réponse
+
+    Returns:
+        Réponse ORJSON
+    """
+    return ORJSONResponse([row._asdict() for row in rows], status_code=status_code)
@@ -0,0 +1,4 @@
+"""
+Services métier
+Logique partagée entre les routes de l'API (calculs, stockage, tâches de fond)
+"""
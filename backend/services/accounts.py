@@ -0,0 +1,86 @@
+"""
+Suppression de comptes
+Un DELETE par lot d'utilisateurs, les données liées sont supprimées par la
+base (ON DELETE CASCADE) : aucune ligne enfant n'est chargée en mémoire.
+Les fichiers uploadés sont supprimés ensuite, hors requête (tâche de fond).
+"""
+
+import logging
+import shutil
+from typing import Iterable
+
+from sqlalchemy import select, delete
+from sqlalchemy.orm import Session
+
+from backend.config import UPLOAD_DIR_PATH
+from backend.models.user import User
+from backend.models.refresh_token import RefreshToken
+from backend.services.refresh_tokens import revoked_cache, REVOKED
+from backend.services.program_catalog import catalog
+
+logger = logging.getLogger(__name__)
+
+# Dossiers d'upload par utilisateur (cf. get_upload_path)
+UPLOAD_TYPES = ("routes", "avatars")
+
+# Utilisateurs supprimés par instruction DELETE
+DELETE_CHUNK_SIZE = 100
+
+
+def delete_users(db: Session, user_ids: Iterable[int]) -> int:
+    """
+    Supprime des utilisateurs et toutes leurs données (commit fait)
+
+    Args:
+        db: Session de base de données
+        user_ids: IDs des utilisateurs
+
+    Returns:
+        Nombre d'utilisateurs supprimés
+    """
+    user_ids = sorted(set(user_ids))
+    if not user_ids:
+        return 0
+
+    # Refresh tokens refusés sans requête base jusqu'à leur éviction du cache
+    tokens = []
+    for start in range(0, len(user_ids), DELETE_CHUNK_SIZE):
+        tokens.extend(db.execute(
+            select(RefreshToken.jti, RefreshToken.family_id).where(
+                RefreshToken.user_id.in_(user_ids[start:start + DELETE_CHUNK_SIZE]),
+                RefreshToken.revoked_at == None
+            )
+        ).all())
+
+    # Les objets User éventuellement chargés ne doivent pas être réécrits au commit
+    for user in [obj for obj in db.identity_map.values() if isinstance(obj, User)]:
+        if user.id in user_ids:
+            db.expunge(user)
+
+    deleted = 0
+    for start in range(0, len(user_ids), DELETE_CHUNK_SIZE):
+        deleted += db.execute(
+            delete(User)
+            .where(User.id.in_(user_ids[start:start + DELETE_CHUNK_SIZE]))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+    db.commit()
+
+    for jti, family_id in tokens:
+        revoked_cache.add(jti, family_id, REVOKED)
+
+    # Leurs programmes publics disparaissent du catalogue
+    if deleted:
+        catalog.invalidate()
+
+    return deleted
+
+
+def remove_user_files(user_ids: Iterable[int]):
+    """Supprime les dossiers d'upload d'utilisateurs supprimés (tâche de fond)"""
+    for user_id in user_ids:
+        for upload_type in UPLOAD_TYPES:
+            path = UPLOAD_DIR_PATH / upload_type / f"user_{user_id}"
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+                logger.info(f"Uploads supprimés : {path}")
@@ -0,0 +1,103 @@
+"""
+Voies grimpées par séance
+Conversion de routes_json en lignes session_climbs (insertion groupée)
+"""
+
+import json
+import logging
+from typing import Optional
+
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from backend.models.session_climb import SessionClimb
+from backend.models.training_session import ClimbingStyle
+from backend.services.grades import normalize_grade, grade_to_rank
+
+logger = logging.getLogger(__name__)
+
+# Styles comptés comme voie enchaînée
+SEND_STYLES = (ClimbingStyle.ONSIGHT.value, ClimbingStyle.FLASH.value, ClimbingStyle.REDPOINT.value)
+
+
+def parse_routes_json(routes_json: Optional[str]) -> list[dict]:
+    """
+    Décode routes_json de façon tolérante
+
+    Args:
+        routes_json: JSON au format [{"grade": "7a", "style": "onsight", "tries": 1}, ...]
+
+    Returns:
+        Liste des voies (entrées invalides ignorées)
+    """
+    if not routes_json:
+        return []
+
+    try:
+        data = json.loads(routes_json)
+    except (ValueError, TypeError):
+        return []
+
+    if not isinstance(data, list):
+        return []
+
+    return [item for item in data if isinstance(item, dict)]
+
+
+def build_climb_rows(session_id: int, user_id: int, date, routes_json: Optional[str]) -> list[dict]:
+    """
+    Construit les lignes session_climbs d'une séance
+
+    Args:
+        session_id: ID de la séance
+        user_id: ID de l'utilisateur
+        date: Date de la séance
+        routes_json: Voies de la séance au format JSON
+
+    Returns:
+        Liste de dicts prêts pour un insert groupé
+    """
+    rows = []
+    for position, item in enumerate(parse_routes_json(routes_json)):
+        grade = normalize_grade(str(item["grade"])) if item.get("grade") else None
+        style = item.get("style")
+
+        try:
+            tries = max(int(item.get("tries") or 1), 1)
+        except (ValueError, TypeError):
+            tries = 1
+
+        rows.append({
+            "session_id": session_id,
+            "user_id": user_id,
+            "date": date,
+            "position": position,
+            "grade": grade[:10] if grade else None,
+            "grade_rank": grade_to_rank(grade),
+            "style": str(style)[:20] if style else None,
+            "tries": tries,
+        })
+    return rows
+
+
+def replace_session_climbs(db: Session, session) -> int:
+    """
+    Remplace les voies d'une séance à partir de son routes_json
+    Un DELETE + un INSERT groupé (executemany), sans hydratation ORM
+
+    Args:
+        db: Session de base de données
+        session: TrainingSession (doit avoir un ID, flush préalable)
+
+    Returns:
+        Nombre de voies insérées
+    """
+    db.execute(delete(SessionClimb).where(SessionClimb.session_id == session.id))
+
+    rows = build_climb_rows(session.id, session.user_id, session.date, session.routes_json)
+    if rows:
+        db.execute(insert(SessionClimb), rows)
+
+    # Les voies en session ne reflètent plus la base
+    db.expire(session, ["climbs"])
+    return len(rows)
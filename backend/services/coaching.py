@@ -0,0 +1,192 @@
+"""
+Coaching
+Tableau de bord multi-athlètes d'un coach
+
+Les statistiques de tous les athlètes suivis sont calculées par un nombre
+fixe de requêtes agrégées (GROUP BY user_id), quel que soit le nombre
+d'athlètes : pas de boucle sur le dashboard individuel. Les athlètes sont
+sélectionnés par une sous-requête sur coach_athletes (pas de longue liste IN).
+"""
+
+from datetime import date as date_type, timedelta
+from typing import Optional
+
+from sqlalchemy import select, func, case, and_, or_
+from sqlalchemy.orm import Session
+
+from backend.models.user import User
+from backend.models.coach_athlete import CoachAthlete
+from backend.models.training_session import TrainingSession
+from backend.models.running_session import RunningSession
+from backend.models.route import Route
+from backend.models.goal_category import GoalCategory
+from backend.models.daily_load import DailyLoad
+from backend.models.user_week_summary import UserWeekSummary
+from backend.services.training_load import ACUTE_DAYS, CHRONIC_DAYS
+
+
+def athlete_ids_query(coach_id: int, athlete_id: Optional[int] = None):
+    """Sous-requête des athlètes ayant autorisé un coach (éventuellement un seul)"""
+    query = select(CoachAthlete.athlete_id).where(CoachAthlete.coach_id == coach_id)
+    if athlete_id is not None:
+        query = query.where(CoachAthlete.athlete_id == athlete_id)
+    return query
+
+
+def _count_if(condition, value=1):
+    """SUM(CASE WHEN condition THEN value ELSE 0 END)"""
+    return func.coalesce(func.sum(case((condition, value), else_=0)), 0)
+
+
+def _by_user(db: Session, statement) -> dict[int, tuple]:
+    """Exécute un agrégat dont la première colonne est user_id"""
+    return {row[0]: tuple(row[1:]) for row in db.execute(statement).all()}
+
+
+def coach_dashboard(
+    db: Session,
+    coach_id: int,
+    athlete_id: Optional[int] = None,
+    today: Optional[date_type] = None
+) -> list[dict]:
+    """
+    Dashboard de tous les athlètes d'un coach (7 requêtes au total)
+
+    Args:
+        db: Session de base de données
+        coach_id: ID du coach
+        athlete_id: Limiter à un athlète
+        today: Date de référence (par défaut aujourd'hui)
+
+    Returns:
+        Liste de dicts (un par athlète, triés par nom d'utilisateur)
+    """
+    today = today or date_type.today()
+    week_start = today - timedelta(days=today.weekday())
+    month_start = today.replace(day=1)
+    acute_start = today - timedelta(days=ACUTE_DAYS - 1)
+    chronic_start = today - timedelta(days=CHRONIC_DAYS - 1)
+    athletes = athlete_ids_query(coach_id, athlete_id)
+
+    # 1. Athlètes
+    users = db.execute(
+        select(User.id, User.username, User.first_name, User.last_name)
+        .where(User.id.in_(athletes))
+        .order_by(User.username)
+    ).all()
+    if not users:
+        return []
+
+    # 2. Séances d'escalade
+    training = _by_user(db, select(
+        TrainingSession.user_id,
+        func.count(TrainingSession.id),
+        func.max(TrainingSession.date),
+    ).where(TrainingSession.user_id.in_(athletes)).group_by(TrainingSession.user_id))
+
+    # 3. Sorties course
+    running = _by_user(db, select(
+        RunningSession.user_id,
+        func.count(RunningSession.id),
+        func.max(RunningSession.date),
+    ).where(RunningSession.user_id.in_(athletes)).group_by(RunningSession.user_id))
+
+    # 4. Semaine et mois en cours (lignes user_week_summary)
+    in_week = UserWeekSummary.week_start == week_start
+    volumes = _by_user(db, select(
+        UserWeekSummary.user_id,
+        _count_if(UserWeekSummary.month_start == month_start, UserWeekSummary.training_sessions),
+        _count_if(in_week, UserWeekSummary.training_sessions),
+        _count_if(in_week, UserWeekSummary.training_minutes),
+        _count_if(in_week, UserWeekSummary.climbs),
+        _count_if(in_week, UserWeekSummary.sends),
+        _count_if(in_week, UserWeekSummary.running_sessions),
+        _count_if(in_week, UserWeekSummary.distance_m),
+        _count_if(in_week, UserWeekSummary.elevation_gain_m),
+    ).where(
+        UserWeekSummary.user_id.in_(athletes),
+        or_(in_week, UserWeekSummary.month_start == month_start)
+    ).group_by(UserWeekSummary.user_id))
+
+    # 5. Grandes voies
+    routes = _by_user(db, select(
+        Route.user_id,
+        func.count(Route.id),
+    ).where(Route.user_id.in_(athletes)).group_by(Route.user_id))
+
+    # 6. Charge (agrégats daily_loads sur la fenêtre chronique)
+    day_load = DailyLoad.climbing_load + DailyLoad.running_load
+    loads = _by_user(db, select(
+        DailyLoad.user_id,
+        _count_if(DailyLoad.date >= acute_start, day_load),
+        func.coalesce(func.sum(day_load), 0),
+    ).where(
+        DailyLoad.user_id.in_(athletes),
+        DailyLoad.date >= chronic_start,
+        DailyLoad.date <= today
+    ).group_by(DailyLoad.user_id))
+
+    # 7. Progression des objectifs (voies validées par catégorie)
+    goals: dict[int, list[dict]] = {}
+    goal_rows = db.execute(
+        select(
+            GoalCategory.user_id,
+            GoalCategory.name,
+            GoalCategory.required_count,
+            func.count(Route.id),
+        )
+        .outerjoin(Route, and_(Route.goal_category_id == GoalCategory.id, Route.validated_for_de == True))
+        .where(GoalCategory.user_id.in_(athletes))
+        .group_by(GoalCategory.id, GoalCategory.user_id, GoalCategory.name, GoalCategory.required_count, GoalCategory.order)
+        .order_by(GoalCategory.user_id, GoalCategory.order)
+    ).all()
+    for user_id, name, required, completed in goal_rows:
+        goals.setdefault(user_id, []).append({
+            "name": name,
+            "progress": {
+                "completed": completed,
+                "required": required,
+                "percentage": int((completed / required) * 100) if required > 0 else 0
+            }
+        })
+
+    dashboards = []
+    for user_id, username, first_name, last_name in users:
+        total_training, last_training = training.get(user_id, (0, None))
+        total_running, last_run = running.get(user_id, (0, None))
+        (month_sessions, week_sessions, week_minutes, week_climbs, week_sends,
+         week_runs, week_distance_m, week_elevation) = volumes.get(user_id, (0,) * 8)
+        acute_sum, chronic_sum = loads.get(user_id, (0, 0))
+
+        acute = acute_sum / ACUTE_DAYS
+        chronic = chronic_sum / CHRONIC_DAYS
+        last_dates = [d for d in (last_training, last_run) if d is not None]
+
+        dashboards.append({
+            "athlete_id": user_id,
+            "username": username,
+            "full_name": f"{first_name} {last_name}" if first_name and last_name else username,
+            "total_training_sessions": total_training,
+            "total_running_sessions": total_running,
+            "total_routes": routes.get(user_id, (0,))[0],
+            "current_month_sessions": month_sessions,
+            "current_week_sessions": week_sessions,
+            "week_volume": {
+                "training_sessions": week_sessions,
+                "training_minutes": int(week_minutes),
+                "climbs": week_climbs,
+                "sends": week_sends,
+                "running_sessions": week_runs,
+                "running_distance_km": round(week_distance_m / 1000, 2),
+                "running_elevation_m": int(week_elevation),
+            },
+            "load": {
+                "load_7d": int(acute_sum),
+                "acute_load": round(acute, 1),
+                "chronic_load": round(chronic, 1),
+                "acwr": round(acute / chronic, 2) if chronic > 0 else None,
+            },
+            "last_session_date": max(last_dates) if last_dates else None,
+            "goal_progress": goals.get(user_id, []),
+        })
+    return dashboards
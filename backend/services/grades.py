@@ -0,0 +1,67 @@
+"""
+Échelle des cotations
+Conversion cotation française <-> rang numérique pour les agrégats SQL
+"""
+
+from typing import Optional
+
+
+# === ÉCHELLE ===
+# Rang 1 = 3a ... rang 36 = 9c+
+FRENCH_GRADES = (
+    ("3a", "3b", "3c", "4a", "4b", "4c")
+    + tuple(
+        f"{level}{letter}{plus}"
+        for level in range(5, 10)
+        for letter in "abc"
+        for plus in ("", "+")
+    )
+)
+
+GRADE_RANKS = {grade: rank for rank, grade in enumerate(FRENCH_GRADES, start=1)}
+
+
+def normalize_grade(grade: Optional[str]) -> Optional[str]:
+    """
+    Normalise une cotation saisie par l'utilisateur (ex: " 7A+ " -> "7a+")
+    
+    Args:
+        grade: Cotation brute
+    
+    Returns:
+        Cotation normalisée ou None si vide
+    """
+    if not grade:
+        return None
+    return grade.strip().lower().replace(" ", "")
+
+
+def grade_to_rank(grade: Optional[str]) -> Optional[int]:
+    """
+    Convertit une cotation en rang numérique
+    
+    Args:
+        grade: Cotation (ex: "7a+")
+    
+    Returns:
+        Rang (ex: 20) ou None si cotation inconnue
+    """
+    normalized = normalize_grade(grade)
+    if normalized is None:
+        return None
+    return GRADE_RANKS.get(normalized)
+
+
+def rank_to_grade(rank: Optional[int]) -> Optional[str]:
+    """
+    Convertit un rang numérique en cotation
+    
+    Args:
+        rank: Rang (ex: 20)
+    
+    Returns:
+        Cotation (ex: "7a+") ou None si rang hors échelle
+    """
+    if rank is None or rank < 1 or rank > len(FRENCH_GRADES):
+        return None
+    return FRENCH_GRADES[rank - 1]
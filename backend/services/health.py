@@ -0,0 +1,164 @@
+"""
+État de santé de l'application
+Sonde de base de données en tâche de fond, résultat gardé en mémoire
+
+- /livez ne fait aucune entrée/sortie : le processus répond, il est vivant.
+- /readyz lit le dernier résultat de la sonde : les sondes du répartiteur de
+  charge ne touchent jamais la base, quelle que soit leur fréquence.
+- La sonde (SELECT 1, profondeur de l'outbox email et de la file image_jobs,
+  occupation du pool de connexions) tourne dans un thread toutes les
+  HEALTH_PROBE_INTERVAL_SECONDS. Un résultat trop ancien (sonde bloquée)
+  rend l'application non prête.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select, func, text
+from sqlalchemy.engine import Engine
+
+from backend.config import settings
+from backend.database import SessionLocal, get_engine
+from backend.models.email_outbox import EmailOutbox, EmailStatus
+from backend.models.image_job import ImageJob, ImageJobStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProbeResult:
+    """Résultat d'une sonde de base de données"""
+    database: str = "unknown"  # ok | error | unknown (pas encore sondé)
+    checked_at: Optional[datetime] = None
+    latency_ms: Optional[float] = None
+    pool: dict = field(default_factory=dict)
+    email_outbox_pending: Optional[int] = None
+    image_jobs_pending: Optional[int] = None
+    error: Optional[str] = None
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def pool_status(engine: Engine) -> dict:
+    """Occupation du pool de connexions (taille, connexions prises, saturation)"""
+    pool = engine.pool
+    status = {"type": type(pool).__name__}
+    if not hasattr(pool, "checkedout"):
+        # StaticPool (SQLite) : une seule connexion partagée
+        return status
+
+    capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+    checked_out = pool.checkedout()
+    status.update({
+        "size": pool.size(),
+        "checked_out": checked_out,
+        "overflow": max(pool.overflow(), 0),
+        "capacity": capacity,
+        "saturation": round(checked_out / capacity, 2) if capacity else None,
+    })
+    return status
+
+
+def probe_database() -> ProbeResult:
+    """
+    Sonde la base (appel synchrone, à exécuter hors de la boucle asyncio)
+    Les profondeurs de file utilisent les index (status, ...) des deux tables
+    """
+    engine = get_engine()
+    started = time.perf_counter()
+    try:
+        with SessionLocal() as db:
+            db.execute(text("SELECT 1"))
+            latency_ms = round((time.perf_counter() - started) * 1000, 2)
+            outbox = db.execute(
+                select(func.count(EmailOutbox.id)).where(
+                    EmailOutbox.status.in_((EmailStatus.PENDING.value, EmailStatus.SENDING.value))
+                )
+            ).scalar()
+            jobs = db.execute(
+                select(func.count(ImageJob.id)).where(
+                    ImageJob.status.in_((ImageJobStatus.PENDING.value, ImageJobStatus.RUNNING.value))
+                )
+            ).scalar()
+        return ProbeResult(
+            database="ok",
+            checked_at=datetime.utcnow(),
+            latency_ms=latency_ms,
+            pool=pool_status(engine),
+            email_outbox_pending=outbox,
+            image_jobs_pending=jobs,
+        )
+    except Exception as e:
+        logger.error(f"Database health probe failed: {e}")
+        return ProbeResult(
+            database="error",
+            checked_at=datetime.utcnow(),
+            pool=pool_status(engine),
+            error=type(e).__name__,
+        )
+
+
+# === SONDE PÉRIODIQUE ===
+
+class HealthProbe:
+    """
+    Sonde périodique dans la boucle asyncio de l'application
+    Le travail (synchrone) tourne dans un thread ; le dernier résultat est lu
+    sans entrée/sortie par /readyz et /health
+    """
+
+    def __init__(self, interval_seconds: Optional[int] = None):
+        self.interval = interval_seconds or settings.HEALTH_PROBE_INTERVAL_SECONDS
+        self.result = ProbeResult()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Démarre la sonde (dans la boucle asyncio courante)"""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Arrête la sonde"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            self.result = await asyncio.to_thread(probe_database)
+            await asyncio.sleep(self.interval)
+
+    def readiness(self, now: Optional[datetime] = None) -> tuple[bool, dict]:
+        """
+        Prêt si la dernière sonde a réussi et n'est pas trop ancienne
+
+        Returns:
+            (prêt, détail)
+        """
+        now = now or datetime.utcnow()
+        result = self.result
+        max_age = timedelta(seconds=self.interval * settings.HEALTH_PROBE_STALE_FACTOR)
+        stale = result.checked_at is None or now - result.checked_at > max_age
+
+        if result.database == "unknown":
+            status = "starting"
+        elif result.database != "ok":
+            status = "database_error"
+        elif stale:
+            status = "stale"
+        else:
+            status = "ready"
+
+        return status == "ready", {"status": status, **result.as_dict()}
+
+
+# Sonde de l'application (démarrée au startup)
+probe: Optional[HealthProbe] = None
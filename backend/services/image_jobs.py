@@ -0,0 +1,205 @@
+"""
+File de traitement des photos
+Tâches stockées en base (image_jobs), consommées par run_worker.py
+
+- Idempotence : une tâche par (voie, empreinte du fichier) ; un nouvel envoi
+  du même fichier réutilise la tâche existante.
+- Prise de tâche atomique (UPDATE ... WHERE status = 'pending') : plusieurs
+  workers peuvent tourner sans verrou applicatif, sur SQLite comme MySQL.
+- Nouvelles tentatives avec délai exponentiel ; une image illisible échoue
+  sans nouvelle tentative.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.config import settings, UPLOAD_DIR_PATH
+from backend.models.image_job import ImageJob, ImageJobStatus
+from backend.models.route import Route
+from backend.services.images import StoredImage, UploadError, make_derivatives, public_url
+
+logger = logging.getLogger(__name__)
+
+# Nombre de candidates lues à chaque tentative de prise
+CLAIM_BATCH = 10
+# Délai maximal entre deux tentatives
+MAX_RETRY_DELAY = timedelta(hours=1)
+
+
+def route_photo_key(route_id: int, digest: str) -> str:
+    """Clé d'idempotence d'une photo de voie"""
+    return f"route_photo:{route_id}:{digest}"
+
+
+# === CÔTÉ API ===
+
+def enqueue_route_photo(db: Session, route: Route, image: StoredImage) -> ImageJob:
+    """
+    Programme le traitement d'une photo de voie (commit par l'appelant)
+    Une tâche abandonnée pour le même fichier est relancée
+
+    Args:
+        db: Session de base de données
+        route: Voie concernée
+        image: Image stockée par receive_image()
+
+    Returns:
+        ImageJob nouvelle ou existante
+    """
+    key = route_photo_key(route.id, image.digest)
+    job = db.query(ImageJob).filter(ImageJob.idempotency_key == key).first()
+
+    if job is None:
+        try:
+            with db.begin_nested():
+                job = ImageJob(
+                    idempotency_key=key,
+                    user_id=route.user_id,
+                    route_id=route.id,
+                    source_path=image.path.relative_to(UPLOAD_DIR_PATH).as_posix(),
+                    max_attempts=settings.IMAGE_JOB_MAX_ATTEMPTS
+                )
+                db.add(job)
+        except IntegrityError:
+            # Même envoi traité en parallèle
+            return db.query(ImageJob).filter(ImageJob.idempotency_key == key).one()
+        return job
+
+    if job.status == ImageJobStatus.FAILED.value:
+        job.status = ImageJobStatus.PENDING.value
+        job.attempts = 0
+        job.run_after = datetime.utcnow()
+        job.last_error = None
+        job.finished_at = None
+    return job
+
+
+def latest_route_job(db: Session, route_id: int) -> Optional[ImageJob]:
+    """Dernière tâche programmée pour une voie"""
+    return db.query(ImageJob).filter(
+        ImageJob.route_id == route_id
+    ).order_by(ImageJob.id.desc()).first()
+
+
+# === CÔTÉ WORKER ===
+
+def claim_job(db: Session) -> Optional[ImageJob]:
+    """
+    Prend la prochaine tâche prête (status pending, run_after échu)
+
+    Returns:
+        ImageJob passée en "running" (commit fait), None si la file est vide
+    """
+    now = datetime.utcnow()
+    candidates = db.execute(
+        select(ImageJob.id).where(
+            ImageJob.status == ImageJobStatus.PENDING.value,
+            ImageJob.run_after <= now
+        ).order_by(ImageJob.run_after, ImageJob.id).limit(CLAIM_BATCH)
+    ).scalars().all()
+
+    for job_id in candidates:
+        claimed = db.execute(
+            update(ImageJob).where(
+                ImageJob.id == job_id,
+                ImageJob.status == ImageJobStatus.PENDING.value
+            ).values(
+                status=ImageJobStatus.RUNNING.value,
+                locked_at=now,
+                attempts=ImageJob.attempts + 1,
+                updated_at=now
+            )
+        ).rowcount
+        db.commit()
+
+        if claimed:
+            return db.get(ImageJob, job_id)
+
+    return None
+
+
+def requeue_stale_jobs(db: Session) -> int:
+    """
+    Remet en file les tâches "running" abandonnées (worker arrêté en cours de traitement)
+
+    Returns:
+        Nombre de tâches remises en file
+    """
+    limit = datetime.utcnow() - timedelta(minutes=settings.IMAGE_JOB_TIMEOUT_MINUTES)
+    count = db.execute(
+        update(ImageJob).where(
+            ImageJob.status == ImageJobStatus.RUNNING.value,
+            ImageJob.locked_at < limit
+        ).values(status=ImageJobStatus.PENDING.value, locked_at=None)
+    ).rowcount
+    db.commit()
+    return count
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    """Délai exponentiel avant la tentative suivante"""
+    delay = timedelta(seconds=settings.IMAGE_JOB_RETRY_SECONDS * 2 ** max(attempts - 1, 0))
+    return min(delay, MAX_RETRY_DELAY)
+
+
+def _finish(job: ImageJob, job_status: ImageJobStatus, error: Optional[str] = None):
+    """Termine une tâche (succès ou abandon)"""
+    job.status = job_status.value
+    job.locked_at = None
+    job.last_error = error
+    job.finished_at = datetime.utcnow()
+
+
+def run_job(db: Session, job: ImageJob) -> str:
+    """
+    Exécute une tâche prise par claim_job() puis commit
+
+    - Génère les dérivés (EXIF appliqué puis retiré, réencodage WebP)
+    - Met à jour Route.photo_url si la tâche est la plus récente de la voie
+      (un envoi plus récent n'est pas écrasé par un traitement plus lent)
+
+    Returns:
+        Nouvel état de la tâche
+    """
+    source = UPLOAD_DIR_PATH / job.source_path
+
+    try:
+        derivatives = make_derivatives(str(source))
+    except UploadError as e:
+        # Image illisible : inutile de réessayer
+        _finish(job, ImageJobStatus.FAILED, str(e))
+        other_jobs = db.query(func.count(ImageJob.id)).filter(
+            ImageJob.source_path == job.source_path,
+            ImageJob.id != job.id
+        ).scalar()
+        if not other_jobs:
+            source.unlink(missing_ok=True)
+        db.commit()
+        return job.status
+    except Exception as e:
+        logger.warning(f"Image job {job.id} failed (attempt {job.attempts}): {e}")
+        if job.attempts >= job.max_attempts:
+            _finish(job, ImageJobStatus.FAILED, str(e))
+        else:
+            job.status = ImageJobStatus.PENDING.value
+            job.locked_at = None
+            job.last_error = str(e)
+            job.run_after = datetime.utcnow() + _retry_delay(job.attempts)
+        db.commit()
+        return job.status
+
+    latest = latest_route_job(db, job.route_id)
+    route = db.get(Route, job.route_id)
+    if route is not None and latest is not None and latest.id == job.id:
+        route.photo_url = public_url(Path(derivatives["medium"]))
+        route.updated_at = datetime.utcnow()
+
+    _finish(job, ImageJobStatus.DONE)
+    db.commit()
+    return job.status
@@ -0,0 +1,293 @@
+"""
+Pipeline photos
+Upload multipart en streaming, stockage adressé par contenu, dérivés Pillow
+
+- Le corps de la requête est lu morceau par morceau : la taille maximale est
+  vérifiée pendant la lecture, le fichier est écrit avec aiofiles et haché
+  (SHA-256) au fil de l'eau.
+- Le fichier est stocké sous son empreinte : un doublon ne coûte ni écriture
+  ni traitement.
+- Les redimensionnements (vignette, moyen, WebP) sont faits par le worker de
+  la file image_jobs (run_worker.py), hors des workers HTTP.
+"""
+
+import hashlib
+import logging
+import os
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import aiofiles
+from fastapi import Request
+from multipart.multipart import MultipartParser, parse_options_header
+
+from backend.config import settings, get_upload_path, is_allowed_image, UPLOAD_DIR_PATH
+
+logger = logging.getLogger(__name__)
+
+# === DÉRIVÉS ===
+# Nom -> taille max (px, plus grand côté), None = taille d'origine
+DERIVATIVES = {
+    "thumb": 320,
+    "medium": 1280,
+    "full": None,
+}
+WEBP_QUALITY = 82
+
+
+# === ERREURS ===
+
+class UploadError(ValueError):
+    """Upload refusé (requête invalide)"""
+
+
+class UploadTooLarge(UploadError):
+    """Fichier plus gros que MAX_UPLOAD_SIZE_MB"""
+
+
+# === STOCKAGE ===
+
+@dataclass
+class StoredImage:
+    """Image originale stockée sous son empreinte"""
+    digest: str
+    extension: str
+    path: Path
+    size: int
+    deduplicated: bool  # True si le fichier existait déjà
+
+    def derivative_path(self, name: str) -> Path:
+        """Chemin d'un dérivé WebP"""
+        return derivative_path(self.path, name)
+
+
+def derivative_path(original: Path, name: str) -> Path:
+    """Chemin d'un dérivé WebP à côté de l'original (ex: <hash>_thumb.webp)"""
+    return original.with_name(f"{original.stem}_{name}.webp")
+
+
+def public_url(path: Path) -> str:
+    """
+    URL publique d'un fichier du dossier d'upload
+    (public_html/uploads est servi sous /uploads)
+    """
+    return "/uploads/" + path.relative_to(UPLOAD_DIR_PATH).as_posix()
+
+
+class MultipartEvents:
+    """
+    Adaptateur python-multipart : les callbacks synchrones sont mis en file
+    puis consommés de façon asynchrone (écriture aiofiles)
+    """
+
+    def __init__(self, boundary: bytes):
+        self.events: list[tuple] = []
+        self._headers: dict[bytes, bytes] = {}
+        self._header_field = b""
+        self._header_value = b""
+        self.parser = MultipartParser(boundary, {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        })
+
+    def _on_part_begin(self):
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int):
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def _on_header_end(self):
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self):
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode("utf-8", "replace")
+        filename = options.get(b"filename")
+        self.events.append(("part", name, filename.decode("utf-8", "replace") if filename else None))
+
+    def _on_part_data(self, data: bytes, start: int, end: int):
+        self.events.append(("data", data[start:end]))
+
+    def _on_part_end(self):
+        self.events.append(("end",))
+
+
+async def receive_image(request: Request, user_id: int, field: str = "file") -> StoredImage:
+    """
+    Lit un upload multipart en streaming et stocke l'image sous son empreinte
+
+    Args:
+        request: Requête FastAPI (corps multipart/form-data non lu)
+        user_id: ID du propriétaire
+        field: Nom du champ fichier
+
+    Returns:
+        StoredImage
+
+    Raises:
+        UploadTooLarge: Si la taille dépasse MAX_UPLOAD_SIZE_MB
+        UploadError: Si la requête ou le fichier est invalide
+    """
+    max_size = settings.MAX_UPLOAD_SIZE_BYTES
+
+    # Refus immédiat si la taille annoncée est déjà trop grande
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_size + 64 * 1024:
+        raise UploadTooLarge(f"File too large (max {settings.MAX_UPLOAD_SIZE_MB} MB)")
+
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in options:
+        raise UploadError("Expected multipart/form-data")
+
+    upload_dir = get_upload_path(user_id, "routes")
+    temp_path = upload_dir / f".{uuid.uuid4().hex}.part"
+    events = MultipartEvents(options[b"boundary"])
+    hasher = hashlib.sha256()
+    filename: Optional[str] = None
+    in_file = False
+    done = False
+    size = 0
+    out = None
+
+    try:
+        async for chunk in request.stream():
+            events.parser.write(chunk)
+
+            for event in events.events:
+                if event[0] == "part":
+                    in_file = not done and event[1] == field and bool(event[2])
+                    if in_file:
+                        filename = event[2]
+                        if not is_allowed_image(filename):
+                            raise UploadError(
+                                f"Extension not allowed ({settings.ALLOWED_IMAGE_EXTENSIONS})"
+                            )
+                        out = await aiofiles.open(temp_path, "wb")
+
+                elif event[0] == "data" and in_file:
+                    size += len(event[1])
+                    if size > max_size:
+                        raise UploadTooLarge(f"File too large (max {settings.MAX_UPLOAD_SIZE_MB} MB)")
+                    hasher.update(event[1])
+                    await out.write(event[1])
+
+                elif event[0] == "end" and in_file:
+                    await out.close()
+                    out = None
+                    in_file = False
+                    done = True
+
+            events.events.clear()
+
+        events.parser.finalize()
+
+        if not done or size == 0:
+            raise UploadError(f"Missing file field '{field}'")
+
+    except BaseException:
+        if out is not None:
+            await out.close()
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    digest = hasher.hexdigest()
+    extension = filename.rsplit(".", 1)[1].lower()
+    final_path = upload_dir / f"{digest}.{extension}"
+
+    if final_path.exists():
+        # Doublon : même contenu déjà stocké
+        temp_path.unlink(missing_ok=True)
+        return StoredImage(digest, extension, final_path, size, deduplicated=True)
+
+    os.replace(temp_path, final_path)
+    return StoredImage(digest, extension, final_path, size, deduplicated=False)
+
+
+# === DÉRIVÉS ===
+
+def make_derivatives(source: str) -> dict:
+    """
+    Génère les dérivés WebP d'une image (exécuté par le worker)
+    Orientation EXIF appliquée, métadonnées non recopiées
+
+    Args:
+        source: Chemin de l'image originale
+
+    Returns:
+        dict {nom du dérivé: chemin}
+
+    Raises:
+        UploadError: Si le fichier n'est pas une image lisible
+    """
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    source_path = Path(source)
+    targets = {name: derivative_path(source_path, name) for name in DERIVATIVES}
+    missing = {name: path for name, path in targets.items() if not path.exists()}
+    if not missing:
+        return {name: str(path) for name, path in targets.items()}
+
+    try:
+        with Image.open(source_path) as image:
+            image = ImageOps.exif_transpose(image)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+            for name, path in missing.items():
+                max_side = DERIVATIVES[name]
+                derivative = image.copy()
+                if max_side:
+                    derivative.thumbnail((max_side, max_side), Image.LANCZOS)
+
+                temp = path.with_name(f".{path.name}.{os.getpid()}")
+                derivative.save(temp, "WEBP", quality=WEBP_QUALITY, method=4)
+                os.replace(temp, path)
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+        raise UploadError("Invalid image file")
+
+    return {name: str(path) for name, path in targets.items()}
+
+
+def ready_derivatives(source: Path) -> Optional[dict]:
+    """
+    Dérivés déjà générés pour un original (doublon)
+
+    Returns:
+        dict {nom du dérivé: chemin} si tous existent, None sinon
+    """
+    targets = {name: derivative_path(source, name) for name in DERIVATIVES}
+    if all(path.exists() for path in targets.values()):
+        return {name: str(path) for name, path in targets.items()}
+    return None
+
+
+def check_image(image: StoredImage):
+    """
+    Vérifie qu'un fichier est une image lisible (en-tête seulement, pas de décodage)
+    Un fichier invalide est supprimé s'il vient d'être écrit
+
+    Raises:
+        UploadError: Si le fichier n'est pas une image reconnue
+    """
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        with Image.open(image.path) as opened:
+            if not opened.format:
+                raise UploadError("Invalid image file")
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+        if not image.deduplicated:
+            image.path.unlink(missing_ok=True)
+        raise UploadError("Invalid image file")
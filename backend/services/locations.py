@@ -0,0 +1,210 @@
+"""
+Lieux
+Table de dimension des lieux d'un utilisateur (salles, falaises, sorties)
+
+Le champ texte location des séances, grandes voies et sorties course est
+rattaché à un lieu par son nom normalisé ("Saint-Léger" = "saint leger").
+Les compteurs (séances, voies, mètres grimpés) sont mis à jour par deltas à
+chaque écriture, comme daily_loads : statistiques par lieu et autocomplétion
+sont des lectures de cette table, sans regroupement sur les tables d'activité.
+"""
+
+from datetime import date as date_type
+from typing import Optional
+
+from sqlalchemy import select, insert, case, and_, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.models.location import Location
+from backend.models.training_session import TrainingSession
+from backend.models.running_session import RunningSession
+from backend.models.route import Route
+from backend.services.program_catalog import normalize_words
+
+# Colonnes de compteurs
+COUNTERS = ("training_sessions", "running_sessions", "routes", "meters_climbed")
+
+
+def location_key(name: Optional[str]) -> str:
+    """Nom normalisé d'un lieu ("" si vide)"""
+    return " ".join(normalize_words(name))[:200]
+
+
+# === MISE À JOUR INCRÉMENTALE ===
+
+def apply_location(
+    db: Session,
+    user_id: int,
+    name: Optional[str],
+    day: Optional[date_type] = None,
+    **deltas: int
+):
+    """
+    Ajoute des deltas aux compteurs d'un lieu (créé si besoin)
+    Un lieu retombé à zéro n'est pas supprimé ici (cf. prune_location)
+    UPDATE atomique (col = col + delta), INSERT en savepoint en cas de course
+
+    Args:
+        db: Session de base de données (commit par l'appelant)
+        user_id: ID de l'utilisateur
+        name: Lieu saisi (ignoré si vide)
+        day: Date de l'activité (met à jour last_date si plus récente)
+        deltas: Deltas par compteur (training_sessions, running_sessions, routes, meters_climbed)
+    """
+    key = location_key(name)
+    if not key:
+        return
+
+    values = {getattr(Location, column): getattr(Location, column) + delta for column, delta in deltas.items()}
+    adding = any(delta > 0 for delta in deltas.values())
+    if adding and day is not None:
+        values[Location.last_date] = case(
+            (Location.last_date == None, day),
+            (Location.last_date < day, day),
+            else_=Location.last_date
+        )
+    row_filter = (Location.user_id == user_id, Location.name_key == key)
+
+    updated = db.query(Location).filter(*row_filter).update(values, synchronize_session=False)
+    if updated or not adding:
+        return
+
+    try:
+        with db.begin_nested():
+            db.add(Location(
+                user_id=user_id,
+                name=name.strip()[:200],
+                name_key=key,
+                last_date=day,
+                **{column: deltas.get(column, 0) for column in COUNTERS}
+            ))
+    except IntegrityError:
+        # Lieu créé entre-temps par une autre requête
+        db.query(Location).filter(*row_filter).update(values, synchronize_session=False)
+
+
+def prune_location(db: Session, user_id: int, name: Optional[str]):
+    """
+    Supprime un lieu sans plus aucune activité
+    Lors d'une modification, appelé après le +1 avec l'ancien nom : un lieu
+    inchangé n'est jamais supprimé puis recréé (id, created_at et nom conservés)
+    """
+    key = location_key(name)
+    if not key:
+        return
+
+    db.query(Location).filter(
+        Location.user_id == user_id,
+        Location.name_key == key,
+        Location.training_sessions <= 0,
+        Location.running_sessions <= 0,
+        Location.routes <= 0
+    ).delete(synchronize_session=False)
+
+
+def record_training_location(db: Session, session: TrainingSession, sign: int = 1, prune: bool = True):
+    """
+    Répercute une séance d'escalade sur son lieu
+    sign=1 à la création, -1 avant suppression/modification
+    (prune=False avant modification, puis prune_location avec l'ancien nom)
+    """
+    apply_location(db, session.user_id, session.location, session.date, training_sessions=sign)
+    if sign < 0 and prune:
+        prune_location(db, session.user_id, session.location)
+
+
+def record_running_location(db: Session, session: RunningSession, sign: int = 1, prune: bool = True):
+    """
+    Répercute une sortie course sur son lieu
+    sign=1 à la création, -1 avant suppression/modification
+    (prune=False avant modification, puis prune_location avec l'ancien nom)
+    """
+    apply_location(db, session.user_id, session.location, session.date, running_sessions=sign)
+    if sign < 0 and prune:
+        prune_location(db, session.user_id, session.location)
+
+
+def record_route_location(db: Session, route: Route, sign: int = 1, prune: bool = True):
+    """
+    Répercute une grande voie sur son lieu (nombre de voies, mètres grimpés)
+    sign=1 à la création, -1 avant suppression/modification
+    (prune=False avant modification, puis prune_location avec l'ancien nom)
+    """
+    apply_location(
+        db, route.user_id, route.location, route.date_completed,
+        routes=sign,
+        meters_climbed=sign * (route.length_m or 0)
+    )
+    if sign < 0 and prune:
+        prune_location(db, route.user_id, route.location)
+
+
+def rebuild_locations(db: Session, user_id: int) -> int:
+    """
+    Recalcule entièrement les lieux d'un utilisateur
+    Pour la reprise de l'existant ou une correction manuelle (commit par l'appelant)
+
+    Returns:
+        Nombre de lieux écrits
+    """
+    locations: dict[str, dict] = {}
+
+    def add(name, day, **deltas):
+        key = location_key(name)
+        if not key:
+            return
+        entry = locations.setdefault(key, {
+            "user_id": user_id, "name": name.strip()[:200], "name_key": key, "last_date": None,
+            **{column: 0 for column in COUNTERS}
+        })
+        for column, delta in deltas.items():
+            entry[column] += delta
+        if day is not None and (entry["last_date"] is None or day > entry["last_date"]):
+            entry["last_date"] = day
+
+    # Regroupement SQL par texte saisi, puis fusion des orthographes en Python
+    for name, count, last in db.execute(
+        select(TrainingSession.location, func.count(TrainingSession.id), func.max(TrainingSession.date))
+        .where(TrainingSession.user_id == user_id)
+        .group_by(TrainingSession.location)
+    ):
+        add(name, last, training_sessions=count)
+
+    for name, count, last in db.execute(
+        select(RunningSession.location, func.count(RunningSession.id), func.max(RunningSession.date))
+        .where(RunningSession.user_id == user_id)
+        .group_by(RunningSession.location)
+    ):
+        add(name, last, running_sessions=count)
+
+    for name, count, meters, last in db.execute(
+        select(Route.location, func.count(Route.id), func.sum(Route.length_m), func.max(Route.date_completed))
+        .where(Route.user_id == user_id)
+        .group_by(Route.location)
+    ):
+        add(name, last, routes=count, meters_climbed=int(meters or 0))
+
+    db.query(Location).filter(Location.user_id == user_id).delete(synchronize_session=False)
+    if locations:
+        db.execute(insert(Location), list(locations.values()))
+    return len(locations)
+
+
+# === LECTURE ===
+
+def autocomplete(db: Session, user_id: int, prefix: str, limit: int = 10) -> list[Location]:
+    """
+    Lieux dont le nom normalisé commence par prefix, les plus utilisés d'abord
+    Intervalle sur l'index (user_id, name_key) : pas de LIKE ni de parcours complet
+    """
+    key = location_key(prefix)
+    if not key:
+        return []
+    upper = key[:-1] + chr(ord(key[-1]) + 1)
+    usage = Location.training_sessions + Location.running_sessions + Location.routes
+
+    return db.query(Location).filter(
+        Location.user_id == user_id,
+        and_(Location.name_key >= key, Location.name_key < upper)
+    ).order_by(usage.desc(), Location.name_key).limit(limit).all()
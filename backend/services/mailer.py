@@ -0,0 +1,375 @@
+"""
+Envoi des emails
+Outbox transactionnelle + expéditeur asynchrone (aiosmtplib)
+
+- queue_email() ajoute une ligne email_outbox dans la transaction de l'appelant :
+  l'email part si et seulement si l'action est validée, sans attendre SMTP.
+- OutboxSender tourne dans la boucle asyncio de l'application : il prend les
+  emails par lots, les envoie sur une connexion SMTP réutilisée, et
+  reprogramme les échecs temporaires avec un délai exponentiel.
+- Les templates Jinja2 sont compilés une fois au démarrage (load_templates).
+- La connexion SMTP est créée par une fabrique injectable : les tests peuvent
+  utiliser un serveur SMTP local (aiosmtpd) ou un faux client.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from email.utils import formataddr, make_msgid
+from typing import Awaitable, Callable, Optional
+
+import aiosmtplib
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from backend.config import settings, EMAIL_TEMPLATES, EMAIL_TEMPLATE_DIR_PATH
+from backend.database import SessionLocal
+from backend.models.email_outbox import EmailOutbox, EmailStatus
+
+logger = logging.getLogger(__name__)
+
+# Délai maximal entre deux tentatives
+MAX_RETRY_DELAY = timedelta(hours=6)
+# Un email "sending" depuis plus longtemps est considéré abandonné
+SENDING_TIMEOUT = timedelta(minutes=10)
+
+
+# === TEMPLATES ===
+
+_templates: dict[str, tuple[Template, Template]] = {}
+
+
+def load_templates():
+    """
+    Compile tous les templates de EMAIL_TEMPLATES (HTML + texte)
+    À appeler au démarrage : une erreur de template est vue tout de suite
+    """
+    environment = Environment(
+        loader=FileSystemLoader(str(EMAIL_TEMPLATE_DIR_PATH)),
+        autoescape=select_autoescape(["html"]),
+        auto_reload=False,
+    )
+    for key, config in EMAIL_TEMPLATES.items():
+        html_name = config["template"]
+        text_name = html_name.rsplit(".", 1)[0] + ".txt"
+        _templates[key] = (environment.get_template(html_name), environment.get_template(text_name))
+    logger.info(f"{len(_templates)} templates email compilés")
+
+
+def render_email(template: str, context: dict) -> tuple[str, str, str]:
+    """
+    Rend un email
+
+    Args:
+        template: Clé de EMAIL_TEMPLATES
+        context: Variables du template
+
+    Returns:
+        (sujet, HTML, texte)
+    """
+    if not _templates:
+        load_templates()
+
+    subject = EMAIL_TEMPLATES[template]["subject"]
+    html_template, text_template = _templates[template]
+    context = {
+        "app_name": settings.APP_NAME,
+        "app_url": settings.APP_URL,
+        "subject": subject,
+        **context,
+    }
+    return subject, html_template.render(context), text_template.render(context)
+
+
+def build_message(email: EmailOutbox) -> EmailMessage:
+    """Construit le message MIME (texte + alternative HTML) d'un email de l'outbox"""
+    subject, html, text = render_email(email.template, json.loads(email.context_json or "{}"))
+
+    message = EmailMessage()
+    message["From"] = formataddr((settings.SMTP_FROM_NAME, settings.SMTP_FROM_EMAIL))
+    message["To"] = email.to_email
+    message["Subject"] = subject
+    message["Message-ID"] = make_msgid(idstring=f"outbox-{email.id}")
+    message.set_content(text)
+    message.add_alternative(html, subtype="html")
+    return message
+
+
+# === OUTBOX ===
+
+def queue_email(db: Session, template: str, to_email: str, context: dict, user_id: Optional[int] = None) -> EmailOutbox:
+    """
+    Ajoute un email à l'outbox (commit par l'appelant)
+
+    Args:
+        db: Session de base de données
+        template: Clé de EMAIL_TEMPLATES
+        to_email: Destinataire
+        context: Variables du template (sérialisables en JSON)
+        user_id: Utilisateur concerné
+
+    Returns:
+        EmailOutbox
+    """
+    if template not in EMAIL_TEMPLATES:
+        raise ValueError(f"Unknown email template: {template}")
+
+    email = EmailOutbox(
+        user_id=user_id,
+        template=template,
+        to_email=to_email,
+        context_json=json.dumps(context, default=str),
+        max_attempts=settings.EMAIL_MAX_ATTEMPTS
+    )
+    db.add(email)
+    return email
+
+
+def claim_emails(db: Session, limit: int) -> list[EmailOutbox]:
+    """
+    Prend un lot d'emails à envoyer (status pending, échéance atteinte)
+    Les emails "sending" abandonnés (expéditeur arrêté) sont repris
+
+    Returns:
+        Emails passés en "sending" (commit fait)
+    """
+    now = datetime.utcnow()
+
+    db.execute(
+        update(EmailOutbox).where(
+            EmailOutbox.status == EmailStatus.SENDING.value,
+            EmailOutbox.locked_at < now - SENDING_TIMEOUT
+        ).values(status=EmailStatus.PENDING.value, locked_at=None)
+    )
+
+    candidates = db.execute(
+        select(EmailOutbox.id).where(
+            EmailOutbox.status == EmailStatus.PENDING.value,
+            EmailOutbox.next_attempt_at <= now
+        ).order_by(EmailOutbox.next_attempt_at, EmailOutbox.id).limit(limit)
+    ).scalars().all()
+
+    claimed_ids = []
+    for email_id in candidates:
+        claimed = db.execute(
+            update(EmailOutbox).where(
+                EmailOutbox.id == email_id,
+                EmailOutbox.status == EmailStatus.PENDING.value
+            ).values(
+                status=EmailStatus.SENDING.value,
+                locked_at=now,
+                attempts=EmailOutbox.attempts + 1
+            )
+        ).rowcount
+        if claimed:
+            claimed_ids.append(email_id)
+    db.commit()
+
+    if not claimed_ids:
+        return []
+    return db.query(EmailOutbox).filter(EmailOutbox.id.in_(claimed_ids)).order_by(EmailOutbox.id).all()
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    """Délai exponentiel avant la tentative suivante"""
+    delay = timedelta(seconds=settings.EMAIL_RETRY_SECONDS * 2 ** max(attempts - 1, 0))
+    return min(delay, MAX_RETRY_DELAY)
+
+
+def record_results(db: Session, results: dict[int, Optional[tuple[bool, str]]]):
+    """
+    Enregistre le résultat d'un lot
+
+    Args:
+        results: {id: None si envoyé, sinon (définitif, erreur)}
+    """
+    now = datetime.utcnow()
+    for email in db.query(EmailOutbox).filter(EmailOutbox.id.in_(list(results))):
+        result = results[email.id]
+        email.locked_at = None
+
+        if result is None:
+            email.status = EmailStatus.SENT.value
+            email.sent_at = now
+            email.last_error = None
+            continue
+
+        permanent, error = result
+        email.last_error = error[:1000]
+        if permanent or email.attempts >= email.max_attempts:
+            email.status = EmailStatus.FAILED.value
+        else:
+            email.status = EmailStatus.PENDING.value
+            email.next_attempt_at = now + _retry_delay(email.attempts)
+    db.commit()
+
+
+# === EXPÉDITEUR ===
+
+SMTPFactory = Callable[[], Awaitable[aiosmtplib.SMTP]]
+
+
+async def default_smtp_factory() -> aiosmtplib.SMTP:
+    """Connexion SMTP depuis la configuration (TLS implicite sur 465, STARTTLS sinon)"""
+    implicit_tls = settings.SMTP_USE_TLS and settings.SMTP_PORT == 465
+    smtp = aiosmtplib.SMTP(
+        hostname=settings.SMTP_HOST,
+        port=settings.SMTP_PORT,
+        username=settings.SMTP_USERNAME or None,
+        password=settings.SMTP_PASSWORD if settings.SMTP_USERNAME else None,
+        use_tls=implicit_tls,
+        start_tls=settings.SMTP_USE_TLS and not implicit_tls,
+        timeout=settings.SMTP_TIMEOUT_SECONDS,
+    )
+    await smtp.connect()
+    return smtp
+
+
+class OutboxSender:
+    """
+    Expéditeur asynchrone de l'outbox
+    Une connexion SMTP réutilisée entre les lots, fermée après SMTP_IDLE_SECONDS
+    """
+
+    def __init__(self, smtp_factory: SMTPFactory = default_smtp_factory, session_factory=SessionLocal):
+        self.smtp_factory = smtp_factory
+        self.session_factory = session_factory
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        self._last_used = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # --- Cycle de vie ---
+
+    def start(self):
+        """Démarre la boucle d'envoi (dans la boucle asyncio courante)"""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = self._loop.create_task(self._run())
+
+    async def stop(self):
+        """Arrête la boucle et ferme la connexion SMTP"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close()
+
+    def wake(self):
+        """Demande un envoi immédiat (appelable depuis un thread du pool)"""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _run(self):
+        while True:
+            try:
+                sent = await self.send_pending()
+            except Exception as e:
+                logger.error(f"Outbox sender error: {e}", exc_info=True)
+                sent = 0
+
+            if sent:
+                # Lot plein : il reste peut-être des emails
+                continue
+
+            if self._smtp is not None and self._loop.time() - self._last_used > settings.SMTP_IDLE_SECONDS:
+                await self._close()
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.EMAIL_OUTBOX_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    # --- Connexion ---
+
+    async def _connection(self) -> aiosmtplib.SMTP:
+        if self._smtp is None or not self._smtp.is_connected:
+            self._smtp = await self.smtp_factory()
+        return self._smtp
+
+    async def _close(self):
+        if self._smtp is not None:
+            try:
+                await self._smtp.quit()
+            except Exception:
+                self._smtp.close()
+            self._smtp = None
+
+    # --- Envoi ---
+
+    async def send_pending(self) -> int:
+        """
+        Envoie un lot d'emails
+
+        Returns:
+            Nombre d'emails traités si le lot était plein (0 sinon : file vide)
+        """
+        limit = settings.EMAIL_OUTBOX_BATCH_SIZE
+        emails = await asyncio.to_thread(self._claim, limit)
+        if not emails:
+            return 0
+
+        results = {}
+        for email in emails:
+            results[email.id] = await self._send_one(email)
+        self._last_used = asyncio.get_running_loop().time()
+
+        await asyncio.to_thread(self._record, results)
+        return len(emails) if len(emails) == limit else 0
+
+    async def _send_one(self, email: EmailOutbox) -> Optional[tuple[bool, str]]:
+        try:
+            message = build_message(email)
+        except Exception as e:
+            # Template ou contexte invalide : réessayer ne changera rien
+            return True, f"Render error: {e}"
+
+        try:
+            smtp = await self._connection()
+            await smtp.send_message(message)
+            return None
+        except (aiosmtplib.SMTPRecipientsRefused, aiosmtplib.SMTPSenderRefused) as e:
+            return True, str(e)
+        except aiosmtplib.SMTPResponseException as e:
+            # 5xx : rejet définitif, 4xx : temporaire
+            if e.code >= 500:
+                return True, str(e)
+            return False, str(e)
+        except Exception as e:
+            # Connexion perdue ou serveur injoignable : nouvelle connexion au prochain envoi
+            await self._close()
+            return False, str(e) or e.__class__.__name__
+
+    def _claim(self, limit: int) -> list[EmailOutbox]:
+        db = self.session_factory()
+        try:
+            emails = claim_emails(db, limit)
+            db.expunge_all()
+            return emails
+        finally:
+            db.close()
+
+    def _record(self, results: dict):
+        db = self.session_factory()
+        try:
+            record_results(db, results)
+        finally:
+            db.close()
+
+
+# Expéditeur de l'application (démarré au startup si SMTP_ENABLED)
+sender: Optional[OutboxSender] = None
+
+
+def notify_outbox():
+    """Réveille l'expéditeur après un commit contenant des emails"""
+    if sender is not None:
+        sender.wake()
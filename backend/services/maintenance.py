@@ -0,0 +1,159 @@
+"""
+Maintenance de la base
+Purge des lignes expirées (tokens d'authentification, refresh tokens, cache de statistiques)
+
+Les suppressions se font par lots bornés sur l'index expires_at : chaque lot
+est une transaction courte (sélection des IDs, DELETE par clé primaire), les
+verrous ne sont jamais tenus longtemps, même sur une grosse table.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select, delete, func
+from sqlalchemy.orm import Session
+
+from backend.config import settings
+from backend.database import SessionLocal
+from backend.models.password_reset import PasswordResetToken
+from backend.models.email_verification import EmailVerificationToken
+from backend.models.stats_cache import StatsCache
+from backend.models.refresh_token import RefreshToken
+
+logger = logging.getLogger(__name__)
+
+# Tables purgées (modèle avec une colonne expires_at indexée)
+EXPIRING_MODELS = (PasswordResetToken, EmailVerificationToken, RefreshToken, StatsCache)
+
+
+def purge_expired(
+    db: Session,
+    model,
+    now: Optional[datetime] = None,
+    batch_size: Optional[int] = None,
+    pause: float = 0.0
+) -> int:
+    """
+    Supprime les lignes expirées d'une table, par lots (un commit par lot)
+
+    Args:
+        db: Session de base de données
+        model: Modèle avec une colonne expires_at
+        now: Date de référence (par défaut maintenant)
+        batch_size: Taille des lots (par défaut MAINTENANCE_BATCH_SIZE)
+        pause: Pause entre deux lots (secondes), pour laisser passer les écritures
+
+    Returns:
+        Nombre de lignes supprimées
+    """
+    now = now or datetime.utcnow()
+    batch_size = batch_size or settings.MAINTENANCE_BATCH_SIZE
+    total = 0
+
+    while True:
+        ids = db.execute(
+            select(model.id)
+            .where(model.expires_at < now)
+            .order_by(model.expires_at)
+            .limit(batch_size)
+        ).scalars().all()
+
+        if not ids:
+            break
+
+        total += db.execute(
+            delete(model).where(model.id.in_(ids)).execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+
+        if len(ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    return total
+
+
+def count_expired(db: Session, model, now: Optional[datetime] = None) -> int:
+    """Nombre de lignes expirées d'une table (simulation)"""
+    now = now or datetime.utcnow()
+    return db.execute(select(func.count(model.id)).where(model.expires_at < now)).scalar()
+
+
+def sweep_expired(db: Optional[Session] = None, batch_size: Optional[int] = None, pause: float = 0.0) -> dict:
+    """
+    Purge toutes les tables à expiration
+
+    Args:
+        db: Session (une session dédiée est ouverte si absente)
+        batch_size: Taille des lots
+        pause: Pause entre deux lots (secondes)
+
+    Returns:
+        dict {nom de table: lignes supprimées}
+    """
+    own_session = db is None
+    db = db or SessionLocal()
+    now = datetime.utcnow()
+    reclaimed = {}
+
+    try:
+        for model in EXPIRING_MODELS:
+            reclaimed[model.__tablename__] = purge_expired(db, model, now, batch_size, pause)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        if own_session:
+            db.close()
+
+    total = sum(reclaimed.values())
+    if total:
+        logger.info(f"Purge des lignes expirées : {total} ({reclaimed})")
+    return reclaimed
+
+
+# === TÂCHE PÉRIODIQUE ===
+
+class MaintenanceTask:
+    """
+    Purge périodique dans la boucle asyncio de l'application
+    Le travail (synchrone) tourne dans un thread ; plusieurs workers peuvent
+    exécuter la tâche en parallèle sans conflit (suppressions idempotentes)
+    """
+
+    def __init__(self, interval_minutes: Optional[int] = None):
+        self.interval = (interval_minutes or settings.MAINTENANCE_INTERVAL_MINUTES) * 60
+        self._task: Optional[asyncio.Task] = None
+        self.last_run: Optional[datetime] = None
+        self.last_result: dict = {}
+
+    def start(self):
+        """Démarre la tâche (dans la boucle asyncio courante)"""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Arrête la tâche"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                self.last_result = await asyncio.to_thread(sweep_expired)
+                self.last_run = datetime.utcnow()
+            except Exception as e:
+                logger.error(f"Maintenance error: {e}", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+
+# Tâche de l'application (démarrée au startup si MAINTENANCE_ENABLED)
+task: Optional[MaintenanceTask] = None
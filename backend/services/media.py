@@ -0,0 +1,284 @@
+"""
+Service des médias
+URLs signées à expiration, requêtes Range et conditionnelles, cache long
+
+- Le contrôle d'accès se fait par signature HMAC de l'URL (pas de requête
+  base par image) : l'API signe les chemins de l'utilisateur connecté.
+- L'expiration est arrondie à une fenêtre : la même URL est renvoyée pendant
+  toute la fenêtre, le cache navigateur reste efficace.
+- Les fichiers nommés par empreinte (SHA-256) ne changent jamais : réponse
+  immutable. Les autres sont revalidés par ETag / Last-Modified.
+- Si MEDIA_SENDFILE_HEADER est défini, le fichier est délégué au serveur web
+  frontal (sendfile, zero-copy) : l'application ne fait que vérifier l'accès.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+import re
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path, PurePosixPath
+from typing import Optional
+from urllib.parse import quote
+
+import anyio
+from fastapi import Request, status
+from fastapi.responses import FileResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from backend.config import settings, UPLOAD_DIR_PATH
+
+# Préfixe des URLs publiques stockées en base (ex: Route.photo_url)
+UPLOADS_PREFIX = "/uploads/"
+# Préfixe des URLs servies par l'API
+MEDIA_PREFIX = "/api/media/"
+
+CHUNK_SIZE = 64 * 1024
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+# Nom adressé par contenu : <sha256>.<ext> ou <sha256>_<dérivé>.webp
+HASHED_NAME = re.compile(r"^[0-9a-f]{64}(_[a-z]+)?\.[a-z0-9]+$")
+RANGE_HEADER = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class MediaError(ValueError):
+    """Chemin de média invalide"""
+
+
+# === SIGNATURE ===
+
+def _signature(path: str, expires: int) -> str:
+    """Signature HMAC-SHA256 (tronquée, base64 URL) d'un chemin et d'une expiration"""
+    key = hashlib.sha256(b"media:" + settings.SECRET_KEY.encode()).digest()
+    digest = hmac.new(key, f"{path}:{expires}".encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest[:18]).decode()
+
+
+def normalize_media_path(path: str) -> str:
+    """
+    Normalise un chemin de média relatif au dossier d'upload
+    Accepte aussi une URL publique (/uploads/...) ou une URL de l'API
+
+    Raises:
+        MediaError: Si le chemin sort du dossier d'upload
+    """
+    for prefix in (MEDIA_PREFIX, UPLOADS_PREFIX):
+        if path.startswith(prefix):
+            path = path[len(prefix):]
+            break
+
+    path = path.split("?", 1)[0]
+    parts = PurePosixPath(path.lstrip("/")).parts
+    if not parts or any(part in ("..", ".") or part.startswith(".") for part in parts):
+        raise MediaError("Invalid media path")
+    return "/".join(parts)
+
+
+def media_owner_id(path: str) -> Optional[int]:
+    """ID du propriétaire d'après le chemin (<type>/user_<id>/<fichier>)"""
+    parts = path.split("/")
+    if len(parts) < 3 or not parts[1].startswith("user_"):
+        return None
+    owner = parts[1][len("user_"):]
+    return int(owner) if owner.isdigit() else None
+
+
+def sign_media_path(path: str, now: Optional[float] = None) -> str:
+    """
+    URL signée d'un média
+
+    L'expiration est arrondie à la fin de la fenêtre suivante : l'URL est
+    valable entre 1 et 2 fois MEDIA_URL_EXPIRE_MINUTES et reste identique
+    pendant toute une fenêtre.
+
+    Args:
+        path: Chemin relatif au dossier d'upload (normalisé)
+        now: Horodatage courant (tests)
+
+    Returns:
+        URL /api/media/<chemin>?expires=...&signature=...
+    """
+    window = max(settings.MEDIA_URL_EXPIRE_MINUTES, 1) * 60
+    now = time.time() if now is None else now
+    expires = (int(now) // window + 2) * window
+    return f"{MEDIA_PREFIX}{quote(path)}?expires={expires}&signature={_signature(path, expires)}"
+
+
+def verify_media_signature(path: str, expires: int, signature: str, now: Optional[float] = None) -> bool:
+    """Vérifie la signature et l'expiration d'une URL de média (comparaison à temps constant)"""
+    now = time.time() if now is None else now
+    if expires < now:
+        return False
+    return hmac.compare_digest(_signature(path, expires), signature)
+
+
+def resolve_media_file(path: str) -> Path:
+    """
+    Chemin disque d'un média
+
+    Raises:
+        MediaError: Si le fichier n'existe pas ou sort du dossier d'upload
+    """
+    root = UPLOAD_DIR_PATH.resolve()
+    full_path = (root / path).resolve()
+    if root not in full_path.parents or not full_path.is_file():
+        raise MediaError("Media not found")
+    return full_path
+
+
+# === RÉPONSES ===
+
+def _cache_headers(full_path: Path, stat_result: os.stat_result, expires: int) -> dict:
+    """ETag, Last-Modified et Cache-Control d'un fichier"""
+    if HASHED_NAME.match(full_path.name):
+        # Le nom est l'empreinte du contenu : ETag fort et contenu immuable.
+        # L'URL porte son expiration : le cache ne peut pas dépasser son accès.
+        etag = f'"{full_path.stem}"'
+        max_age = min(IMMUTABLE_MAX_AGE, max(expires - int(time.time()), 0))
+        cache_control = f"private, max-age={max_age}, immutable"
+    else:
+        etag_base = f"{stat_result.st_mtime}-{stat_result.st_size}"
+        etag = f'"{hashlib.md5(etag_base.encode(), usedforsecurity=False).hexdigest()}"'
+        cache_control = "private, no-cache"
+
+    return {
+        "etag": etag,
+        "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "cache-control": cache_control,
+        "accept-ranges": "bytes",
+    }
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Comparaison faible If-None-Match / If-Range"""
+    if header.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return etag in candidates
+
+
+def _is_not_modified(request: Request, headers: dict, stat_result: os.stat_result) -> bool:
+    """Requête conditionnelle satisfaite (If-None-Match prioritaire sur If-Modified-Since)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, headers["etag"])
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(stat_result.st_mtime) <= since
+    return False
+
+
+def _parse_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """
+    Analyse un en-tête Range à plage unique
+
+    Returns:
+        (début, fin incluse), None si l'en-tête est ignoré (plages multiples,
+        syntaxe inconnue) : le fichier complet est alors renvoyé
+
+    Raises:
+        MediaError: Si la plage n'est pas satisfiable
+    """
+    match = RANGE_HEADER.match(header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+
+    start, end = match.groups()
+    if start == "":
+        # Suffixe : les N derniers octets
+        length = int(end)
+        if length == 0:
+            raise MediaError("Range not satisfiable")
+        return max(size - length, 0), size - 1
+
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        raise MediaError("Range not satisfiable")
+    return start, end
+
+
+class _FileRangeResponse(Response):
+    """Réponse 206 : envoie une plage d'octets d'un fichier par morceaux"""
+
+    def __init__(self, path: Path, start: int, end: int, headers: dict, media_type: Optional[str]):
+        super().__init__(status_code=status.HTTP_206_PARTIAL_CONTENT, headers=headers, media_type=media_type)
+        self.path = path
+        self.start = start
+        self.end = end
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope["method"].upper() == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        remaining = self.end - self.start + 1
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            await file.seek(self.start)
+            while remaining > 0:
+                chunk = await file.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+        if remaining > 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def media_response(request: Request, path: str, expires: int) -> Response:
+    """
+    Réponse HTTP d'un média (accès déjà vérifié)
+
+    - 304 si la requête conditionnelle est satisfaite
+    - Délégation au serveur web si MEDIA_SENDFILE_HEADER est défini
+    - 206 pour une plage (Range, If-Range respecté), 416 si non satisfiable
+    - 200 sinon (FileResponse)
+
+    Raises:
+        MediaError: Si le fichier n'existe pas
+    """
+    full_path = resolve_media_file(path)
+    stat_result = full_path.stat()
+    headers = _cache_headers(full_path, stat_result, expires)
+
+    if _is_not_modified(request, headers, stat_result):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    media_type = FileResponse(full_path, stat_result=stat_result).media_type
+
+    if settings.MEDIA_SENDFILE_HEADER:
+        # Le serveur frontal sert le fichier (sendfile, Range) depuis sa location interne
+        if settings.MEDIA_SENDFILE_HEADER.lower() == "x-sendfile":
+            headers[settings.MEDIA_SENDFILE_HEADER] = str(full_path)
+        else:
+            headers[settings.MEDIA_SENDFILE_HEADER] = settings.MEDIA_SENDFILE_PREFIX + quote(path)
+        return Response(headers=headers, media_type=media_type)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or _etag_matches(if_range, headers["etag"])
+                         or if_range == headers["last-modified"]):
+        size = stat_result.st_size
+        try:
+            byte_range = _parse_range(range_header, size)
+        except MediaError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"content-range": f"bytes */{size}", **headers}
+            )
+
+        if byte_range is not None:
+            start, end = byte_range
+            headers["content-range"] = f"bytes {start}-{end}/{size}"
+            headers["content-length"] = str(end - start + 1)
+            return _FileRangeResponse(full_path, start, end, headers, media_type)
+
+    return FileResponse(full_path, stat_result=stat_result, headers=headers, media_type=media_type)
@@ -0,0 +1,187 @@
+"""
+Catalogue des programmes publics
+Cache partagé par tout le processus : le catalogue est identique pour tous
+les utilisateurs, il est lu une fois en base puis servi depuis la mémoire.
+
+- Invalidation par version : toute écriture sur un programme public
+  (création, modification, suppression) incrémente la version, le prochain
+  appel recharge le catalogue.
+- Les autres workers ne voient pas l'incrément : le cache expire aussi après
+  PROGRAM_CATALOG_CACHE_SECONDS. Les compteurs de copies (popularité) ne
+  déclenchent pas d'invalidation, ils sont rafraîchis à l'expiration.
+- Les pages déjà rendues (JSON) sont gardées pour la version courante.
+"""
+
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Optional
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.config import settings
+from backend.models.program import Program
+from backend.models.user import User
+
+# Ordres de tri disponibles
+SORTS = ("popular", "recent", "name")
+
+# Pages rendues gardées par version
+MAX_CACHED_PAGES = 256
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_words(text: Optional[str]) -> list[str]:
+    """Mots en minuscules, sans accents ("Préparation DE" -> ["preparation", "de"])"""
+    if not text:
+        return []
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return _WORD_RE.findall(text)
+
+
+def _matches(terms: list[str], words: tuple[str, ...]) -> int:
+    """Nombre de termes trouvés en préfixe d'un mot"""
+    return sum(1 for term in terms if any(word.startswith(term) for word in words))
+
+
+class ProgramCatalog:
+    """Catalogue public en mémoire (thread-safe)"""
+
+    def __init__(self, ttl_seconds: Optional[int] = None):
+        self.ttl = settings.PROGRAM_CATALOG_CACHE_SECONDS if ttl_seconds is None else ttl_seconds
+        self._lock = threading.Lock()
+        self._version = 0
+        self._loaded_version = -1
+        self._loaded_at = 0.0
+        self._entries: list[dict] = []
+        self._pages: OrderedDict[tuple, bytes] = OrderedDict()
+
+    def invalidate(self):
+        """Le catalogue a changé : rechargement au prochain appel"""
+        with self._lock:
+            self._version += 1
+
+    def _fresh(self) -> bool:
+        return self._loaded_version == self._version and time.monotonic() - self._loaded_at < self.ttl
+
+    def _load(self, db: Session) -> list[dict]:
+        """Lit tous les programmes publics (une requête, sans la structure)"""
+        rows = db.execute(
+            select(
+                Program.id,
+                Program.name,
+                Program.description,
+                Program.duration_weeks,
+                Program.copy_count,
+                Program.created_at,
+                Program.updated_at,
+                User.username,
+            )
+            .join(User, User.id == Program.user_id)
+            .where(Program.is_public == True, User.is_active == True)
+        ).all()
+
+        entries = []
+        for row in rows:
+            name_words = tuple(normalize_words(row.name))
+            entries.append({
+                "item": {
+                    "id": row.id,
+                    "name": row.name,
+                    "description": row.description,
+                    "duration_weeks": row.duration_weeks,
+                    "copy_count": row.copy_count or 0,
+                    "author": row.username,
+                    "created_at": row.created_at,
+                    "updated_at": row.updated_at,
+                },
+                "name_key": " ".join(name_words),
+                "name_words": name_words,
+                "words": name_words + tuple(normalize_words(row.description)),
+            })
+        return entries
+
+    def _snapshot(self, db: Session) -> list[dict]:
+        with self._lock:
+            if self._fresh():
+                return self._entries
+            version = self._version
+
+        entries = self._load(db)
+
+        with self._lock:
+            # Invalidé pendant le chargement : résultat servi mais pas gardé
+            if self._version == version:
+                self._entries = entries
+                self._loaded_version = version
+                self._loaded_at = time.monotonic()
+                self._pages.clear()
+        return entries
+
+    def search(self, db: Session, q: Optional[str], sort: str, skip: int, limit: int) -> bytes:
+        """
+        Page du catalogue, rendue en JSON
+
+        Args:
+            db: Session (utilisée seulement si le cache doit être rechargé)
+            q: Recherche (tous les termes, en préfixe, sur le nom et la description)
+            sort: popular, recent ou name (pertinence d'abord si q)
+            skip: Décalage
+            limit: Taille de page
+
+        Returns:
+            JSON {"items": [...], "total": n}
+        """
+        terms = normalize_words(q)
+        key = (tuple(terms), sort, skip, limit)
+
+        with self._lock:
+            if self._fresh() and key in self._pages:
+                self._pages.move_to_end(key)
+                return self._pages[key]
+
+        entries = self._snapshot(db)
+
+        if sort == "recent":
+            order = lambda e: (e["item"]["created_at"], e["item"]["id"])
+        elif sort == "name":
+            order = lambda e: (e["name_key"], -e["item"]["id"])
+        else:
+            order = lambda e: (e["item"]["copy_count"], e["item"]["id"])
+        reverse = sort != "name"
+
+        if terms:
+            scored = []
+            for entry in entries:
+                if _matches(terms, entry["words"]) == len(terms):
+                    scored.append((_matches(terms, entry["name_words"]), entry))
+            if reverse:
+                scored.sort(key=lambda s: (s[0], order(s[1])), reverse=True)
+            else:
+                scored.sort(key=lambda s: order(s[1]))
+                scored.sort(key=lambda s: s[0], reverse=True)
+            matched = [entry for _, entry in scored]
+        else:
+            matched = sorted(entries, key=order, reverse=reverse)
+
+        body = orjson.dumps({
+            "items": [entry["item"] for entry in matched[skip:skip + limit]],
+            "total": len(matched),
+        })
+
+        with self._lock:
+            if self._fresh():
+                self._pages[key] = body
+                while len(self._pages) > MAX_CACHED_PAGES:
+                    self._pages.popitem(last=False)
+        return body
+
+
+# Catalogue partagé du processus
+catalog = ProgramCatalog()
@@ -0,0 +1,211 @@
+"""
+Moteur de progression
+Pyramide, cotation max glissante, ratios à vue / après travail, série hebdomadaire
+
+Une seule requête (UNION ALL grandes voies + voies de séance) ramène des
+colonnes compactes (jour, rang de cotation, style) ; tous les calculs sont
+vectorisés avec NumPy.
+"""
+
+from dataclasses import dataclass
+from datetime import date as date_type
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import select, union_all, literal
+from sqlalchemy.orm import Session
+
+from backend.models.route import Route
+from backend.models.session_climb import SessionClimb
+from backend.services.grades import FRENCH_GRADES, grade_to_rank, rank_to_grade
+
+
+# === CODES DE STYLE ===
+STYLE_ONSIGHT = 0
+STYLE_FLASH = 1
+STYLE_REDPOINT = 2
+STYLE_PROJECT = 3
+STYLE_UNKNOWN = 4
+
+STYLE_CODES = {
+    "onsight": STYLE_ONSIGHT,
+    "flash": STYLE_FLASH,
+    "redpoint": STYLE_REDPOINT,
+    "project": STYLE_PROJECT,
+}
+
+# === SOURCES ===
+SOURCE_ROUTE = 0  # Grande voie
+SOURCE_SESSION = 1  # Voie grimpée en séance
+
+
+@dataclass
+class ClimbArrays:
+    """Colonnes compactes des voies d'un utilisateur"""
+    days: np.ndarray  # Date en ordinal (int32)
+    ranks: np.ndarray  # Rang de cotation, 0 si inconnue (int16)
+    styles: np.ndarray  # Code de style (int8)
+    sources: np.ndarray  # SOURCE_ROUTE ou SOURCE_SESSION (int8)
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+
+def _encode(values: list, mapper, dtype) -> np.ndarray:
+    """
+    Encode une colonne de chaînes en entiers
+    Le mapper n'est appelé qu'une fois par valeur distincte (np.unique)
+    """
+    if not values:
+        return np.zeros(0, dtype=dtype)
+
+    uniques, inverse = np.unique(np.array(values, dtype=object), return_inverse=True)
+    lookup = np.array([mapper(value) for value in uniques], dtype=dtype)
+    return lookup[inverse]
+
+
+def load_climb_arrays(
+    db: Session,
+    user_id: int,
+    date_from: Optional[date_type] = None,
+    date_to: Optional[date_type] = None
+) -> ClimbArrays:
+    """
+    Charge toutes les voies datées d'un utilisateur en une requête
+
+    Args:
+        db: Session de base de données
+        user_id: ID de l'utilisateur
+        date_from: Date de début (optionnelle)
+        date_to: Date de fin (optionnelle)
+
+    Returns:
+        ClimbArrays triées par date
+    """
+    routes_query = select(
+        Route.date_completed.label("date"),
+        Route.grade.label("grade"),
+        Route.style.label("style"),
+        literal(SOURCE_ROUTE).label("source")
+    ).where(Route.user_id == user_id, Route.date_completed != None)
+
+    climbs_query = select(
+        SessionClimb.date,
+        SessionClimb.grade,
+        SessionClimb.style,
+        literal(SOURCE_SESSION)
+    ).where(SessionClimb.user_id == user_id)
+
+    if date_from:
+        routes_query = routes_query.where(Route.date_completed >= date_from)
+        climbs_query = climbs_query.where(SessionClimb.date >= date_from)
+
+    if date_to:
+        routes_query = routes_query.where(Route.date_completed <= date_to)
+        climbs_query = climbs_query.where(SessionClimb.date <= date_to)
+
+    rows = db.execute(union_all(routes_query, climbs_query)).all()
+    count = len(rows)
+
+    days = np.fromiter((row[0].toordinal() for row in rows), dtype=np.int32, count=count)
+    ranks = _encode([row[1] or "" for row in rows], lambda g: grade_to_rank(g) or 0, np.int16)
+    styles = _encode(
+        [(row[2] or "").strip().lower() for row in rows],
+        lambda s: STYLE_CODES.get(s, STYLE_UNKNOWN),
+        np.int8
+    )
+    sources = np.fromiter((row[3] for row in rows), dtype=np.int8, count=count)
+
+    order = np.argsort(days, kind="stable")
+    return ClimbArrays(days[order], ranks[order], styles[order], sources[order])
+
+
+def _ratio(part: int, total: int) -> float:
+    """Ratio arrondi, 0 si pas de données"""
+    return round(part / total, 3) if total else 0.0
+
+
+def compute_progression(arrays: ClimbArrays, window_weeks: int = 12) -> dict:
+    """
+    Calcule pyramide, ratios et série hebdomadaire
+
+    Args:
+        arrays: Colonnes chargées par load_climb_arrays()
+        window_weeks: Fenêtre (semaines) de la cotation max glissante
+
+    Returns:
+        dict avec "pyramid", "ratios" et "weekly"
+    """
+    window_weeks = max(window_weeks, 1)  # Garde-fou : l'API borne déjà à 1-260
+    graded = arrays.ranks > 0
+    known_style = arrays.styles != STYLE_UNKNOWN
+    sends = graded & (arrays.styles <= STYLE_REDPOINT)
+
+    # --- Pyramide : enchaînements par cotation et par style ---
+    size = len(FRENCH_GRADES) + 1
+    sends_by_rank = np.bincount(arrays.ranks[sends], minlength=size)
+    attempts_by_rank = np.bincount(arrays.ranks[graded], minlength=size)
+    by_style = {
+        name: np.bincount(arrays.ranks[graded & (arrays.styles == code)], minlength=size)
+        for name, code in STYLE_CODES.items()
+    }
+
+    pyramid = [
+        {
+            "grade": rank_to_grade(rank),
+            "grade_rank": rank,
+            "climbs": int(attempts_by_rank[rank]),
+            "sends": int(sends_by_rank[rank]),
+            **{name: int(counts[rank]) for name, counts in by_style.items()},
+        }
+        for rank in np.flatnonzero(attempts_by_rank)[::-1].tolist()
+    ]
+
+    # --- Ratios (voies avec style renseigné) ---
+    styled = int(known_style.sum())
+    style_counts = np.bincount(arrays.styles[known_style], minlength=STYLE_UNKNOWN)
+    ratios = {
+        "climbs": len(arrays),
+        "sends": int(sends.sum()),
+        "onsight": _ratio(int(style_counts[STYLE_ONSIGHT]), styled),
+        "flash": _ratio(int(style_counts[STYLE_FLASH]), styled),
+        "redpoint": _ratio(int(style_counts[STYLE_REDPOINT]), styled),
+        "send": _ratio(int(style_counts[:STYLE_PROJECT].sum()), styled),
+    }
+
+    # --- Série hebdomadaire dense (semaine commençant le lundi) ---
+    weekly = []
+    if len(arrays):
+        # Ordinal 1 = lundi 1er janvier de l'an 1
+        weeks = (arrays.days - 1) // 7
+        first_week = int(weeks[0])
+        index = weeks - first_week
+        n_weeks = int(index[-1]) + 1
+
+        climbs_per_week = np.bincount(index, minlength=n_weeks)
+        sends_per_week = np.bincount(index[sends], minlength=n_weeks)
+
+        max_per_week = np.zeros(n_weeks, dtype=np.int16)
+        np.maximum.at(max_per_week, index[sends], arrays.ranks[sends])
+
+        padded = np.concatenate([np.zeros(window_weeks - 1, dtype=np.int16), max_per_week])
+        rolling_max = np.lib.stride_tricks.sliding_window_view(padded, window_weeks).max(axis=1)
+        best_to_date = np.maximum.accumulate(max_per_week)
+
+        for i, (climbs, week_sends, week_max, rolling, best) in enumerate(zip(
+            climbs_per_week.tolist(),
+            sends_per_week.tolist(),
+            max_per_week.tolist(),
+            rolling_max.tolist(),
+            best_to_date.tolist()
+        )):
+            weekly.append({
+                "week_start": date_type.fromordinal((first_week + i) * 7 + 1),
+                "climbs": climbs,
+                "sends": week_sends,
+                "max_grade": rank_to_grade(week_max),
+                "rolling_max_grade": rank_to_grade(rolling),
+                "best_grade_to_date": rank_to_grade(best),
+            })
+
+    return {"pyramid": pyramid, "ratios": ratios, "weekly": weekly}
@@ -0,0 +1,208 @@
+"""
+Refresh tokens : rotation, détection de réutilisation, révocation
+
+- Chaque connexion ouvre une famille ; chaque rafraîchissement émet un
+  nouveau refresh token et marque l'ancien comme remplacé.
+- Un token déjà remplacé présenté à nouveau signale un vol : toute la
+  famille est révoquée.
+- Les jti révoqués ou remplacés sont gardés dans un LRU en mémoire : un token
+  rejoué ou révoqué est refusé sans requête base.
+- User.token_version est embarqué dans les tokens : l'incrémenter invalide
+  d'un coup tous les tokens d'accès et de rafraîchissement de l'utilisateur
+  (comparaison avec l'utilisateur déjà chargé, sans requête supplémentaire).
+"""
+
+import secrets
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from backend.auth import create_access_token, create_refresh_token, verify_token
+from backend.config import settings
+from backend.models.refresh_token import RefreshToken
+from backend.models.user import User
+
+
+class TokenError(Exception):
+    """Refresh token refusé"""
+
+
+# === CACHE DES JTI RÉVOQUÉS ===
+
+REVOKED = "revoked"  # Révoqué (logout, réutilisation, mot de passe...)
+REPLACED = "replaced"  # Remplacé par rotation : le revoir = réutilisation
+
+
+class RevokedTokenCache:
+    """
+    LRU borné des jti inutilisables (thread-safe)
+    Faux négatifs possibles (éviction, autre processus) : la base reste la référence
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, jti: str, family_id: str, reason: str):
+        with self._lock:
+            self._entries[jti] = (family_id, reason)
+            self._entries.move_to_end(jti)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get(self, jti: str) -> Optional[tuple[str, str]]:
+        """(family_id, raison) si le jti est connu comme inutilisable"""
+        with self._lock:
+            return self._entries.get(jti)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+revoked_cache = RevokedTokenCache(settings.REFRESH_REVOCATION_CACHE_SIZE)
+
+
+# === ÉMISSION ===
+
+def _new_id() -> str:
+    return secrets.token_hex(16)
+
+
+def issue_tokens(db: Session, user: User, family_id: Optional[str] = None) -> dict:
+    """
+    Émet un couple access / refresh token (commit par l'appelant)
+
+    Args:
+        db: Session de base de données
+        user: Utilisateur
+        family_id: Famille existante (rotation), nouvelle famille sinon (connexion)
+
+    Returns:
+        dict compatible TokenResponse (+ "jti" du refresh token)
+    """
+    jti = _new_id()
+    family_id = family_id or _new_id()
+    expires_at = datetime.utcnow() + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+
+    db.add(RefreshToken(jti=jti, family_id=family_id, user_id=user.id, expires_at=expires_at))
+
+    claims = {"sub": user.email, "ver": user.token_version or 0}
+    return {
+        "access_token": create_access_token(data=claims),
+        "refresh_token": create_refresh_token(
+            data={**claims, "jti": jti, "fam": family_id},
+            expires_delta=expires_at - datetime.utcnow()
+        ),
+        "token_type": "bearer",
+        "jti": jti,
+    }
+
+
+# === RÉVOCATION ===
+
+def revoke_family(db: Session, family_id: str) -> int:
+    """Révoque tous les tokens actifs d'une famille (commit par l'appelant)"""
+    now = datetime.utcnow()
+    jtis = db.execute(
+        select(RefreshToken.jti).where(
+            RefreshToken.family_id == family_id,
+            RefreshToken.revoked_at == None
+        )
+    ).scalars().all()
+
+    db.execute(
+        update(RefreshToken).where(
+            RefreshToken.family_id == family_id,
+            RefreshToken.revoked_at == None
+        ).values(revoked_at=now)
+    )
+    for jti in jtis:
+        revoked_cache.add(jti, family_id, REVOKED)
+    return len(jtis)
+
+
+def revoke_user_sessions(db: Session, user: User) -> int:
+    """
+    Invalide toutes les sessions d'un utilisateur (commit par l'appelant)
+    token_version incrémenté : les tokens d'accès en cours deviennent invalides
+
+    Returns:
+        Nombre de refresh tokens révoqués
+    """
+    user.token_version = (user.token_version or 0) + 1
+
+    rows = db.execute(
+        select(RefreshToken.jti, RefreshToken.family_id).where(
+            RefreshToken.user_id == user.id,
+            RefreshToken.revoked_at == None
+        )
+    ).all()
+
+    db.execute(
+        update(RefreshToken).where(
+            RefreshToken.user_id == user.id,
+            RefreshToken.revoked_at == None
+        ).values(revoked_at=datetime.utcnow())
+    )
+    for jti, family_id in rows:
+        revoked_cache.add(jti, family_id, REVOKED)
+    return len(rows)
+
+
+# === ROTATION ===
+
+def rotate_refresh_token(db: Session, token: str) -> dict:
+    """
+    Échange un refresh token contre un nouveau couple de tokens (commit fait)
+
+    Raises:
+        TokenError: Token invalide, expiré, révoqué ou réutilisé
+    """
+    payload = verify_token(token)
+    if payload is None or payload.get("type") != "refresh" or not payload.get("jti"):
+        raise TokenError("Invalid refresh token")
+
+    jti = payload["jti"]
+    family_id = payload.get("fam")
+
+    # Chemin rapide : jti déjà connu comme inutilisable, sans requête base
+    cached = revoked_cache.get(jti)
+    if cached is not None:
+        if cached[1] == REPLACED:
+            revoke_family(db, cached[0])
+            db.commit()
+            raise TokenError("Refresh token reuse detected")
+        raise TokenError("Refresh token revoked")
+
+    # Verrou de ligne (MySQL) : deux rafraîchissements simultanés ne peuvent pas
+    # remplacer le même token
+    stored = db.query(RefreshToken).filter(RefreshToken.jti == jti).with_for_update().first()
+    if stored is None or stored.family_id != family_id:
+        raise TokenError("Invalid refresh token")
+
+    if stored.replaced_by is not None:
+        # Réutilisation d'un token déjà remplacé : vol probable
+        revoke_family(db, stored.family_id)
+        db.commit()
+        raise TokenError("Refresh token reuse detected")
+
+    if stored.revoked_at is not None or stored.expires_at <= datetime.utcnow():
+        revoked_cache.add(jti, stored.family_id, REVOKED)
+        raise TokenError("Refresh token revoked")
+
+    user = db.get(User, stored.user_id)
+    if user is None or not user.is_active or payload.get("ver", 0) != (user.token_version or 0):
+        raise TokenError("User not found or inactive")
+
+    tokens = issue_tokens(db, user, family_id=stored.family_id)
+    stored.replaced_by = tokens["jti"]
+    db.commit()
+
+    revoked_cache.add(jti, stored.family_id, REPLACED)
+    return tokens
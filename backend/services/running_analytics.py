@@ -0,0 +1,321 @@
+"""
+Analyse course à pied
+Records par distance, kilométrage hebdomadaire, zones cardiaques, allure
+corrigée du dénivelé
+
+Une seule requête ramène les colonnes des sorties d'un utilisateur ; tous les
+calculs sont vectorisés avec NumPy. Le résultat est gardé dans stats_cache
+(une ligne par utilisateur, valable pour la journée) et supprimé dans la
+transaction de chaque écriture de sortie course.
+"""
+
+from dataclasses import dataclass
+from datetime import date as date_type, datetime, timedelta
+from typing import Optional
+
+import numpy as np
+import orjson
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.config import settings
+from backend.models.running_session import RunningSession
+from backend.models.stats_cache import StatsCache
+
+STAT_TYPE = "running_analytics"
+
+# === RECORDS : distances de référence (km) ===
+# Une sortie compte pour une distance si elle en est proche (de -1 % à +10 %) :
+# le temps retenu est celui de la distance de référence à l'allure moyenne
+DISTANCE_BRACKETS = (
+    ("5k", 5.0),
+    ("10k", 10.0),
+    ("half_marathon", 21.0975),
+    ("marathon", 42.195),
+)
+BRACKET_TOLERANCE = (0.99, 1.10)
+
+# === ZONES CARDIAQUES (% de la FC max de l'athlète) ===
+HR_ZONES = (
+    ("Z1", 0.0, 0.6),
+    ("Z2", 0.6, 0.7),
+    ("Z3", 0.7, 0.8),
+    ("Z4", 0.8, 0.9),
+    ("Z5", 0.9, None),
+)
+
+# Kilomètre-effort : 100 m de dénivelé positif valent 1 km à plat
+ELEVATION_M_PER_FLAT_KM = 100
+
+# Moyenne glissante du kilométrage (semaines)
+ROLLING_WEEKS = 4
+
+
+@dataclass
+class RunArrays:
+    """Colonnes compactes des sorties d'un utilisateur (NaN si non renseigné)"""
+    ids: np.ndarray  # ID de la sortie (int64)
+    days: np.ndarray  # Date en ordinal (int32)
+    duration_min: np.ndarray  # float64
+    distance_km: np.ndarray  # float64
+    elevation_m: np.ndarray  # float64
+    pace_min_km: np.ndarray  # Allure saisie (float64)
+    average_hr: np.ndarray  # float64
+    max_hr: np.ndarray  # float64
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+
+def _column(rows: list, index: int) -> np.ndarray:
+    """Colonne numérique (None -> NaN)"""
+    return np.fromiter(
+        (np.nan if row[index] is None else row[index] for row in rows),
+        dtype=np.float64,
+        count=len(rows)
+    )
+
+
+def load_run_arrays(db: Session, user_id: int) -> RunArrays:
+    """
+    Charge toutes les sorties d'un utilisateur en une requête
+
+    Returns:
+        RunArrays triées par date
+    """
+    rows = db.execute(
+        select(
+            RunningSession.id,
+            RunningSession.date,
+            RunningSession.duration_min,
+            RunningSession.distance_km,
+            RunningSession.elevation_gain_m,
+            RunningSession.average_pace_min_km,
+            RunningSession.average_heart_rate,
+            RunningSession.max_heart_rate,
+        ).where(RunningSession.user_id == user_id)
+    ).all()
+    count = len(rows)
+
+    ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=count)
+    days = np.fromiter((row[1].toordinal() for row in rows), dtype=np.int32, count=count)
+    arrays = [ids, days] + [_column(rows, index) for index in range(2, 8)]
+
+    order = np.argsort(days, kind="stable")
+    return RunArrays(*(array[order] for array in arrays))
+
+
+def _round(value, digits: int = 2) -> Optional[float]:
+    """Arrondi, None si NaN"""
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+# === CALCULS ===
+
+def session_paces(arrays: RunArrays) -> np.ndarray:
+    """Allure (min/km) : durée / distance, sinon allure saisie (NaN si inconnue)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        measured = arrays.duration_min / arrays.distance_km
+    valid = np.isfinite(measured) & (measured > 0)
+    return np.where(valid, measured, arrays.pace_min_km)
+
+
+def adjusted_paces(arrays: RunArrays, paces: np.ndarray) -> np.ndarray:
+    """Allure au kilomètre-effort (dénivelé positif converti en distance à plat)"""
+    effort_km = arrays.distance_km + np.nan_to_num(arrays.elevation_m) / ELEVATION_M_PER_FLAT_KM
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return paces * arrays.distance_km / effort_km
+
+
+def personal_records(arrays: RunArrays, paces: np.ndarray) -> list[dict]:
+    """Meilleur temps estimé sur chaque distance de référence"""
+    records = []
+    known = np.isfinite(paces) & (paces > 0)
+    low, high = BRACKET_TOLERANCE
+
+    for name, distance in DISTANCE_BRACKETS:
+        eligible = known & (arrays.distance_km >= distance * low) & (arrays.distance_km < distance * high)
+        if not eligible.any():
+            records.append({"distance": name, "distance_km": distance, "record": None})
+            continue
+
+        candidates = np.flatnonzero(eligible)
+        best = int(candidates[np.argmin(paces[candidates])])
+        pace = float(paces[best])
+        records.append({
+            "distance": name,
+            "distance_km": distance,
+            "record": {
+                "session_id": int(arrays.ids[best]),
+                "date": date_type.fromordinal(int(arrays.days[best])),
+                "time_min": round(pace * distance, 2),
+                "pace_min_km": round(pace, 2),
+                "actual_distance_km": _round(arrays.distance_km[best]),
+                "attempts": int(eligible.sum()),
+            },
+        })
+    return records
+
+
+def weekly_mileage(arrays: RunArrays, today: date_type) -> list[dict]:
+    """
+    Série hebdomadaire dense (lundi) de la première sortie à la semaine en cours
+    Kilomètres, dénivelé, moyenne glissante et écart à la moyenne des semaines précédentes
+    """
+    if not len(arrays):
+        return []
+
+    # Ordinal 1 = lundi 1er janvier de l'an 1
+    weeks = (arrays.days - 1) // 7
+    first_week = int(weeks[0])
+    last_week = max(int(weeks[-1]), (today.toordinal() - 1) // 7)
+    index = weeks - first_week
+    n_weeks = last_week - first_week + 1
+
+    km = np.bincount(index, weights=np.nan_to_num(arrays.distance_km), minlength=n_weeks)
+    elevation = np.bincount(index, weights=np.nan_to_num(arrays.elevation_m), minlength=n_weeks)
+    runs = np.bincount(index, minlength=n_weeks)
+
+    # Moyenne glissante (semaine incluse) et moyenne des semaines précédentes
+    cumulative = np.concatenate([[0.0], np.cumsum(km)])
+    ends = np.arange(1, n_weeks + 1)
+    starts = np.maximum(ends - ROLLING_WEEKS, 0)
+    rolling = (cumulative[ends] - cumulative[starts]) / (ends - starts)
+    previous = np.full(n_weeks, np.nan)
+    previous[1:] = rolling[:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = np.where(previous > 0, (km - previous) / previous * 100, np.nan)
+
+    return [
+        {
+            "week_start": date_type.fromordinal((first_week + i) * 7 + 1),
+            "runs": int(runs[i]),
+            "distance_km": round(float(km[i]), 2),
+            "elevation_gain_m": int(elevation[i]),
+            "rolling_km": round(float(rolling[i]), 2),
+            "change_pct": _round(change[i], 1),
+        }
+        for i in range(n_weeks)
+    ]
+
+
+def heart_rate_zones(arrays: RunArrays) -> dict:
+    """
+    Répartition du temps de course par zone cardiaque
+    Chaque sortie est comptée dans la zone de sa FC moyenne, en % de la FC max
+    la plus haute enregistrée par l'athlète
+    """
+    recorded_max = arrays.max_hr[np.isfinite(arrays.max_hr)]
+    hr_max = float(recorded_max.max()) if len(recorded_max) else np.nan
+    known = np.isfinite(arrays.average_hr) & np.isfinite(arrays.duration_min)
+    if np.isnan(hr_max) or not known.any():
+        return {"hr_max": None, "sessions": 0, "zones": []}
+
+    ratios = arrays.average_hr[known] / hr_max
+    bounds = np.array([low for _, low, _ in HR_ZONES[1:]])
+    zone_index = np.digitize(ratios, bounds)
+    minutes = np.bincount(zone_index, weights=arrays.duration_min[known], minlength=len(HR_ZONES))
+    sessions = np.bincount(zone_index, minlength=len(HR_ZONES))
+    total = minutes.sum()
+
+    return {
+        "hr_max": int(hr_max),
+        "sessions": int(known.sum()),
+        "zones": [
+            {
+                "zone": name,
+                "min_bpm": int(round(low * hr_max)),
+                "max_bpm": int(round(high * hr_max)) if high else None,
+                "sessions": int(sessions[i]),
+                "minutes": int(minutes[i]),
+                "percentage": round(float(minutes[i] / total) * 100, 1) if total else 0.0,
+            }
+            for i, (name, low, high) in enumerate(HR_ZONES)
+        ],
+    }
+
+
+def pace_summary(arrays: RunArrays, paces: np.ndarray, adjusted: np.ndarray) -> dict:
+    """Allures moyennes (pondérées par la distance) brutes et corrigées du dénivelé"""
+    known = np.isfinite(paces) & np.isfinite(arrays.distance_km) & (arrays.distance_km > 0)
+    if not known.any():
+        return {"sessions": 0, "average_pace_min_km": None, "adjusted_pace_min_km": None, "best_adjusted": None}
+
+    weights = arrays.distance_km[known]
+    best = int(np.flatnonzero(known)[np.nanargmin(adjusted[known])])
+    return {
+        "sessions": int(known.sum()),
+        "average_pace_min_km": round(float(np.average(paces[known], weights=weights)), 2),
+        "adjusted_pace_min_km": round(float(np.average(adjusted[known], weights=weights)), 2),
+        "best_adjusted": {
+            "session_id": int(arrays.ids[best]),
+            "date": date_type.fromordinal(int(arrays.days[best])),
+            "pace_min_km": round(float(paces[best]), 2),
+            "adjusted_pace_min_km": round(float(adjusted[best]), 2),
+            "distance_km": _round(arrays.distance_km[best]),
+            "elevation_gain_m": int(np.nan_to_num(arrays.elevation_m[best])),
+        },
+    }
+
+
+def compute_running_analytics(arrays: RunArrays, today: date_type) -> dict:
+    """
+    Calcule records, série hebdomadaire, zones cardiaques et allures
+
+    Args:
+        arrays: Colonnes chargées par load_run_arrays()
+        today: Date de référence (fin de la série hebdomadaire)
+    """
+    paces = session_paces(arrays)
+    adjusted = adjusted_paces(arrays, paces)
+    return {
+        "runs": len(arrays),
+        "total_distance_km": round(float(np.nansum(arrays.distance_km)), 2),
+        "records": personal_records(arrays, paces),
+        "weekly": weekly_mileage(arrays, today),
+        "heart_rate_zones": heart_rate_zones(arrays),
+        "pace": pace_summary(arrays, paces, adjusted),
+    }
+
+
+# === CACHE (stats_cache) ===
+
+def get_running_analytics(db: Session, user_id: int, today: Optional[date_type] = None) -> dict:
+    """
+    Analyse course d'un utilisateur, depuis le cache si valable
+    Cache recalculé (et commité) s'il est absent, expiré ou d'un autre jour
+
+    Returns:
+        dict décodé du JSON (dates au format ISO)
+    """
+    today = today or date_type.today()
+    now = datetime.utcnow()
+    cached = db.query(StatsCache).filter(
+        StatsCache.user_id == user_id,
+        StatsCache.stat_type == STAT_TYPE,
+        StatsCache.period_end == today,
+        StatsCache.expires_at > now
+    ).order_by(StatsCache.id.desc()).first()
+    if cached:
+        return orjson.loads(cached.data_json)
+
+    data_json = orjson.dumps(compute_running_analytics(load_run_arrays(db, user_id), today)).decode()
+
+    invalidate_running_analytics(db, user_id)
+    db.add(StatsCache(
+        user_id=user_id,
+        stat_type=STAT_TYPE,
+        period_end=today,
+        data_json=data_json,
+        expires_at=now + timedelta(seconds=settings.RUNNING_ANALYTICS_CACHE_SECONDS),
+    ))
+    db.commit()
+    return orjson.loads(data_json)
+
+
+def invalidate_running_analytics(db: Session, user_id: int):
+    """Supprime l'analyse en cache (commit par l'appelant, avec l'écriture de la sortie)"""
+    db.query(StatsCache).filter(
+        StatsCache.user_id == user_id,
+        StatsCache.stat_type == STAT_TYPE
+    ).delete(synchronize_session=False)
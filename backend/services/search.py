@@ -0,0 +1,243 @@
+"""
+Recherche plein texte
+Séances d'escalade, grandes voies et sorties course (noms, lieux, notes, commentaires)
+
+Chaque objet a un document dans search_documents, mis à jour dans la même
+transaction que l'objet (index_object / remove_object). La recherche est une
+lecture d'index plein texte (FTS5 sous SQLite, FULLTEXT sous MySQL), classée
+par pertinence et paginée.
+"""
+
+import re
+import unicodedata
+from typing import Optional
+
+from sqlalchemy import select, insert, delete, text
+from sqlalchemy.orm import Session
+
+from backend.models.search_document import SearchDocument
+from backend.models.training_session import TrainingSession
+from backend.models.route import Route
+from backend.models.running_session import RunningSession
+
+# Termes pris en compte par recherche
+MAX_TERMS = 10
+# Longueur des extraits
+SNIPPET_CHARS = 160
+
+_TERM_RE = re.compile(r"\w+")
+
+
+# === DOCUMENTS ===
+
+def _join(*parts) -> str:
+    return "\n".join(str(part) for part in parts if part)
+
+
+def _training_document(session: TrainingSession) -> tuple:
+    title = session.location or session.session_type or ""
+    return session.date, title, _join(session.session_type, session.location, session.best_grade, session.notes)
+
+
+def _route_document(route: Route) -> tuple:
+    return route.date_completed, route.name, _join(route.location, route.grade, route.style, route.comments)
+
+
+def _running_document(session: RunningSession) -> tuple:
+    title = session.location or session.session_type or ""
+    return session.date, title, _join(session.session_type, session.location, session.comments)
+
+
+# Modèle -> (kind, construction du document)
+INDEXED_MODELS = {
+    TrainingSession: ("training", _training_document),
+    Route: ("route", _route_document),
+    RunningSession: ("running", _running_document),
+}
+
+KINDS = tuple(kind for kind, _ in INDEXED_MODELS.values())
+
+
+def index_object(db: Session, obj) -> SearchDocument:
+    """
+    Crée ou met à jour le document d'un objet (commit par l'appelant)
+    L'objet doit avoir un ID (flush fait)
+    """
+    kind, build = INDEXED_MODELS[type(obj)]
+    date, title, body = build(obj)
+
+    document = db.query(SearchDocument).filter(
+        SearchDocument.kind == kind,
+        SearchDocument.object_id == obj.id
+    ).first()
+
+    if document is None:
+        document = SearchDocument(kind=kind, object_id=obj.id, user_id=obj.user_id)
+        db.add(document)
+
+    document.date = date
+    document.title = title[:200]
+    document.body = body
+    return document
+
+
+def remove_object(db: Session, obj):
+    """Supprime le document d'un objet (commit par l'appelant)"""
+    kind, _ = INDEXED_MODELS[type(obj)]
+    db.execute(
+        delete(SearchDocument).where(
+            SearchDocument.kind == kind,
+            SearchDocument.object_id == obj.id
+        ).execution_options(synchronize_session=False)
+    )
+
+
+def rebuild_search_index(db: Session, user_id: Optional[int] = None, batch_size: int = 500) -> int:
+    """
+    Reconstruit l'index (données existantes, réparation) - commit fait
+
+    Args:
+        db: Session de base de données
+        user_id: Limiter à un utilisateur (tous sinon)
+        batch_size: Documents insérés par instruction
+
+    Returns:
+        Nombre de documents indexés
+    """
+    purge = delete(SearchDocument)
+    if user_id is not None:
+        purge = purge.where(SearchDocument.user_id == user_id)
+    db.execute(purge.execution_options(synchronize_session=False))
+
+    total = 0
+    for model, (kind, build) in INDEXED_MODELS.items():
+        query = select(model)
+        if user_id is not None:
+            query = query.where(model.user_id == user_id)
+
+        batch = []
+        for obj in db.execute(query.execution_options(yield_per=batch_size)).scalars():
+            date, title, body = build(obj)
+            batch.append({
+                "user_id": obj.user_id,
+                "kind": kind,
+                "object_id": obj.id,
+                "date": date,
+                "title": title[:200],
+                "body": body,
+            })
+            if len(batch) >= batch_size:
+                db.execute(insert(SearchDocument), batch)
+                total += len(batch)
+                batch = []
+                db.expunge_all()
+        if batch:
+            db.execute(insert(SearchDocument), batch)
+            total += len(batch)
+            db.expunge_all()
+
+    db.commit()
+    return total
+
+
+# === RECHERCHE ===
+
+def search_terms(q: str) -> list[str]:
+    """Termes de la recherche (mots, sans opérateurs)"""
+    return _TERM_RE.findall(q)[:MAX_TERMS]
+
+
+def _fold(value: str) -> str:
+    """Minuscules sans accents, même longueur (positions conservées pour l'extrait)"""
+    return "".join(
+        (unicodedata.normalize("NFKD", char)[0].casefold() or char)[0]
+        for char in value
+    )
+
+
+def snippet(body: str, terms: list[str]) -> str:
+    """Extrait du texte autour de la première occurrence d'un terme"""
+    if not body:
+        return ""
+    folded = _fold(body)
+    positions = [folded.find(_fold(term)) for term in terms]
+    positions = [position for position in positions if position >= 0]
+    start = max(min(positions) - SNIPPET_CHARS // 3, 0) if positions else 0
+
+    excerpt = body[start:start + SNIPPET_CHARS].replace("\n", " · ")
+    if start > 0:
+        excerpt = "…" + excerpt
+    if start + SNIPPET_CHARS < len(body):
+        excerpt += "…"
+    return excerpt
+
+
+def _sqlite_query(kind: Optional[str]):
+    # CROSS JOIN : SQLite garde la table FTS en boucle externe (lecture de
+    # l'index de termes), au lieu d'évaluer MATCH sur chaque document de l'utilisateur
+    return text(
+        "SELECT d.kind, d.object_id, d.date, d.title, d.body, "
+        "-bm25(search_documents_fts, 4.0, 1.0) AS score "
+        "FROM search_documents_fts "
+        "CROSS JOIN search_documents d ON d.id = search_documents_fts.rowid "
+        "WHERE search_documents_fts MATCH :match AND d.user_id = :user_id "
+        + ("AND d.kind = :kind " if kind else "")
+        + "ORDER BY score DESC, d.date DESC LIMIT :limit OFFSET :skip"
+    )
+
+
+def _mysql_query(kind: Optional[str]):
+    return text(
+        "SELECT kind, object_id, date, title, body, "
+        "MATCH(title, body) AGAINST (:match IN BOOLEAN MODE) AS score "
+        "FROM search_documents "
+        "WHERE user_id = :user_id AND MATCH(title, body) AGAINST (:match IN BOOLEAN MODE) "
+        + ("AND kind = :kind " if kind else "")
+        + "ORDER BY score DESC, date DESC LIMIT :limit OFFSET :skip"
+    )
+
+
+def search(
+    db: Session,
+    user_id: int,
+    q: str,
+    kind: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 20
+) -> dict:
+    """
+    Recherche dans les documents d'un utilisateur
+
+    Tous les termes doivent être présents (en préfixe : "cëu" trouve "Ceüse").
+
+    Returns:
+        {"items": [...], "has_more": bool}
+    """
+    terms = search_terms(q)
+    if not terms:
+        return {"items": [], "has_more": False}
+
+    if db.get_bind().dialect.name == "mysql":
+        statement = _mysql_query(kind)
+        match = " ".join(f"+{term}*" for term in terms)
+    else:
+        statement = _sqlite_query(kind)
+        match = " ".join(f'"{term}"*' for term in terms)
+
+    params = {"match": match, "user_id": user_id, "skip": skip, "limit": limit + 1}
+    if kind:
+        params["kind"] = kind
+    rows = db.execute(statement, params).all()
+
+    items = [
+        {
+            "kind": row.kind,
+            "id": row.object_id,
+            "date": row.date,
+            "title": row.title,
+            "snippet": snippet(row.body, terms),
+            "score": round(float(row.score), 4),
+        }
+        for row in rows[:limit]
+    ]
+    return {"items": items, "has_more": len(rows) > limit}
@@ -0,0 +1,409 @@
+"""
+Traces GPS des sorties course
+Upload GPX/TCX en streaming, stockage compact, résumé dérivé, polyligne simplifiée
+
+- Le corps multipart est passé morceau par morceau à un XMLPullParser : les
+  points sont extraits au fil de la lecture et chaque élément est libéré
+  aussitôt traité (ni fichier temporaire ni arbre XML complet en mémoire).
+- Les points sont stockés en colonnes int32 (lat/lon en 1e-7 degré, altitude
+  en décimètres, temps en secondes depuis le premier point, FC) encodées en
+  delta puis compressées (zlib) : quelques octets par point.
+- Distance, dénivelé, durée et FC sont dérivés des points (NumPy) et reportés
+  sur la sortie.
+- La carte reçoit une polyligne simplifiée (Douglas-Peucker, tolérance en
+  mètres, nombre de points plafonné) et jamais la trace complète.
+"""
+
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+from xml.etree.ElementTree import XMLPullParser, ParseError
+
+import numpy as np
+from fastapi import Request
+from multipart.multipart import parse_options_header
+
+from backend.config import settings
+from backend.models.running_session import RunningSession
+from backend.models.running_track import RunningTrack
+from backend.services.images import MultipartEvents, UploadError, UploadTooLarge
+
+# === COLONNES DES POINTS ===
+LAT, LON, ELE, TIME, HR = range(5)
+POINT_COLUMNS = 5
+COORD_SCALE = 1e7  # 1e-7 degré (~1 cm) : |lon| * 1e7 < 2^31
+ELE_SCALE = 10  # Décimètres
+
+EARTH_RADIUS_M = 6371008.8
+ELEVATION_SMOOTHING_POINTS = 5  # Moyenne glissante avant le cumul du dénivelé (bruit GPS)
+
+TRACK_EXTENSIONS = ("gpx", "tcx")
+
+# Éléments point et champs par format (noms locaux, sans espace de noms)
+FORMATS = {
+    "gpx": {"point": "trkpt", "time": "time", "ele": "ele", "lat": "lat", "lon": "lon", "hr": "hr"},
+    "TrainingCenterDatabase": {
+        "point": "Trackpoint", "time": "Time", "ele": "AltitudeMeters",
+        "lat": "LatitudeDegrees", "lon": "LongitudeDegrees", "hr": "HeartRateBpm",
+    },
+}
+FORMAT_NAMES = {"gpx": "gpx", "TrainingCenterDatabase": "tcx"}
+
+
+def _local(tag: str) -> str:
+    """Nom local d'une balise ({namespace}nom -> nom)"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _float(text: Optional[str]) -> float:
+    """Texte -> float (NaN si vide ou invalide)"""
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _timestamp(text: Optional[str]) -> float:
+    """Horodatage ISO 8601 -> secondes epoch UTC (NaN si invalide)"""
+    if not text:
+        return np.nan
+    try:
+        moment = datetime.fromisoformat(text.strip())
+    except ValueError:
+        return np.nan
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+# === LECTURE EN STREAMING ===
+
+@dataclass
+class ParsedTrack:
+    """Trace lue depuis un fichier GPX/TCX"""
+    source_format: str  # gpx, tcx
+    points: np.ndarray  # (n, POINT_COLUMNS) int32
+    started_at: Optional[datetime]
+    has_elevation: bool
+    has_time: bool
+    has_heart_rate: bool
+
+
+class TrackParser:
+    """
+    Lecture incrémentale d'un GPX ou d'un TCX (feed() par morceau, close())
+    Chaque point traité est retiré de l'arbre : mémoire bornée par les colonnes
+    """
+
+    def __init__(self, max_points: Optional[int] = None):
+        self.max_points = max_points or settings.TRACK_MAX_POINTS
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._stack: list = []
+        self._fields: Optional[dict] = None
+        self._names: dict = {}  # Nom local de balise -> champ
+        self.source_format: Optional[str] = None
+        self.columns: tuple[list, ...] = ([], [], [], [], [])
+
+    def feed(self, data: bytes):
+        try:
+            self._parser.feed(data)
+            self._consume()
+        except ParseError as e:
+            raise UploadError(f"Invalid XML: {e}")
+
+    def _consume(self):
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if self._fields is None:
+                    root = _local(elem.tag)
+                    if root not in FORMATS:
+                        raise UploadError("Unsupported track format (GPX or TCX expected)")
+                    self._fields = FORMATS[root]
+                    self._names = {self._fields[key]: key for key in ("lat", "lon", "ele", "time")}
+                    self.source_format = FORMAT_NAMES[root]
+                self._stack.append(elem)
+                continue
+
+            self._stack.pop()
+            if _local(elem.tag) == self._fields["point"]:
+                self._read_point(elem)
+                elem.clear()
+                if self._stack:
+                    self._stack[-1].remove(elem)
+
+    def _read_point(self, elem):
+        values = {name: elem.get(name) for name in ("lat", "lon")}  # Attributs GPX
+        for child in elem.iter():
+            name = _local(child.tag)
+            if name == self._fields["hr"]:
+                # GPX : <gpxtpx:hr>150</gpxtpx:hr> ; TCX : <HeartRateBpm><Value>150</Value></HeartRateBpm>
+                values["hr"] = child.text if len(child) == 0 else child[0].text
+            elif name in self._names:
+                values[self._names[name]] = child.text
+
+        lat, lon = _float(values.get("lat")), _float(values.get("lon"))
+        if np.isnan(lat) or np.isnan(lon):
+            return  # Point sans position (tapis, perte de signal)
+        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            # Hors bornes : dépasserait l'int32 des colonnes (et fausserait distance et allure)
+            raise UploadError(f"Invalid coordinates (lat {lat}, lon {lon})")
+
+        if len(self.columns[LAT]) >= self.max_points:
+            raise UploadError(f"Too many track points (max {self.max_points})")
+
+        self.columns[LAT].append(lat)
+        self.columns[LON].append(lon)
+        self.columns[ELE].append(_float(values.get("ele")))
+        self.columns[TIME].append(_timestamp(values.get("time")))
+        self.columns[HR].append(_float(values.get("hr")))
+
+    def close(self) -> ParsedTrack:
+        """Termine la lecture et construit les colonnes int32"""
+        try:
+            self._parser.close()
+            self._consume()
+        except ParseError as e:
+            raise UploadError(f"Invalid XML: {e}")
+
+        if len(self.columns[LAT]) < 2:
+            raise UploadError("Track must contain at least 2 points with a position")
+
+        lat, lon, ele, times, hr = (np.array(column, dtype=np.float64) for column in self.columns)
+        has_elevation = bool(np.isfinite(ele).any())
+        has_time = bool(np.isfinite(times).any())
+        has_heart_rate = bool((np.nan_to_num(hr) > 0).any())
+
+        started = float(np.nanmin(times)) if has_time else 0.0
+        points = np.zeros((len(lat), POINT_COLUMNS), dtype=np.int32)
+        points[:, LAT] = np.round(lat * COORD_SCALE)
+        points[:, LON] = np.round(lon * COORD_SCALE)
+        points[:, ELE] = np.round(_forward_fill(ele) * ELE_SCALE) if has_elevation else 0
+        points[:, TIME] = np.round(_forward_fill(times) - started) if has_time else 0
+        points[:, HR] = np.round(np.clip(np.nan_to_num(hr), 0, 255))
+
+        return ParsedTrack(
+            source_format=self.source_format,
+            points=points,
+            started_at=datetime.utcfromtimestamp(started) if has_time else None,
+            has_elevation=has_elevation,
+            has_time=has_time,
+            has_heart_rate=has_heart_rate,
+        )
+
+
+def _forward_fill(values: np.ndarray) -> np.ndarray:
+    """Remplace les NaN par la dernière valeur connue (la première connue en tête)"""
+    known = np.isfinite(values)
+    index = np.where(known, np.arange(len(values)), 0)
+    np.maximum.accumulate(index, out=index)
+    filled = values[index]
+    filled[~np.isfinite(filled)] = values[known][0]
+    return filled
+
+
+async def receive_track(request: Request, field: str = "file") -> ParsedTrack:
+    """
+    Lit un upload multipart GPX/TCX en streaming
+
+    Args:
+        request: Requête FastAPI (corps multipart/form-data non lu)
+        field: Nom du champ fichier
+
+    Returns:
+        ParsedTrack
+
+    Raises:
+        UploadTooLarge: Si la taille dépasse TRACK_MAX_UPLOAD_MB
+        UploadError: Si la requête ou le fichier est invalide
+    """
+    max_size = settings.TRACK_MAX_UPLOAD_MB * 1024 * 1024
+
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_size + 64 * 1024:
+        raise UploadTooLarge(f"File too large (max {settings.TRACK_MAX_UPLOAD_MB} MB)")
+
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in options:
+        raise UploadError("Expected multipart/form-data")
+
+    events = MultipartEvents(options[b"boundary"])
+    parser: Optional[TrackParser] = None
+    done = False
+    size = 0
+
+    async for chunk in request.stream():
+        events.parser.write(chunk)
+
+        for event in events.events:
+            if event[0] == "part":
+                if not done and event[1] == field and event[2]:
+                    if event[2].rsplit(".", 1)[-1].lower() not in TRACK_EXTENSIONS:
+                        raise UploadError("Extension not allowed (gpx, tcx)")
+                    parser = TrackParser()
+
+            elif event[0] == "data" and parser is not None and not done:
+                size += len(event[1])
+                if size > max_size:
+                    raise UploadTooLarge(f"File too large (max {settings.TRACK_MAX_UPLOAD_MB} MB)")
+                parser.feed(event[1])
+
+            elif event[0] == "end" and parser is not None:
+                done = True
+
+        events.events.clear()
+
+    events.parser.finalize()
+
+    if not done or size == 0:
+        raise UploadError(f"Missing file field '{field}'")
+    return parser.close()
+
+
+# === STOCKAGE ===
+
+def encode_points(points: np.ndarray) -> bytes:
+    """Colonnes int32 -> deltas (premier point en absolu) int32 little-endian compressés"""
+    deltas = np.diff(points.astype(np.int64), axis=0, prepend=np.zeros((1, POINT_COLUMNS), dtype=np.int64))
+    return zlib.compress(deltas.astype("<i4").tobytes(), 6)
+
+
+def decode_points(data: bytes) -> np.ndarray:
+    """
+    Inverse de encode_points : (n, POINT_COLUMNS) int32
+    Un delta hors int32 (antiméridien) est stocké modulo 2^32 : la somme
+    ramenée en int32 redonne la valeur exacte
+    """
+    deltas = np.frombuffer(zlib.decompress(data), dtype="<i4").reshape(-1, POINT_COLUMNS)
+    return np.cumsum(deltas, axis=0, dtype=np.int64).astype(np.int32)
+
+
+# === RÉSUMÉ ===
+
+def segment_distances(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Distances (m) entre points consécutifs (haversine)"""
+    lat_rad, lon_rad = np.radians(lat), np.radians(lon)
+    dlat, dlon = np.diff(lat_rad), np.diff(lon_rad)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat_rad[:-1]) * np.cos(lat_rad[1:]) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def elevation_gain(elevation: np.ndarray) -> float:
+    """Dénivelé positif (m) après lissage du bruit d'altitude"""
+    # Pas de lissage sur une trace trop courte (il écraserait le dénivelé réel)
+    window = ELEVATION_SMOOTHING_POINTS if len(elevation) >= 2 * ELEVATION_SMOOTHING_POINTS else 1
+    padded = np.pad(elevation, (window // 2, window - 1 - window // 2), mode="edge")
+    smoothed = np.convolve(padded, np.ones(window) / window, mode="valid")
+    climbs = np.diff(smoothed)
+    return float(climbs[climbs > 0].sum())
+
+
+def build_track(session: RunningSession, parsed: ParsedTrack, track: Optional[RunningTrack] = None) -> RunningTrack:
+    """
+    Crée (ou remplace) la trace d'une sortie et en dérive le résumé
+
+    Args:
+        session: Sortie course
+        parsed: Trace lue par receive_track()
+        track: Trace existante à remplacer
+    """
+    points = parsed.points
+    lat, lon = points[:, LAT] / COORD_SCALE, points[:, LON] / COORD_SCALE
+    heart_rates = points[:, HR][points[:, HR] > 0]
+
+    track = track or RunningTrack(session_id=session.id, user_id=session.user_id)
+    track.source_format = parsed.source_format
+    track.point_count = len(points)
+    track.has_elevation = parsed.has_elevation
+    track.has_time = parsed.has_time
+    track.has_heart_rate = parsed.has_heart_rate
+    track.points = encode_points(points)
+    track.started_at = parsed.started_at
+    track.duration_s = int(points[-1, TIME] - points[0, TIME]) if parsed.has_time else None
+    track.distance_m = int(round(segment_distances(lat, lon).sum()))
+    track.elevation_gain_m = int(round(elevation_gain(points[:, ELE] / ELE_SCALE))) if parsed.has_elevation else None
+    track.average_heart_rate = int(round(heart_rates.mean())) if len(heart_rates) else None
+    track.max_heart_rate = int(heart_rates.max()) if len(heart_rates) else None
+    track.min_lat, track.max_lat = float(lat.min()), float(lat.max())
+    track.min_lon, track.max_lon = float(lon.min()), float(lon.max())
+    track.created_at = datetime.utcnow()
+    return track
+
+
+def apply_track_summary(session: RunningSession, track: RunningTrack):
+    """Reporte le résumé de la trace sur la sortie (champs connus uniquement)"""
+    session.distance_km = round(track.distance_m / 1000, 2)
+    if track.duration_s:
+        session.duration_min = max(round(track.duration_s / 60), 1)
+        if track.distance_m > 0:
+            session.average_pace_min_km = round(track.duration_s / 60 / (track.distance_m / 1000), 2)
+    if track.elevation_gain_m is not None:
+        session.elevation_gain_m = track.elevation_gain_m
+    if track.average_heart_rate is not None:
+        session.average_heart_rate = track.average_heart_rate
+        session.max_heart_rate = track.max_heart_rate
+    session.updated_at = datetime.utcnow()
+
+
+# === POLYLIGNE (carte) ===
+
+def douglas_peucker(x: np.ndarray, y: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Masque des points gardés par Douglas-Peucker (coordonnées planes, mêmes unités que tolerance)
+    Version itérative (pile de segments) : pas de limite de récursion sur les longues traces
+    """
+    count = len(x)
+    keep = np.zeros(count, dtype=bool)
+    keep[[0, count - 1]] = True
+    stack = [(0, count - 1)]
+
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        dx, dy = x[end] - x[start], y[end] - y[start]
+        px, py = x[start + 1:end] - x[start], y[start + 1:end] - y[start]
+        length = np.hypot(dx, dy)
+        distances = np.abs(dx * py - dy * px) / length if length > 0 else np.hypot(px, py)
+
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = start + 1 + farthest
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return keep
+
+
+def track_polyline(track: RunningTrack, tolerance_m: float, max_points: int) -> dict:
+    """
+    Polyligne simplifiée d'une trace pour l'affichage carte
+    La tolérance est doublée jusqu'à tenir dans max_points
+
+    Returns:
+        dict (tolérance effective, points [lat, lon], altitudes)
+    """
+    points = decode_points(track.points)
+    lat, lon = points[:, LAT] / COORD_SCALE, points[:, LON] / COORD_SCALE
+
+    # Projection équirectangulaire locale (mètres), suffisante à l'échelle d'une sortie
+    y = np.radians(lat) * EARTH_RADIUS_M
+    x = np.radians(lon) * EARTH_RADIUS_M * np.cos(np.radians(lat.mean()))
+
+    tolerance = max(tolerance_m, 0.1)
+    keep = douglas_peucker(x, y, tolerance)
+    while keep.sum() > max_points:
+        tolerance *= 2
+        keep = douglas_peucker(x, y, tolerance)
+
+    return {
+        "session_id": track.session_id,
+        "source_format": track.source_format,
+        "point_count": track.point_count,
+        "returned_points": int(keep.sum()),
+        "tolerance_m": round(tolerance, 1),
+        "bounds": [[track.min_lat, track.min_lon], [track.max_lat, track.max_lon]],
+        "points": np.column_stack([np.round(lat[keep], 6), np.round(lon[keep], 6)]).tolist(),
+        "elevation_m": np.round(points[keep, ELE] / ELE_SCALE, 1).tolist() if track.has_elevation else None,
+    }
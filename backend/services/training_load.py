@@ -0,0 +1,260 @@
+"""
+Charge d'entraînement
+Session-RPE, ratio aigu:chronique (ACWR), monotonie et contrainte (strain)
+
+La table daily_loads est tenue à jour de façon incrémentale à chaque écriture
+de séance ; les séries sont calculées sur ces agrégats journaliers (O(jours)).
+"""
+
+from datetime import date as date_type, timedelta
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import select, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.models.daily_load import DailyLoad
+from backend.models.training_session import TrainingSession
+from backend.models.running_session import RunningSession
+
+# Fenêtres (jours)
+ACUTE_DAYS = 7
+CHRONIC_DAYS = 28
+
+
+# === CHARGE D'UNE SÉANCE ===
+
+def session_load(rpe: Optional[int], duration_min: Optional[int]) -> int:
+    """
+    Charge session-RPE (Foster) : RPE x durée en minutes
+
+    Returns:
+        Charge, 0 si RPE ou durée inconnus
+    """
+    if not rpe or not duration_min:
+        return 0
+    return int(rpe) * int(duration_min)
+
+
+def rpe_from_heart_rate(average_hr: Optional[int], max_hr: Optional[int]) -> Optional[int]:
+    """
+    Estime un RPE (1-10) depuis la FC moyenne en % de la FC max de la séance
+    Utilisé pour les sorties course sans RPE saisi
+
+    Returns:
+        RPE estimé ou None si FC inconnue
+    """
+    if not average_hr or not max_hr or max_hr <= 0:
+        return None
+    ratio = average_hr / max_hr
+    return int(min(max(round((ratio - 0.5) * 20), 1), 10))
+
+
+def training_session_load(session: TrainingSession) -> int:
+    """Charge d'une séance d'escalade"""
+    return session_load(session.rpe, session.duration_min)
+
+
+def running_session_load(session: RunningSession) -> int:
+    """Charge d'une sortie course (RPE saisi, sinon estimé depuis la FC)"""
+    rpe = session.rpe or rpe_from_heart_rate(session.average_heart_rate, session.max_heart_rate)
+    return session_load(rpe, session.duration_min)
+
+
+# === MISE À JOUR INCRÉMENTALE ===
+
+def apply_daily_load(
+    db: Session,
+    user_id: int,
+    day: date_type,
+    climbing_load: int = 0,
+    running_load: int = 0,
+    climbing_sessions: int = 0,
+    running_sessions: int = 0
+):
+    """
+    Ajoute des deltas à la ligne daily_loads d'un jour (créée si besoin)
+    UPDATE atomique (col = col + delta), INSERT en savepoint en cas de course
+
+    Args:
+        db: Session de base de données (commit par l'appelant)
+        user_id: ID de l'utilisateur
+        day: Jour concerné
+        climbing_load / running_load: Deltas de charge
+        climbing_sessions / running_sessions: Deltas de nombre de séances
+    """
+    values = {
+        DailyLoad.climbing_load: DailyLoad.climbing_load + climbing_load,
+        DailyLoad.running_load: DailyLoad.running_load + running_load,
+        DailyLoad.climbing_sessions: DailyLoad.climbing_sessions + climbing_sessions,
+        DailyLoad.running_sessions: DailyLoad.running_sessions + running_sessions,
+    }
+    row_filter = (DailyLoad.user_id == user_id, DailyLoad.date == day)
+
+    updated = db.query(DailyLoad).filter(*row_filter).update(values, synchronize_session=False)
+    if updated:
+        return
+
+    try:
+        with db.begin_nested():
+            db.add(DailyLoad(
+                user_id=user_id,
+                date=day,
+                climbing_load=climbing_load,
+                running_load=running_load,
+                climbing_sessions=climbing_sessions,
+                running_sessions=running_sessions
+            ))
+    except IntegrityError:
+        # Ligne créée entre-temps par une autre requête
+        db.query(DailyLoad).filter(*row_filter).update(values, synchronize_session=False)
+
+
+def record_training_session(db: Session, session: TrainingSession, sign: int = 1):
+    """
+    Répercute une séance d'escalade sur daily_loads
+    sign=1 à la création, -1 avant suppression/modification
+    """
+    apply_daily_load(
+        db, session.user_id, session.date,
+        climbing_load=sign * training_session_load(session),
+        climbing_sessions=sign
+    )
+
+
+def record_running_session(db: Session, session: RunningSession, sign: int = 1):
+    """
+    Répercute une sortie course sur daily_loads
+    sign=1 à la création, -1 avant suppression/modification
+    """
+    apply_daily_load(
+        db, session.user_id, session.date,
+        running_load=sign * running_session_load(session),
+        running_sessions=sign
+    )
+
+
+def rebuild_daily_loads(db: Session, user_id: int) -> int:
+    """
+    Recalcule entièrement daily_loads pour un utilisateur
+    Pour la reprise de l'existant ou une correction manuelle
+
+    Returns:
+        Nombre de jours écrits
+    """
+    days: dict = {}
+
+    def bucket(day):
+        return days.setdefault(day, {
+            "climbing_load": 0, "running_load": 0,
+            "climbing_sessions": 0, "running_sessions": 0,
+        })
+
+    for day, rpe, duration in db.execute(
+        select(TrainingSession.date, TrainingSession.rpe, TrainingSession.duration_min)
+        .where(TrainingSession.user_id == user_id)
+    ):
+        entry = bucket(day)
+        entry["climbing_load"] += session_load(rpe, duration)
+        entry["climbing_sessions"] += 1
+
+    for day, rpe, duration, avg_hr, max_hr in db.execute(
+        select(
+            RunningSession.date, RunningSession.rpe, RunningSession.duration_min,
+            RunningSession.average_heart_rate, RunningSession.max_heart_rate
+        ).where(RunningSession.user_id == user_id)
+    ):
+        entry = bucket(day)
+        entry["running_load"] += session_load(rpe or rpe_from_heart_rate(avg_hr, max_hr), duration)
+        entry["running_sessions"] += 1
+
+    db.query(DailyLoad).filter(DailyLoad.user_id == user_id).delete(synchronize_session=False)
+    if days:
+        db.execute(insert(DailyLoad), [
+            {"user_id": user_id, "date": day, **entry} for day, entry in days.items()
+        ])
+    return len(days)
+
+
+# === SÉRIES ===
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Somme glissante (fenêtre se terminant au jour courant) via cumsum"""
+    cumsum = np.concatenate([[0.0], np.cumsum(values, dtype=np.float64)])
+    result = cumsum[window:] - cumsum[:-window]
+    return np.concatenate([cumsum[1:window], result])
+
+
+def compute_load_series(
+    db: Session,
+    user_id: int,
+    date_from: date_type,
+    date_to: date_type
+) -> list[dict]:
+    """
+    Séries journalières de charge, ACWR, monotonie et strain
+
+    - ACWR : moyenne 7 jours / moyenne 28 jours
+    - Monotonie : moyenne 7 jours / écart-type 7 jours
+    - Strain : charge 7 jours x monotonie
+
+    Args:
+        db: Session de base de données
+        user_id: ID de l'utilisateur
+        date_from: Premier jour de la série
+        date_to: Dernier jour de la série
+
+    Returns:
+        Liste de dicts, un par jour
+    """
+    # Historique nécessaire pour la fenêtre chronique du premier jour
+    history_start = date_from - timedelta(days=CHRONIC_DAYS - 1)
+    n_days = (date_to - history_start).days + 1
+    if n_days <= 0:
+        return []
+
+    climbing = np.zeros(n_days, dtype=np.float64)
+    running = np.zeros(n_days, dtype=np.float64)
+
+    rows = db.execute(
+        select(DailyLoad.date, DailyLoad.climbing_load, DailyLoad.running_load).where(
+            DailyLoad.user_id == user_id,
+            DailyLoad.date >= history_start,
+            DailyLoad.date <= date_to
+        )
+    ).all()
+    if rows:
+        index = np.fromiter(((row[0] - history_start).days for row in rows), dtype=np.int64, count=len(rows))
+        climbing[index] = [row[1] for row in rows]
+        running[index] = [row[2] for row in rows]
+
+    total = climbing + running
+    acute_sum = _rolling_sum(total, ACUTE_DAYS)
+    acute = acute_sum / ACUTE_DAYS
+    chronic = _rolling_sum(total, CHRONIC_DAYS) / CHRONIC_DAYS
+
+    # Écart-type 7 jours : sqrt(E[x²] - E[x]²)
+    variance = np.maximum(_rolling_sum(total ** 2, ACUTE_DAYS) / ACUTE_DAYS - acute ** 2, 0.0)
+    std = np.sqrt(variance)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        acwr = np.where(chronic > 0, acute / chronic, np.nan)
+        monotony = np.where(std > 0, acute / std, np.nan)
+    strain = acute_sum * monotony
+
+    offset = CHRONIC_DAYS - 1
+    series = []
+    for i in range(offset, n_days):
+        series.append({
+            "date": history_start + timedelta(days=i),
+            "climbing_load": int(climbing[i]),
+            "running_load": int(running[i]),
+            "load": int(total[i]),
+            "acute_load": round(float(acute[i]), 1),
+            "chronic_load": round(float(chronic[i]), 1),
+            "acwr": None if np.isnan(acwr[i]) else round(float(acwr[i]), 2),
+            "monotony": None if np.isnan(monotony[i]) else round(float(monotony[i]), 2),
+            "strain": None if np.isnan(strain[i]) else round(float(strain[i]), 1),
+        })
+    return series
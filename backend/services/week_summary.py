@@ -0,0 +1,283 @@
+"""
+Résumés hebdomadaires
+Table user_week_summary : séances, minutes, kilomètres, dénivelé, charge et
+meilleure cotation par semaine ISO (une ligne par partie de semaine dans un mois)
+
+Tenue à jour de façon incrémentale dans la transaction de chaque écriture de
+séance (deltas, comme daily_loads) ; les statistiques hebdomadaires et
+mensuelles lisent quelques lignes indexées au lieu de parcourir les séances.
+La meilleure cotation (un maximum) ne se décrémente pas : elle est recalculée
+sur la partie de semaine quand la séance retirée pouvait la détenir.
+"""
+
+from datetime import date as date_type, timedelta
+from typing import Optional
+
+from sqlalchemy import select, insert, func, case, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.models.user_week_summary import UserWeekSummary
+from backend.models.training_session import TrainingSession
+from backend.models.session_climb import SessionClimb
+from backend.models.running_session import RunningSession
+from backend.services.climbs import SEND_STYLES
+from backend.services.grades import grade_to_rank
+from backend.services.training_load import session_load, rpe_from_heart_rate, training_session_load, running_session_load
+
+# Compteurs additifs (deltas)
+COUNTERS = (
+    "training_sessions", "training_minutes", "climbs", "sends",
+    "running_sessions", "running_minutes", "distance_m", "elevation_gain_m",
+    "climbing_load", "running_load",
+)
+
+
+# === PÉRIODES ===
+
+def week_start_of(day: date_type) -> date_type:
+    """Lundi de la semaine ISO d'un jour"""
+    return day - timedelta(days=day.weekday())
+
+
+def period_of(day: date_type) -> tuple[date_type, date_type]:
+    """Clé (début de semaine, début de mois) de la ligne d'un jour"""
+    return week_start_of(day), day.replace(day=1)
+
+
+def period_bounds(day: date_type) -> tuple[date_type, date_type]:
+    """Premier et dernier jour de la partie de semaine (dans le mois) d'un jour"""
+    week_start, month_start = period_of(day)
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    return max(week_start, month_start), min(week_start + timedelta(days=6), next_month - timedelta(days=1))
+
+
+# === MISE À JOUR INCRÉMENTALE ===
+
+def apply_week_summary(db: Session, user_id: int, day: date_type, best_grade_rank: Optional[int] = None, **deltas):
+    """
+    Ajoute des deltas à la ligne de la partie de semaine d'un jour (créée si besoin)
+    UPDATE atomique (col = col + delta), INSERT en savepoint en cas de course
+
+    Args:
+        db: Session de base de données (commit par l'appelant)
+        user_id: ID de l'utilisateur
+        day: Jour de la séance
+        best_grade_rank: Cotation à prendre en compte pour le maximum (ajout uniquement)
+        **deltas: Deltas des compteurs (cf. COUNTERS)
+    """
+    week_start, month_start = period_of(day)
+    values = {getattr(UserWeekSummary, name): getattr(UserWeekSummary, name) + delta for name, delta in deltas.items()}
+    if best_grade_rank:
+        column = UserWeekSummary.best_grade_rank
+        values[column] = case((or_(column.is_(None), column < best_grade_rank), best_grade_rank), else_=column)
+    row_filter = (
+        UserWeekSummary.user_id == user_id,
+        UserWeekSummary.week_start == week_start,
+        UserWeekSummary.month_start == month_start,
+    )
+
+    updated = db.query(UserWeekSummary).filter(*row_filter).update(values, synchronize_session=False)
+    if updated:
+        return
+
+    try:
+        with db.begin_nested():
+            db.add(UserWeekSummary(
+                user_id=user_id,
+                week_start=week_start,
+                month_start=month_start,
+                best_grade_rank=best_grade_rank,
+                **deltas
+            ))
+    except IntegrityError:
+        # Ligne créée entre-temps par une autre requête
+        db.query(UserWeekSummary).filter(*row_filter).update(values, synchronize_session=False)
+
+
+def _session_climb_stats(db: Session, session_id: int) -> tuple[int, int, Optional[int]]:
+    """Voies, enchaînements et meilleure voie enchaînée (rang) d'une séance"""
+    is_send = SessionClimb.style.in_(SEND_STYLES)
+    climbs, sends, best = db.execute(
+        select(
+            func.count(SessionClimb.id),
+            func.sum(case((is_send, 1), else_=0)),
+            func.max(case((is_send, SessionClimb.grade_rank), else_=None)),
+        ).where(SessionClimb.session_id == session_id)
+    ).one()
+    return climbs, sends or 0, best
+
+
+def _refresh_best_grade(db: Session, user_id: int, day: date_type, exclude_session_id: int):
+    """Recalcule la meilleure cotation d'une partie de semaine, sans une séance (en cours de retrait)"""
+    first_day, last_day = period_bounds(day)
+    best_climb = db.execute(
+        select(func.max(SessionClimb.grade_rank)).where(
+            SessionClimb.user_id == user_id,
+            SessionClimb.date.between(first_day, last_day),
+            SessionClimb.style.in_(SEND_STYLES),
+            SessionClimb.session_id != exclude_session_id,
+        )
+    ).scalar()
+    best_grades = db.execute(
+        select(TrainingSession.best_grade).where(
+            TrainingSession.user_id == user_id,
+            TrainingSession.date.between(first_day, last_day),
+            TrainingSession.best_grade.isnot(None),
+            TrainingSession.id != exclude_session_id,
+        )
+    ).scalars().all()
+
+    best = max([best_climb or 0] + [grade_to_rank(grade) or 0 for grade in best_grades]) or None
+    week_start, month_start = period_of(day)
+    db.query(UserWeekSummary).filter(
+        UserWeekSummary.user_id == user_id,
+        UserWeekSummary.week_start == week_start,
+        UserWeekSummary.month_start == month_start,
+    ).update({UserWeekSummary.best_grade_rank: best}, synchronize_session=False)
+
+
+def record_training_week(db: Session, session: TrainingSession, sign: int = 1):
+    """
+    Répercute une séance d'escalade sur user_week_summary
+    sign=1 après création/modification (voies déjà écrites), -1 avant
+    suppression/modification
+    """
+    climbs, sends, best_climb = _session_climb_stats(db, session.id)
+    best = max(best_climb or 0, grade_to_rank(session.best_grade) or 0) or None
+
+    apply_week_summary(
+        db, session.user_id, session.date,
+        best_grade_rank=best if sign > 0 else None,
+        training_sessions=sign,
+        training_minutes=sign * (session.duration_min or 0),
+        climbs=sign * climbs,
+        sends=sign * sends,
+        climbing_load=sign * training_session_load(session),
+    )
+
+    if sign < 0 and best:
+        week_start, month_start = period_of(session.date)
+        current = db.execute(
+            select(UserWeekSummary.best_grade_rank).where(
+                UserWeekSummary.user_id == session.user_id,
+                UserWeekSummary.week_start == week_start,
+                UserWeekSummary.month_start == month_start,
+            )
+        ).scalar()
+        if current is not None and current <= best:
+            _refresh_best_grade(db, session.user_id, session.date, session.id)
+
+
+def record_running_week(db: Session, session: RunningSession, sign: int = 1):
+    """
+    Répercute une sortie course sur user_week_summary
+    sign=1 à la création, -1 avant suppression/modification
+    """
+    apply_week_summary(
+        db, session.user_id, session.date,
+        running_sessions=sign,
+        running_minutes=sign * (session.duration_min or 0),
+        distance_m=sign * round((session.distance_km or 0) * 1000),
+        elevation_gain_m=sign * (session.elevation_gain_m or 0),
+        running_load=sign * running_session_load(session),
+    )
+
+
+def rebuild_week_summaries(db: Session, user_id: int) -> int:
+    """
+    Recalcule entièrement user_week_summary pour un utilisateur
+    Pour la reprise de l'existant ou une correction manuelle
+
+    Returns:
+        Nombre de lignes écrites
+    """
+    periods: dict = {}
+
+    def bucket(day):
+        key = period_of(day)
+        if key not in periods:
+            periods[key] = {name: 0 for name in COUNTERS}
+            periods[key]["best_grade_rank"] = None
+        return periods[key]
+
+    is_send = SessionClimb.style.in_(SEND_STYLES)
+    climb_stats = {
+        session_id: (climbs, sends or 0, best)
+        for session_id, climbs, sends, best in db.execute(
+            select(
+                SessionClimb.session_id,
+                func.count(SessionClimb.id),
+                func.sum(case((is_send, 1), else_=0)),
+                func.max(case((is_send, SessionClimb.grade_rank), else_=None)),
+            ).where(SessionClimb.user_id == user_id).group_by(SessionClimb.session_id)
+        )
+    }
+
+    for session_id, day, duration, rpe, best_grade in db.execute(
+        select(
+            TrainingSession.id, TrainingSession.date, TrainingSession.duration_min,
+            TrainingSession.rpe, TrainingSession.best_grade
+        ).where(TrainingSession.user_id == user_id)
+    ):
+        climbs, sends, best_climb = climb_stats.get(session_id, (0, 0, None))
+        best = max(best_climb or 0, grade_to_rank(best_grade) or 0) or None
+        entry = bucket(day)
+        entry["training_sessions"] += 1
+        entry["training_minutes"] += duration or 0
+        entry["climbs"] += climbs
+        entry["sends"] += sends
+        entry["climbing_load"] += session_load(rpe, duration)
+        if best and (entry["best_grade_rank"] is None or best > entry["best_grade_rank"]):
+            entry["best_grade_rank"] = best
+
+    for day, duration, distance, elevation, rpe, avg_hr, max_hr in db.execute(
+        select(
+            RunningSession.date, RunningSession.duration_min, RunningSession.distance_km,
+            RunningSession.elevation_gain_m, RunningSession.rpe,
+            RunningSession.average_heart_rate, RunningSession.max_heart_rate
+        ).where(RunningSession.user_id == user_id)
+    ):
+        entry = bucket(day)
+        entry["running_sessions"] += 1
+        entry["running_minutes"] += duration or 0
+        entry["distance_m"] += round((distance or 0) * 1000)
+        entry["elevation_gain_m"] += elevation or 0
+        entry["running_load"] += session_load(rpe or rpe_from_heart_rate(avg_hr, max_hr), duration)
+
+    db.query(UserWeekSummary).filter(UserWeekSummary.user_id == user_id).delete(synchronize_session=False)
+    if periods:
+        db.execute(insert(UserWeekSummary), [
+            {"user_id": user_id, "week_start": week_start, "month_start": month_start, **entry}
+            for (week_start, month_start), entry in periods.items()
+        ])
+    return len(periods)
+
+
+# === LECTURES ===
+
+def summary_columns(group_column):
+    """Colonnes agrégées (sommes + meilleure cotation) regroupées par semaine ou par mois"""
+    return [group_column] + [
+        func.sum(getattr(UserWeekSummary, name)).label(name) for name in COUNTERS
+    ] + [func.max(UserWeekSummary.best_grade_rank).label("best_grade_rank")]
+
+
+def weekly_summaries(db: Session, user_id: int, since: date_type) -> list:
+    """Totaux par semaine ISO depuis une date (parties de semaine regroupées)"""
+    return db.execute(
+        select(*summary_columns(UserWeekSummary.week_start))
+        .where(UserWeekSummary.user_id == user_id, UserWeekSummary.week_start >= week_start_of(since))
+        .group_by(UserWeekSummary.week_start)
+        .order_by(UserWeekSummary.week_start)
+    ).all()
+
+
+def monthly_summaries(db: Session, user_id: int, since: date_type) -> list:
+    """Totaux par mois depuis une date (mois entier du premier mois)"""
+    return db.execute(
+        select(*summary_columns(UserWeekSummary.month_start))
+        .where(UserWeekSummary.user_id == user_id, UserWeekSummary.month_start >= since.replace(day=1))
+        .group_by(UserWeekSummary.month_start)
+        .order_by(UserWeekSummary.month_start)
+    ).all()
@@ -0,0 +1,4 @@
+"""
+Benchmarks de l'API
+Jeux de données volumineux + mesure des routes critiques dans le processus (ASGI)
+"""
@@ -0,0 +1,498 @@
+"""
+Génération de jeux de données volumineux
+Utilisateurs, séances d'escalade (et voies détaillées), sorties course,
+grandes voies, objectifs, planning, charge journalière et résumés hebdomadaires
+
+- Insertions Core par lots (executemany) : chaque INSERT est compilé une
+  fois, les valeurs sont converties par les processeurs du dialecte puis
+  envoyées telles quelles au driver. Pas d'objets ORM.
+- IDs attribués à l'avance par blocs : chaque tranche d'utilisateurs (shard)
+  a ses propres plages d'IDs et peut être générée dans un processus séparé.
+- Un seul hash de mot de passe pour tous les utilisateurs (bcrypt est
+  volontairement lent).
+- Chaque utilisateur a son propre générateur aléatoire (seed + ID) : un jeu
+  de données est reproductible à l'identique.
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict, replace
+from datetime import date as date_type, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Optional
+
+from sqlalchemy import create_engine, event, insert, select, func
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+
+from backend.models.user import User, UserRole
+from backend.models.training_session import TrainingSession, ClimbingStyle
+from backend.models.session_climb import SessionClimb
+from backend.models.running_session import RunningSession
+from backend.models.route import Route, RouteType
+from backend.models.goal_category import GoalCategory
+from backend.models.planning import Planning, ActivityType, TimeSlot
+from backend.models.daily_load import DailyLoad
+from backend.models.user_week_summary import UserWeekSummary
+from backend.services.climbs import SEND_STYLES
+from backend.services.grades import FRENCH_GRADES
+from backend.services.training_load import session_load
+from backend.services.week_summary import COUNTERS as WEEK_COUNTERS, period_of
+
+# Mot de passe de tous les utilisateurs générés
+BENCH_PASSWORD = "Bench2024!"
+
+LOCATIONS = (
+    "Block Out", "Arkose", "Climb Up", "Vertical'Art", "Ceüse", "Saint-Léger",
+    "Buoux", "Orpierre", "Verdon", "Calanques", "Annot", "Fontainebleau",
+)
+SESSION_TYPES = ("force", "resistance", "continuity", "bloc", "voie", "technique")
+RUN_TYPES = ("footing", "fractionné", "sortie longue", "trail", "côtes")
+NOTES = (
+    "Bonnes sensations", "Fatigue dans les avant-bras", "Douleur au doigt",
+    "Conditions parfaites", "Trop chaud", "Travail des mouvements clés", None, None,
+)
+STYLES = (ClimbingStyle.ONSIGHT, ClimbingStyle.FLASH, ClimbingStyle.REDPOINT, ClimbingStyle.PROJECT)
+
+# Ordre d'insertion (clés étrangères)
+TABLES = (
+    User.__table__,
+    GoalCategory.__table__,
+    TrainingSession.__table__,
+    SessionClimb.__table__,
+    RunningSession.__table__,
+    Route.__table__,
+    Planning.__table__,
+    DailyLoad.__table__,
+    UserWeekSummary.__table__,
+)
+
+
+@dataclass(frozen=True)
+class DatasetConfig:
+    """Volume du jeu de données"""
+    users: int = 200
+    years: float = 1.0
+    training_per_week: float = 3.0
+    running_per_week: float = 2.0
+    climbs_per_session: int = 5
+    routes_per_user: int = 30
+    goal_categories: int = 4
+    planning_weeks: int = 8
+    chunk_size: int = 5000
+    seed: int = 42
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+# Tailles prédéfinies
+SCALES = {
+    "small": DatasetConfig(),
+    "medium": DatasetConfig(users=2000, years=2.0),
+    "large": DatasetConfig(users=10000, years=3.0),
+}
+
+
+def scaled_config(scale: str, **overrides) -> DatasetConfig:
+    """Configuration d'une taille prédéfinie, avec surcharges (valeurs None ignorées)"""
+    return replace(SCALES[scale], **{key: value for key, value in overrides.items() if value is not None})
+
+
+def password_hash() -> str:
+    """Hash unique de BENCH_PASSWORD (calculé une fois)"""
+    from backend.auth import get_password_hash
+    return get_password_hash(BENCH_PASSWORD)
+
+
+# === ÉCRITURE PAR LOTS ===
+
+class BulkWriter:
+    """
+    Tampons par table, vidés par executemany quand ils atteignent chunk_size
+
+    L'INSERT de chaque table est compilé une seule fois ; les valeurs passent
+    par les processeurs de types du dialecte (dates, enums) et sont envoyées
+    directement au driver, sans traitement par ligne de SQLAlchemy.
+    """
+
+    def __init__(self, engine: Engine, chunk_size: int):
+        self.engine = engine
+        self.chunk_size = chunk_size
+        self.buffers = {table.name: [] for table in TABLES}
+        self.counts = {table.name: 0 for table in TABLES}
+        self._tables = {table.name: table for table in TABLES}
+        self._statements = {}
+
+    def add(self, table_name: str, row: dict):
+        buffer = self.buffers[table_name]
+        buffer.append(row)
+        if len(buffer) >= self.chunk_size:
+            self.flush()
+
+    def _statement(self, table_name: str, keys: tuple):
+        """INSERT compilé + conversion d'une ligne en paramètres du driver"""
+        cached = self._statements.get(table_name)
+        if cached and cached[0] == keys:
+            return cached[1], cached[2]
+
+        dialect = self.engine.dialect
+        table = self._tables[table_name]
+        compiled = insert(table).compile(dialect=dialect, column_keys=list(keys))
+        processors = {
+            key: table.c[key].type.dialect_impl(dialect).bind_processor(dialect)
+            for key in keys
+        }
+        # Dates, horodatages et enums se répètent énormément : conversion mémorisée
+        processors = {key: lru_cache(maxsize=4096)(processor) for key, processor in processors.items() if processor}
+
+        if compiled.positional:
+            order = [compiled.binds[name].key for name in compiled.positiontup]
+            getter = itemgetter(*order)
+            convert = [(index, processors[key]) for index, key in enumerate(order) if key in processors]
+
+            def params(row: dict):
+                values = list(getter(row))
+                for index, process in convert:
+                    if values[index] is not None:
+                        values[index] = process(values[index])
+                return tuple(values)
+        else:
+            def params(row: dict):
+                values = dict(row)
+                for key, process in processors.items():
+                    if values[key] is not None:
+                        values[key] = process(values[key])
+                return values
+
+        self._statements[table_name] = (keys, compiled.string, params)
+        return compiled.string, params
+
+    def flush(self):
+        """Écrit tous les tampons (ordre des clés étrangères), une transaction"""
+        with self.engine.begin() as connection:
+            for name in self._tables:
+                rows = self.buffers[name]
+                if rows:
+                    sql, params = self._statement(name, tuple(rows[0]))
+                    connection.exec_driver_sql(sql, [params(row) for row in rows])
+                    self.counts[name] += len(rows)
+                    self.buffers[name] = []
+
+
+def next_ids(engine: Engine) -> dict[str, int]:
+    """Premier ID libre de chaque table (le jeu peut compléter une base existante)"""
+    with engine.connect() as connection:
+        return {
+            table.name: (connection.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+            for table in TABLES
+        }
+
+
+# === GÉNÉRATION ===
+
+def _history_days(config: DatasetConfig) -> int:
+    return max(int(config.years * 365), 7)
+
+
+def _activity_count(days: int, per_week: float) -> int:
+    return int(days / 7 * per_week)
+
+
+def _dates(rng: random.Random, start: date_type, days: int, per_week: float) -> list[date_type]:
+    """Dates d'activité réparties aléatoirement (per_week en moyenne)"""
+    return sorted(start + timedelta(days=rng.randrange(days)) for _ in range(_activity_count(days, per_week)))
+
+
+def rows_per_user(config: DatasetConfig) -> dict[str, int]:
+    """
+    Lignes générées par utilisateur et par table (taille des blocs d'IDs)
+    Exact pour toutes les tables sauf daily_loads et user_week_summary
+    (majorants : une ligne par jour actif / par partie de semaine active)
+    """
+    days = _history_days(config)
+    training = _activity_count(days, config.training_per_week)
+    running = _activity_count(days, config.running_per_week)
+    return {
+        "users": 1,
+        "goal_categories": config.goal_categories,
+        "training_sessions": training,
+        "session_climbs": training * config.climbs_per_session,
+        "running_sessions": running,
+        "routes": config.routes_per_user,
+        "planning": config.planning_weeks * 7 * 2,
+        "daily_loads": training + running,
+        "user_week_summary": training + running,
+    }
+
+
+def generate_user(
+    writer: BulkWriter,
+    ids: dict[str, int],
+    user_id: int,
+    config: DatasetConfig,
+    today: date_type,
+    hashed_password: str
+):
+    """Génère toutes les données d'un utilisateur dans les tampons"""
+    rng = random.Random(config.seed * 1_000_003 + user_id)
+    now = datetime.utcnow()
+    days = _history_days(config)
+    start = today - timedelta(days=days - 1)
+    level = rng.randint(12, 28)  # Rang de cotation habituel (5c+ .. 7c+)
+    loads: dict[date_type, list[int]] = {}
+    weeks: dict[tuple, dict] = {}
+
+    def week(day: date_type) -> dict:
+        """Ligne user_week_summary de la partie de semaine d'un jour"""
+        key = period_of(day)
+        if key not in weeks:
+            weeks[key] = dict.fromkeys(WEEK_COUNTERS, 0)
+            weeks[key]["best_grade_rank"] = None
+        return weeks[key]
+
+    def next_id(table: str) -> int:
+        value = ids[table]
+        ids[table] += 1
+        return value
+
+    writer.add("users", {
+        "id": user_id,
+        "email": f"bench{user_id}@bench.local",
+        "username": f"bench{user_id}",
+        "password_hash": hashed_password,
+        "first_name": "Bench",
+        "last_name": str(user_id),
+        "is_active": True,
+        "is_verified": True,
+        "role": UserRole.COACH if user_id % 50 == 0 else UserRole.USER,
+        "token_version": 0,
+        "created_at": now,
+        "updated_at": now,
+    })
+
+    goal_ids = []
+    for order in range(1, config.goal_categories + 1):
+        goal_id = next_id("goal_categories")
+        goal_ids.append(goal_id)
+        writer.add("goal_categories", {
+            "id": goal_id, "user_id": user_id, "name": f"Objectif {order}", "description": None,
+            "required_count": rng.randint(4, 12), "criteria_json": "{}", "order": order,
+            "created_at": now, "updated_at": now,
+        })
+
+    for day in _dates(rng, start, days, config.training_per_week):
+        session_id = next_id("training_sessions")
+        duration = rng.choice((60, 90, 120, 150))
+        rpe = rng.randint(4, 9)
+        ranks = [min(max(level + rng.randint(-4, 2), 1), len(FRENCH_GRADES)) for _ in range(config.climbs_per_session)]
+        best_rank = max(ranks, default=0)
+        # La séance avant ses voies : un lot ne contient jamais d'enfant sans parent
+        writer.add("training_sessions", {
+            "id": session_id, "user_id": user_id, "planning_id": None, "date": day,
+            "duration_min": duration, "session_type": rng.choice(SESSION_TYPES),
+            "location": rng.choice(LOCATIONS), "routes_json": None,
+            "best_grade": FRENCH_GRADES[best_rank - 1] if best_rank else None, "best_style": None,
+            "rpe": rpe, "fatigue": rng.randint(1, 10), "notes": rng.choice(NOTES),
+            "created_at": now, "updated_at": now,
+        })
+        styles = []
+        for position, rank in enumerate(ranks):
+            style = rng.choice(STYLES).value
+            styles.append(style)
+            writer.add("session_climbs", {
+                "id": next_id("session_climbs"), "session_id": session_id, "user_id": user_id,
+                "date": day, "position": position, "grade": FRENCH_GRADES[rank - 1],
+                "grade_rank": rank, "style": style, "tries": rng.randint(1, 4),
+            })
+        entry = loads.setdefault(day, [0, 0, 0, 0])
+        entry[0] += session_load(rpe, duration)
+        entry[2] += 1
+
+        # Même calcul que week_summary.record_training_week (best_grade = voie la plus dure)
+        summary = week(day)
+        summary["training_sessions"] += 1
+        summary["training_minutes"] += duration
+        summary["climbs"] += len(ranks)
+        summary["sends"] += sum(style in SEND_STYLES for style in styles)
+        summary["climbing_load"] += session_load(rpe, duration)
+        if best_rank and (summary["best_grade_rank"] is None or best_rank > summary["best_grade_rank"]):
+            summary["best_grade_rank"] = best_rank
+
+    for day in _dates(rng, start, days, config.running_per_week):
+        duration = rng.randint(25, 150)
+        distance = round(duration / rng.uniform(4.5, 7.0), 2)
+        elevation = rng.randint(0, 1500)
+        rpe = rng.randint(3, 9)
+        writer.add("running_sessions", {
+            "id": next_id("running_sessions"), "user_id": user_id, "date": day,
+            "duration_min": duration, "distance_km": distance,
+            "elevation_gain_m": elevation, "average_pace_min_km": round(duration / distance, 2),
+            "average_heart_rate": rng.randint(125, 170), "max_heart_rate": rng.randint(170, 195),
+            "session_type": rng.choice(RUN_TYPES), "location": rng.choice(LOCATIONS),
+            "comments": rng.choice(NOTES), "rpe": rpe, "created_at": now, "updated_at": now,
+        })
+        entry = loads.setdefault(day, [0, 0, 0, 0])
+        entry[1] += session_load(rpe, duration)
+        entry[3] += 1
+
+        summary = week(day)
+        summary["running_sessions"] += 1
+        summary["running_minutes"] += duration
+        summary["distance_m"] += round(distance * 1000)
+        summary["elevation_gain_m"] += elevation
+        summary["running_load"] += session_load(rpe, duration)
+
+    for index in range(config.routes_per_user):
+        rank = min(max(level + rng.randint(-8, 0), 1), len(FRENCH_GRADES))
+        writer.add("routes", {
+            "id": next_id("routes"), "user_id": user_id,
+            "goal_category_id": rng.choice(goal_ids) if goal_ids and rng.random() < 0.5 else None,
+            "name": f"Voie {index + 1}", "location": rng.choice(LOCATIONS),
+            "grade": FRENCH_GRADES[rank - 1], "type": rng.choice(tuple(RouteType)),
+            "length_m": rng.randint(100, 500), "pitch_count": rng.randint(3, 12),
+            "date_completed": start + timedelta(days=rng.randrange(days)),
+            "style": rng.choice(STYLES).value, "photo_url": None, "comments": rng.choice(NOTES),
+            "rating": rng.randint(1, 5), "validated_for_de": rng.random() < 0.3,
+            "created_at": now, "updated_at": now,
+        })
+
+    planning_start = today - timedelta(days=today.weekday())
+    for offset in range(config.planning_weeks * 7):
+        day = planning_start + timedelta(days=offset)
+        for slot in (TimeSlot.MORNING, TimeSlot.EVENING):
+            activity = rng.choice(tuple(ActivityType))
+            writer.add("planning", {
+                "id": next_id("planning"), "user_id": user_id, "date": day, "time_slot": slot,
+                "time_start": None, "activity_type": activity, "activity_id": None,
+                "title": activity.value, "description": None, "completed": day < today,
+                "completed_at": None, "notes": None, "created_at": now, "updated_at": now,
+            })
+
+    for day, (climbing_load, running_load, climbing_sessions, running_sessions) in loads.items():
+        writer.add("daily_loads", {
+            "id": next_id("daily_loads"), "user_id": user_id, "date": day,
+            "climbing_load": climbing_load, "running_load": running_load,
+            "climbing_sessions": climbing_sessions, "running_sessions": running_sessions,
+            "updated_at": now,
+        })
+
+    for (week_start, month_start), summary in weeks.items():
+        writer.add("user_week_summary", {
+            "id": next_id("user_week_summary"), "user_id": user_id,
+            "week_start": week_start, "month_start": month_start,
+            **summary, "updated_at": now,
+        })
+
+
+def generate_shard(
+    engine: Engine,
+    config: DatasetConfig,
+    first_user: int,
+    user_count: int,
+    first_ids: dict[str, int],
+    today: date_type,
+    hashed_password: str
+) -> dict[str, int]:
+    """
+    Génère une tranche d'utilisateurs consécutifs
+
+    Args:
+        first_user: ID du premier utilisateur de la tranche
+        user_count: Nombre d'utilisateurs
+        first_ids: Début du bloc d'IDs de la tranche pour chaque table
+
+    Returns:
+        Lignes insérées par table
+    """
+    ids = dict(first_ids)
+    writer = BulkWriter(engine, config.chunk_size)
+    for user_id in range(first_user, first_user + user_count):
+        generate_user(writer, ids, user_id, config, today, hashed_password)
+    writer.flush()
+    return writer.counts
+
+
+def _shard_engine(url: str) -> Engine:
+    """Moteur propre à un processus de génération"""
+    if url.startswith("sqlite"):
+        # Un seul écrivain à la fois sous SQLite : les processus attendent le verrou
+        engine = create_engine(url, poolclass=NullPool, connect_args={"timeout": 600})
+
+        @event.listens_for(engine, "connect")
+        def fast_writes(dbapi_connection, connection_record):
+            # Jeu de données jetable : pas de fsync à chaque transaction
+            dbapi_connection.execute("PRAGMA synchronous=OFF")
+
+        return engine
+    return create_engine(url, poolclass=NullPool)
+
+
+def _generate_shard_in_process(url: str, *args) -> dict[str, int]:
+    engine = _shard_engine(url)
+    try:
+        return generate_shard(engine, *args)
+    finally:
+        engine.dispose()
+
+
+def generate(
+    engine: Engine,
+    config: DatasetConfig,
+    hashed_password: Optional[str] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    workers: int = 1,
+    shard_size: int = 250
+) -> dict[str, int]:
+    """
+    Génère un jeu de données complet
+
+    Les utilisateurs sont découpés en tranches de shard_size ; chaque tranche
+    reçoit des plages d'IDs disjointes (rows_per_user), ce qui permet de les
+    générer dans des processus séparés sans coordination.
+
+    Args:
+        engine: Moteur cible (tables déjà créées)
+        config: Volume
+        hashed_password: Hash de BENCH_PASSWORD (calculé si absent)
+        progress: Appelé avec (utilisateurs générés, total) après chaque tranche
+        workers: Processus de génération (1 = dans le processus courant)
+        shard_size: Utilisateurs par tranche
+
+    Returns:
+        Lignes insérées par table
+    """
+    hashed_password = hashed_password or password_hash()
+    base = next_ids(engine)
+    per_user = rows_per_user(config)
+    today = date_type.today()
+
+    shards = []
+    for offset in range(0, config.users, shard_size):
+        count = min(shard_size, config.users - offset)
+        first_ids = {table: base[table] + offset * per_user[table] for table in base}
+        shards.append((config, base["users"] + offset, count, first_ids, today, hashed_password))
+
+    counts = {table.name: 0 for table in TABLES}
+    done = 0
+
+    def collect(shard_counts: dict[str, int], users: int):
+        nonlocal done
+        for table, value in shard_counts.items():
+            counts[table] += value
+        done += users
+        if progress:
+            progress(done, config.users)
+
+    if workers <= 1:
+        for shard in shards:
+            collect(generate_shard(engine, *shard), shard[2])
+        return counts
+
+    url = engine.url.render_as_string(hide_password=False)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_generate_shard_in_process, url, *shard): shard[2] for shard in shards}
+        for future in as_completed(futures):
+            collect(future.result(), futures[future])
+    return counts
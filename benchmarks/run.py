@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Benchmark des routes critiques de l'API
+
+Génère (ou réutilise) un jeu de données, appelle les routes dans le
+processus via ASGI (pas de réseau ni de serveur) et produit un rapport JSON :
+latences p50/p95/p99 et nombre de requêtes SQL par appel HTTP.
+
+Usage :
+    python -m benchmarks.run                                  # SQLite, taille small
+    python -m benchmarks.run --scale large --output bench.json
+    python -m benchmarks.run --db mysql --reset               # MySQL local (DB_* du .env)
+    python -m benchmarks.run --reuse --compare baseline.json  # Échec si p95 régresse
+
+⚠️ --reset supprime toutes les tables de la base cible : base dédiée uniquement.
+Hors SQLite (fichier dédié), refusé si ENVIRONMENT vaut production.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# === SCÉNARIOS ===
+# (nom, méthode, chemin) ; le chemin reçoit le contexte de l'utilisateur tiré
+# au sort : {"page": décalage proche de la fin de ses listes}
+
+SCENARIOS = {
+    "login": ("POST", "/api/auth/login"),
+    "dashboard": ("GET", "/api/stats/dashboard"),
+    "monthly_volume": ("GET", "/api/stats/monthly-volume?months=12"),
+    "training_load": ("GET", "/api/stats/training-load?days=90"),
+    "running_analytics": ("GET", "/api/stats/running?weeks=52"),
+    "goals": ("GET", "/api/goals"),
+    "training_sessions_deep": ("GET", "/api/sessions/training?skip={training_skip}&limit=50"),
+    "running_sessions_deep": ("GET", "/api/running?skip={running_skip}&limit=50"),
+    "routes_deep": ("GET", "/api/routes?skip={routes_skip}&limit=20"),
+    "planning": ("GET", "/api/sessions/planning?skip={planning_skip}&limit=50"),
+}
+
+
+def configure_environment(args):
+    """Variables d'environnement lues par backend.config (avant tout import backend)"""
+    os.environ["DATABASE_TYPE"] = args.db
+    if args.db == "sqlite":
+        os.environ["SQLITE_PATH"] = str(args.sqlite_path)
+    # Pas d'envoi d'emails ni de tâches de fond pendant la mesure
+    os.environ["SMTP_ENABLED"] = "False"
+    os.environ["MAINTENANCE_ENABLED"] = "False"
+    os.environ["DEBUG"] = "False"
+    for name in ("SECRET_KEY", "DB_PASSWORD", "SMTP_PASSWORD"):
+        os.environ.setdefault(name, "benchmark")
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Percentile par interpolation linéaire"""
+    import numpy as np
+    return float(np.percentile(np.asarray(values, dtype=np.float64), q)) if values else 0.0
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+# === JEU DE DONNÉES ===
+
+def prepare_dataset(args) -> dict:
+    """Crée les tables et génère le jeu de données (sauf --reuse)"""
+    from backend.database import drop_all_tables, engine, init_db
+    from benchmarks.dataset import generate, scaled_config
+
+    config = scaled_config(args.scale, users=args.users, years=args.years)
+
+    if args.reuse:
+        return {"config": config.as_dict(), "reused": True, "rows": {}}
+
+    # SQLite : le fichier dédié est déjà supprimé par main()
+    if args.reset and args.db != "sqlite":
+        init_db()  # Enregistre tous les modèles avant la suppression
+        drop_all_tables()
+    init_db()
+
+    started = time.perf_counter()
+    rows = generate(
+        engine, config,
+        progress=lambda done, total: print(f"   {done}/{total} utilisateurs", end="\r", file=sys.stderr),
+        workers=args.workers
+    )
+    elapsed = time.perf_counter() - started
+    print(f"   ✅ {sum(rows.values())} lignes en {elapsed:.1f}s" + " " * 20, file=sys.stderr)
+
+    return {"config": config.as_dict(), "reused": False, "rows": rows, "seconds": round(elapsed, 2)}
+
+
+def load_users(sample: int, seed: int) -> list[dict]:
+    """Utilisateurs du jeu de données tirés au sort, avec token et décalages de pagination"""
+    from sqlalchemy import select, func
+    from backend.auth import create_access_token
+    from backend.database import engine
+    from backend.models.user import User
+    from backend.models.training_session import TrainingSession
+    from backend.models.running_session import RunningSession
+    from backend.models.route import Route
+    from backend.models.planning import Planning
+
+    with engine.connect() as connection:
+        users = connection.execute(
+            select(User.id, User.email, User.token_version).where(User.email.like("bench%@bench.local"))
+        ).all()
+        if not users:
+            raise SystemExit("❌ Aucun utilisateur de benchmark : relancer sans --reuse")
+
+        chosen = random.Random(seed).sample(users, min(sample, len(users)))
+        ids = [user.id for user in chosen]
+
+        def counts(model):
+            return dict(connection.execute(
+                select(model.user_id, func.count(model.id))
+                .where(model.user_id.in_(ids))
+                .group_by(model.user_id)
+            ).all())
+
+        training, running, routes, planning = counts(TrainingSession), counts(RunningSession), counts(Route), counts(Planning)
+
+    def deep(total: int, page: int) -> int:
+        # Dernière page complète : le pire cas de la pagination par décalage
+        return max(total - page, 0)
+
+    return [
+        {
+            "email": user.email,
+            "token": create_access_token(data={"sub": user.email, "ver": user.token_version or 0}),
+            "training_skip": deep(training.get(user.id, 0), 50),
+            "running_skip": deep(running.get(user.id, 0), 50),
+            "routes_skip": deep(routes.get(user.id, 0), 20),
+            "planning_skip": deep(planning.get(user.id, 0), 50),
+        }
+        for user in chosen
+    ]
+
+
+# === MESURE ===
+
+class QueryCounter:
+    """Compte les requêtes SQL émises par le moteur de l'application"""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+
+async def run_scenario(client, counter: QueryCounter, name: str, users: list[dict], requests: int, warmup: int, seed: int) -> dict:
+    """Appels séquentiels d'un scénario (la mesure d'une requête n'est pas perturbée par les autres)"""
+    from benchmarks.dataset import BENCH_PASSWORD
+
+    method, template = SCENARIOS[name]
+    rng = random.Random(seed)
+    latencies, queries, errors = [], [], 0
+
+    for index in range(warmup + requests):
+        user = rng.choice(users)
+        path = template.format(**user)
+        if name == "login":
+            kwargs = {"data": {"username": user["email"], "password": BENCH_PASSWORD}}
+        else:
+            kwargs = {"headers": {"Authorization": f"Bearer {user['token']}"}}
+
+        before = counter.count
+        started = time.perf_counter()
+        response = await client.request(method, path, **kwargs)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        if index < warmup:
+            continue
+        if response.status_code >= 400:
+            errors += 1
+        latencies.append(elapsed)
+        queries.append(counter.count - before)
+
+    return {
+        "method": method,
+        "path": template,
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else 0.0,
+        "max_queries": max(queries, default=0),
+    }
+
+
+async def run_all(args, users: list[dict]) -> dict:
+    import httpx
+    from backend.database import engine
+    from backend.main import app
+
+    counter = QueryCounter(engine)
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name in args.scenarios:
+            requests = args.login_requests if name == "login" else args.requests
+            print(f"   ▶ {name}", file=sys.stderr)
+            results[name] = await run_scenario(client, counter, name, users, requests, args.warmup, args.seed)
+    return results
+
+
+def database_info() -> dict:
+    from sqlalchemy import text
+    from backend.database import engine
+
+    with engine.connect() as connection:
+        if engine.dialect.name == "sqlite":
+            version = connection.execute(text("SELECT sqlite_version()")).scalar()
+        else:
+            version = connection.execute(text("SELECT VERSION()")).scalar()
+    return {"dialect": engine.dialect.name, "version": version}
+
+
+# === COMPARAISON ===
+
+def compare(report: dict, baseline_path: Path, max_regression: float) -> list[str]:
+    """Scénarios dont le p95 ou le nombre de requêtes a régressé par rapport à une référence"""
+    baseline = json.loads(baseline_path.read_text())["scenarios"]
+    regressions = []
+    for name, result in report["scenarios"].items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        if reference["p95_ms"] and result["p95_ms"] > reference["p95_ms"] * (1 + max_regression):
+            regressions.append(f"{name}: p95 {reference['p95_ms']} -> {result['p95_ms']} ms")
+        if result["queries_per_request"] > reference["queries_per_request"]:
+            regressions.append(
+                f"{name}: requêtes SQL {reference['queries_per_request']} -> {result['queries_per_request']}"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des routes critiques de l'API")
+    parser.add_argument("--db", choices=("sqlite", "mysql"), default="sqlite")
+    parser.add_argument("--sqlite-path", type=Path, default=ROOT / "benchmarks" / "bench.db")
+    parser.add_argument("--scale", choices=("small", "medium", "large"), default="small")
+    parser.add_argument("--users", type=int, help="Nombre d'utilisateurs (surcharge --scale)")
+    parser.add_argument("--years", type=float, help="Années d'historique (surcharge --scale)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processus de génération")
+    parser.add_argument("--reuse", action="store_true", help="Réutiliser le jeu de données existant")
+    parser.add_argument("--reset", action="store_true", help="Supprimer toutes les tables avant génération")
+    parser.add_argument("--scenarios", nargs="+", choices=tuple(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=200, help="Appels mesurés par scénario")
+    parser.add_argument("--login-requests", type=int, default=20, help="Appels mesurés pour login (bcrypt)")
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--sample-users", type=int, default=100, help="Utilisateurs tirés au sort")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="Fichier JSON (stdout sinon)")
+    parser.add_argument("--compare", type=Path, help="Rapport de référence")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Hausse de p95 tolérée (0.2 = 20 %%)")
+    args = parser.parse_args()
+
+    if args.db == "sqlite" and not args.reuse and args.sqlite_path.exists():
+        args.sqlite_path.unlink()
+
+    configure_environment(args)
+
+    from backend.config import settings
+    if args.db != "sqlite" and settings.ENVIRONMENT == "production":
+        # Même règle que seed_bulk : jamais de données de test ni de suppression en production
+        print(f"❌ Base {args.db} en PRODUCTION : benchmark refusé (utiliser une base dédiée)", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"📦 Jeu de données ({args.db}, {args.scale})", file=sys.stderr)
+    dataset = prepare_dataset(args)
+    users = load_users(args.sample_users, args.seed)
+
+    print("⏱️  Mesure", file=sys.stderr)
+    scenarios = asyncio.run(run_all(args, users))
+
+    report = {
+        "generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "database": database_info(),
+        "dataset": dataset,
+        "scenarios": scenarios,
+    }
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(output + "\n")
+        print(f"✅ Rapport : {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    if args.compare:
+        regressions = compare(report, args.compare, args.max_regression)
+        for line in regressions:
+            print(f"❌ {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print("✅ Pas de régression", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Rapport du temps de démarrage de l'application
+
+Lance plusieurs processus neufs (démarrage à froid) qui importent
+l'application avec `python -X importtime`, puis agrège :
+- les phases : import de backend.main (création de l'application comprise),
+  reconstruction de l'application (create_app seul), première requête
+  (création du moteur et première connexion) ;
+- le temps d'import propre de chaque paquet et des modules backend.*.
+
+Les valeurs sont des médianes sur --runs processus.
+
+Usage :
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --top 30 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Exécuté dans chaque processus mesuré ; imprime les phases en JSON sur stdout
+CHILD = """
+import asyncio, json, time
+started = time.perf_counter()
+import backend.main
+imported = time.perf_counter()
+backend.main.create_app()
+rebuilt = time.perf_counter()
+
+import httpx
+async def first_request():
+    transport = httpx.ASGITransport(app=backend.main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://startup") as client:
+        await client.get("/health")
+before = time.perf_counter()
+asyncio.run(first_request())
+done = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "create_app_ms": (rebuilt - imported) * 1000,
+    "first_request_ms": (done - before) * 1000,
+}))
+"""
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def run_once() -> tuple[dict, list[tuple[str, int, int]]]:
+    """Un démarrage à froid : (phases, [(module, propre µs, cumulé µs)])"""
+    env = dict(os.environ, SMTP_ENABLED="False", MAINTENANCE_ENABLED="False")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    phases = json.loads(result.stdout.strip().splitlines()[-1])
+    modules = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            modules.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return phases, modules
+
+
+def median_ms(values: list[float]) -> float:
+    return round(statistics.median(values) / 1000, 1) if values else 0.0
+
+
+def build_report(runs: int, top: int) -> dict:
+    phases = defaultdict(list)
+    package_self = defaultdict(list)
+    module_self = defaultdict(list)
+    module_cumulative = defaultdict(list)
+
+    for _ in range(runs):
+        run_phases, modules = run_once()
+        for name, value in run_phases.items():
+            phases[name].append(value)
+
+        per_package = defaultdict(int)
+        for module, self_us, cumulative_us in modules:
+            per_package[module.split(".")[0]] += self_us
+            if module.startswith("backend"):
+                module_self[module].append(self_us)
+                module_cumulative[module].append(cumulative_us)
+        for package, value in per_package.items():
+            package_self[package].append(value)
+
+    packages = sorted(package_self, key=lambda name: statistics.median(package_self[name]), reverse=True)
+    backend_modules = sorted(module_self, key=lambda name: statistics.median(module_self[name]), reverse=True)
+
+    return {
+        "runs": runs,
+        "python": sys.version.split()[0],
+        "phases_ms": {name: round(statistics.median(values), 1) for name, values in phases.items()},
+        "packages_self_ms": {name: median_ms(package_self[name]) for name in packages[:top]},
+        "backend_modules": [
+            {
+                "module": name,
+                "self_ms": median_ms(module_self[name]),
+                "cumulative_ms": median_ms(module_cumulative[name]),
+            }
+            for name in backend_modules[:top]
+        ],
+    }
+
+
+def print_report(report: dict):
+    print(f"\n⏱️  Démarrage à froid (médiane sur {report['runs']} processus, Python {report['python']})")
+    for name, value in report["phases_ms"].items():
+        print(f"   • {name:<18} {value:>8.1f} ms")
+
+    print("\n📦 Import par paquet (temps propre)")
+    for name, value in report["packages_self_ms"].items():
+        print(f"   • {name:<28} {value:>8.1f} ms")
+
+    print("\n🧩 Modules backend (propre / cumulé)")
+    for entry in report["backend_modules"]:
+        print(f"   • {entry['module']:<40} {entry['self_ms']:>7.1f} / {entry['cumulative_ms']:>7.1f} ms")
+    print("")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rapport du temps de démarrage de l'application")
+    parser.add_argument("--runs", type=int, default=5, help="Processus mesurés")
+    parser.add_argument("--top", type=int, default=20, help="Lignes par section")
+    parser.add_argument("--output", type=Path, help="Fichier JSON (texte sur stdout sinon)")
+    args = parser.parse_args()
+
+    report = build_report(args.runs, args.top)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"✅ Rapport : {args.output}")
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Purge des lignes expirées
+Tokens de reset password / vérification email, refresh tokens et cache de statistiques
+
+Usage :
+    python database/cleanup_expired.py               # Purge
+    python database/cleanup_expired.py --dry-run     # Compte seulement
+    python database/cleanup_expired.py --batch-size 1000 --pause 0.1
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.config import settings
+from backend.database import SessionLocal
+from backend.services.maintenance import EXPIRING_MODELS, count_expired, sweep_expired
+
+
+def main():
+    """Fonction principale"""
+    parser = argparse.ArgumentParser(description="Purge des lignes expirées")
+    parser.add_argument("--dry-run", action="store_true", help="Compter sans supprimer")
+    parser.add_argument("--batch-size", type=int, default=settings.MAINTENANCE_BATCH_SIZE, help="Taille des lots")
+    parser.add_argument("--pause", type=float, default=0.0, help="Pause entre deux lots (secondes)")
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("🧹 PURGE DES LIGNES EXPIRÉES" + (" (simulation)" if args.dry_run else ""))
+    print("=" * 60)
+
+    if args.dry_run:
+        db = SessionLocal()
+        try:
+            result = {model.__tablename__: count_expired(db, model) for model in EXPIRING_MODELS}
+        finally:
+            db.close()
+    else:
+        result = sweep_expired(batch_size=args.batch_size, pause=args.pause)
+
+    for table, count in result.items():
+        print(f"   {'🔎' if args.dry_run else '🗑️ '} {table:<28} {count}")
+
+    print("=" * 60)
+    print(f"✅ Total : {sum(result.values())} ligne(s) {'expirée(s)' if args.dry_run else 'supprimée(s)'}")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interruption par l'utilisateur")
+        sys.exit(0)
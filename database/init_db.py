@@ -27,11 +27,13 @@ from backend.models.exercise import Exercise
 from backend.models.session_template import SessionTemplate
 from backend.models.planning import Planning
 from backend.models.training_session import TrainingSession
+from backend.models.session_climb import SessionClimb
 from backend.models.route import Route
 from backend.models.goal_category import GoalCategory
 from backend.models.running_session import RunningSession
 from backend.models.program import Program
 from backend.models.stats_cache import StatsCache
+from backend.models.daily_load import DailyLoad
 from backend.models.password_reset import PasswordResetToken
 from backend.models.email_verification import EmailVerificationToken
 
@@ -162,13 +164,23 @@ def verify_tables():
         "session_templates",
         "planning",
         "training_sessions",
+        "session_climbs",
         "routes",
         "goal_categories",
         "running_sessions",
+        "running_tracks",
         "programs",
         "stats_cache",
+        "daily_loads",
+        "image_jobs",
         "password_reset_tokens",
         "email_verification_tokens",
+        "refresh_tokens",
+        "email_outbox",
+        "coach_athletes",
+        "search_documents",
+        "locations",
+        "user_week_summary",
     ]
     
     all_ok = True
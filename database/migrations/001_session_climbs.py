@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Migration 001 - Table session_climbs
+- Crée la table session_climbs (une ligne par voie grimpée en séance)
+- Remplit la table depuis TrainingSession.routes_json (par lots)
+
+Idempotent : les séances ayant déjà des voies sont ignorées.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from sqlalchemy import insert, select, exists
+
+from backend.database import engine, SessionLocal
+from backend.models.training_session import TrainingSession
+from backend.models.session_climb import SessionClimb
+from backend.services.climbs import build_climb_rows
+
+BATCH_SIZE = 500
+
+
+def create_table():
+    """Crée la table session_climbs si elle n'existe pas"""
+    print("\n📋 Création de la table session_climbs...")
+    SessionClimb.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Table prête")
+
+
+def backfill() -> int:
+    """
+    Remplit session_climbs depuis routes_json
+    Parcours par clé (id croissant) pour ne jamais charger toute la table
+
+    Returns:
+        Nombre de voies insérées
+    """
+    print("\n🔁 Reprise des voies depuis routes_json...")
+
+    db = SessionLocal()
+    total_sessions = 0
+    total_climbs = 0
+    last_id = 0
+
+    try:
+        while True:
+            batch = db.execute(
+                select(
+                    TrainingSession.id,
+                    TrainingSession.user_id,
+                    TrainingSession.date,
+                    TrainingSession.routes_json
+                ).where(
+                    TrainingSession.id > last_id,
+                    TrainingSession.routes_json != None,
+                    ~exists().where(SessionClimb.session_id == TrainingSession.id)
+                ).order_by(TrainingSession.id).limit(BATCH_SIZE)
+            ).all()
+
+            if not batch:
+                break
+
+            rows = []
+            for session_id, user_id, date, routes_json in batch:
+                rows.extend(build_climb_rows(session_id, user_id, date, routes_json))
+
+            if rows:
+                db.execute(insert(SessionClimb), rows)
+            db.commit()
+
+            last_id = batch[-1][0]
+            total_sessions += len(batch)
+            total_climbs += len(rows)
+            print(f"   ✅ {total_sessions} séances traitées ({total_climbs} voies)")
+
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    print(f"✅ {total_climbs} voies insérées")
+    return total_climbs
+
+
+def main():
+    """Fonction principale de migration"""
+    print("\n" + "=" * 60)
+    print("🚀 MIGRATION 001 - session_climbs")
+    print("=" * 60)
+
+    create_table()
+    backfill()
+
+    print("\n" + "=" * 60)
+    print("✅ MIGRATION TERMINÉE")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interruption par l'utilisateur")
+        sys.exit(0)
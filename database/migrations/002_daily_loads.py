@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Migration 002 - Table daily_loads
+- Crée la table daily_loads (charge d'entraînement journalière)
+- Recalcule la charge de chaque utilisateur depuis ses séances
+
+Idempotent : la charge de chaque utilisateur est entièrement recalculée.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from sqlalchemy import select
+
+from backend.database import engine, SessionLocal
+from backend.models.user import User
+from backend.models.daily_load import DailyLoad
+from backend.services.training_load import rebuild_daily_loads
+
+
+def create_table():
+    """Crée la table daily_loads si elle n'existe pas"""
+    print("\n📋 Création de la table daily_loads...")
+    DailyLoad.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Table prête")
+
+
+def backfill() -> int:
+    """
+    Recalcule daily_loads pour tous les utilisateurs (un commit par utilisateur)
+
+    Returns:
+        Nombre de jours écrits
+    """
+    print("\n🔁 Calcul de la charge journalière...")
+
+    db = SessionLocal()
+    total_days = 0
+
+    try:
+        user_ids = db.execute(select(User.id).order_by(User.id)).scalars().all()
+        for user_id in user_ids:
+            total_days += rebuild_daily_loads(db, user_id)
+            db.commit()
+        print(f"   ✅ {len(user_ids)} utilisateurs traités")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    print(f"✅ {total_days} jours écrits")
+    return total_days
+
+
+def main():
+    """Fonction principale de migration"""
+    print("\n" + "=" * 60)
+    print("🚀 MIGRATION 002 - daily_loads")
+    print("=" * 60)
+
+    create_table()
+    backfill()
+
+    print("\n" + "=" * 60)
+    print("✅ MIGRATION TERMINÉE")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interruption par l'utilisateur")
+        sys.exit(0)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Migration 003 - Table image_jobs
+- Crée la table image_jobs (file de traitement des photos, run_worker.py)
+
+Idempotent : la table n'est créée que si elle n'existe pas.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from backend.database import engine
+from backend.models.image_job import ImageJob
+
+
+def create_table():
+    """Crée la table image_jobs si elle n'existe pas"""
+    print("\n📋 Création de la table image_jobs...")
+    ImageJob.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Table prête")
+
+
+def main():
+    """Fonction principale de migration"""
+    print("\n" + "=" * 60)
+    print("🚀 MIGRATION 003 - image_jobs")
+    print("=" * 60)
+
+    create_table()
+
+    print("\n" + "=" * 60)
+    print("✅ MIGRATION TERMINÉE")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interruption par l'utilisateur")
+        sys.exit(0)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Migration 005 - Index sur expires_at
+- password_reset_tokens, email_verification_tokens, stats_cache
+  (purge des lignes expirées par lots, cf. database/cleanup_expired.py)
+
+Idempotent : les index existants sont ignorés.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from sqlalchemy import inspect
+
+from backend.database import engine
+from backend.services.maintenance import EXPIRING_MODELS
+
+
+def create_indexes():
+    """Crée les index expires_at manquants"""
+    print("\n📋 Création des index expires_at...")
+    inspector = inspect(engine)
+
+    for model in EXPIRING_MODELS:
+        table = model.__table__
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+
+        for index in table.indexes:
+            if [column.name for column in index.columns] != ["expires_at"]:
+                continue
+            if index.name in existing:
+                print(f"   ⏭️  {index.name} (existe déjà)")
+            else:
+                index.create(bind=engine)
+                print(f"   ✅ {index.name}")
+
+
+def main():
+    """Fonction principale de migration"""
+    print("\n" + "=" * 60)
+    print("🚀 MIGRATION 005 - index expires_at")
+    print("=" * 60)
+
+    create_indexes()
+
+    print("\n" + "=" * 60)
+    print("✅ MIGRATION TERMINÉE")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interruption par l'utilisateur")
+        sys.exit(0)
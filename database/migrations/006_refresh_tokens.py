@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Migration 006 - Rotation des refresh tokens
+- Ajoute la colonne users.token_version (invalidation de toutes les sessions)
+- Crée la table refresh_tokens (familles de refresh tokens)
+
+Les refresh tokens émis avant la migration n'ont pas de jti : les
+utilisateurs devront se reconnecter une fois.
+
+Idempotent : colonne et table ne sont créées que si elles manquent.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from sqlalchemy import inspect, text
+
+from backend.database import engine
+from backend.models.refresh_token import RefreshToken
+
+
+def add_token_version():
+    """Ajoute users.token_version si elle n'existe pas"""
+    print("\n📋 Ajout de users.token_version...")
+    columns = {column["name"] for column in inspect(engine).get_columns("users")}
+
+    if "token_version" in columns:
+        print("⏭️  Colonne déjà présente")
+        return
+
+    with engine.begin() as connection:
+        connection.execute(text("ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0"))
+    print("✅ Colonne ajoutée")
+
+
+def create_table():
+    """Crée la table refresh_tokens si elle n'existe pas"""
+    print("\n📋 Création de la table refresh_tokens...")
+    RefreshToken.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Table prête")
+
+
+def main():
+    """Fonction principale de migration"""
+    print("\n" + "=" * 60)
+    print("🚀 MIGRATION 006 - refresh_tokens")
+    print("=" * 60)
+
+    add_token_version()
+    create_table()
+
+    print("\n" + "=" * 60)
+    print("✅ MIGRATION TERMINÉE")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interruption par l'utilisateur")
+        sys.exit(0)
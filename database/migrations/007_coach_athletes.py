@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Migration 007 - Coaching
+Crée la table coach_athletes (autorisations d'accès athlète -> coach)
+
+Idempotent : la table n'est créée que si elle n'existe pas.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from backend.database import engine
+from backend.models.coach_athlete import CoachAthlete
+
+
+def create_table():
+    """Crée la table coach_athletes si elle n'existe pas"""
+    print("\n📋 Création de la table coach_athletes...")
+    CoachAthlete.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Table prête")
+
+
+def main():
+    """Fonction principale de migration"""
+    print("\n" + "=" * 60)
+    print("🚀 MIGRATION 007 - coach_athletes")
+    print("=" * 60)
+
+    create_table()
+
+    print("\n" + "=" * 60)
+    print("✅ MIGRATION TERMINÉE")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interruption par l'utilisateur")
+        sys.exit(0)
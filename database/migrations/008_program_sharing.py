@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Migration 008 - Catalogue des programmes publics
+- Ajoute programs.copy_count (popularité) et programs.source_program_id
+  (programme public d'origine d'une copie)
+- Crée l'index ix_programs_public_copies (catalogue trié par popularité)
+
+Idempotent : colonnes et index ne sont créés que s'ils manquent.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from sqlalchemy import inspect, text
+
+from backend.database import engine
+from backend.models.program import Program
+
+COLUMNS = {
+    "copy_count": "INTEGER NOT NULL DEFAULT 0",
+    "source_program_id": "INTEGER NULL REFERENCES programs(id) ON DELETE SET NULL",
+}
+
+
+def add_columns():
+    """Ajoute les colonnes manquantes"""
+    print("\n📋 Ajout des colonnes de partage...")
+    existing = {column["name"] for column in inspect(engine).get_columns("programs")}
+
+    with engine.begin() as connection:
+        for name, definition in COLUMNS.items():
+            if name in existing:
+                print(f"   ⏭️  {name} (existe déjà)")
+                continue
+            connection.execute(text(f"ALTER TABLE programs ADD COLUMN {name} {definition}"))
+            print(f"   ✅ {name}")
+
+
+def create_index():
+    """Crée l'index du catalogue s'il n'existe pas"""
+    print("\n📋 Création de l'index du catalogue...")
+    existing = {index["name"] for index in inspect(engine).get_indexes("programs")}
+
+    for index in Program.__table__.indexes:
+        if index.name != "ix_programs_public_copies":
+            continue
+        if index.name in existing:
+            print(f"   ⏭️  {index.name} (existe déjà)")
+        else:
+            index.create(bind=engine)
+            print(f"   ✅ {index.name}")
+
+
+def main():
+    """Fonction principale de migration"""
+    print("\n" + "=" * 60)
+    print("🚀 MIGRATION 008 - catalogue des programmes")
+    print("=" * 60)
+
+    add_columns()
+    create_index()
+
+    print("\n" + "=" * 60)
+    print("✅ MIGRATION TERMINÉE")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interruption par l'utilisateur")
+        sys.exit(0)
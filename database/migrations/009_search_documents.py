@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Migration 009 - Recherche plein texte
+- Crée la table search_documents (+ table FTS5 et triggers sous SQLite,
+  index FULLTEXT sous MySQL)
+- Indexe les séances, grandes voies et sorties course existantes
+
+Idempotent : la table n'est créée que si elle n'existe pas, l'index est
+reconstruit entièrement.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from backend.database import engine, SessionLocal
+from backend.models.search_document import SearchDocument
+from backend.services.search import rebuild_search_index
+
+
+def create_table():
+    """Crée la table search_documents et l'index plein texte"""
+    print("\n📋 Création de la table search_documents...")
+    SearchDocument.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Table prête")
+
+
+def backfill():
+    """Indexe les données existantes"""
+    print("\n📋 Indexation des données existantes...")
+    db = SessionLocal()
+    try:
+        total = rebuild_search_index(db)
+    finally:
+        db.close()
+    print(f"✅ {total} document(s) indexé(s)")
+
+
+def main():
+    """Fonction principale de migration"""
+    print("\n" + "=" * 60)
+    print("🚀 MIGRATION 009 - search_documents")
+    print("=" * 60)
+
+    create_table()
+    backfill()
+
+    print("\n" + "=" * 60)
+    print("✅ MIGRATION TERMINÉE")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interruption par l'utilisateur")
+        sys.exit(0)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Migration 010 - Lieux
+- Crée la table locations (lieux normalisés par utilisateur, compteurs)
+- Calcule les lieux de chaque utilisateur depuis les séances, grandes voies
+  et sorties course existantes
+
+Idempotent : la table n'est créée que si elle n'existe pas, les lieux sont
+recalculés entièrement.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from backend.database import engine, SessionLocal
+from backend.models.user import User
+from backend.models.location import Location
+from backend.services.locations import rebuild_locations
+
+
+def create_table():
+    """Crée la table locations si elle n'existe pas"""
+    print("\n📋 Création de la table locations...")
+    Location.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Table prête")
+
+
+def backfill():
+    """Calcule les lieux de tous les utilisateurs"""
+    print("\n📋 Calcul des lieux existants...")
+    db = SessionLocal()
+    try:
+        user_ids = [user_id for (user_id,) in db.query(User.id).all()]
+        total = 0
+        for user_id in user_ids:
+            total += rebuild_locations(db, user_id)
+            db.commit()
+        print(f"✅ {total} lieu(x) pour {len(user_ids)} utilisateur(s)")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def main():
+    """Fonction principale de migration"""
+    print("\n" + "=" * 60)
+    print("🚀 MIGRATION 010 - locations")
+    print("=" * 60)
+
+    create_table()
+    backfill()
+
+    print("\n" + "=" * 60)
+    print("✅ MIGRATION TERMINÉE")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interruption par l'utilisateur")
+        sys.exit(0)
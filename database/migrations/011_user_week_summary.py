@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Migration 011 - Table user_week_summary
+- Crée la table user_week_summary (résumé d'activité par semaine ISO)
+- Recalcule les résumés de chaque utilisateur depuis ses séances
+
+Idempotent : les résumés de chaque utilisateur sont entièrement recalculés.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from sqlalchemy import select
+
+from backend.database import engine, SessionLocal
+from backend.models.user import User
+from backend.models.user_week_summary import UserWeekSummary
+from backend.services.week_summary import rebuild_week_summaries
+
+
+def create_table():
+    """Crée la table user_week_summary si elle n'existe pas"""
+    print("\n📋 Création de la table user_week_summary...")
+    UserWeekSummary.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Table prête")
+
+
+def backfill() -> int:
+    """
+    Recalcule user_week_summary pour tous les utilisateurs (un commit par utilisateur)
+
+    Returns:
+        Nombre de lignes écrites
+    """
+    print("\n🔁 Calcul des résumés hebdomadaires...")
+
+    db = SessionLocal()
+    total_rows = 0
+
+    try:
+        user_ids = db.execute(select(User.id).order_by(User.id)).scalars().all()
+        for user_id in user_ids:
+            total_rows += rebuild_week_summaries(db, user_id)
+            db.commit()
+        print(f"   ✅ {len(user_ids)} utilisateurs traités")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    print(f"✅ {total_rows} lignes écrites")
+    return total_rows
+
+
+def main():
+    """Fonction principale de migration"""
+    print("\n" + "=" * 60)
+    print("🚀 MIGRATION 011 - user_week_summary")
+    print("=" * 60)
+
+    create_table()
+    backfill()
+
+    print("\n" + "=" * 60)
+    print("✅ MIGRATION TERMINÉE")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interruption par l'utilisateur")
+        sys.exit(0)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Recalcul des résumés hebdomadaires (table user_week_summary)
+Après un import direct en base ou pour corriger une dérive
+
+Usage :
+    python database/rebuild_week_summaries.py               # Tous les utilisateurs
+    python database/rebuild_week_summaries.py --user-id 42   # Un utilisateur
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import select
+
+from backend.database import SessionLocal
+from backend.models.user import User
+from backend.services.week_summary import rebuild_week_summaries
+
+
+def main():
+    """Fonction principale"""
+    parser = argparse.ArgumentParser(description="Recalcul des résumés hebdomadaires")
+    parser.add_argument("--user-id", type=int, help="Limiter à un utilisateur")
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("🔁 RECALCUL DES RÉSUMÉS HEBDOMADAIRES")
+    print("=" * 60)
+
+    db = SessionLocal()
+    total_rows = 0
+    try:
+        query = select(User.id).order_by(User.id)
+        if args.user_id is not None:
+            query = query.where(User.id == args.user_id)
+        user_ids = db.execute(query).scalars().all()
+
+        # Un commit par utilisateur : les lectures des autres restent servies
+        for user_id in user_ids:
+            total_rows += rebuild_week_summaries(db, user_id)
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    print("=" * 60)
+    print(f"✅ {len(user_ids)} utilisateur(s), {total_rows} ligne(s) écrite(s)")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interruption par l'utilisateur")
+        sys.exit(0)
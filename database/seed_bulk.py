@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Génération rapide d'une base de test de charge
+Utilisateurs, séances (et voies détaillées), sorties course, grandes voies,
+objectifs, planning et charge journalière, en volume configurable
+⚠️ À utiliser uniquement sur une base dédiée !
+
+- Insertions Core par lots (executemany), un seul hash de mot de passe
+- Génération parallèle par tranches d'utilisateurs (--workers), IDs
+  réservés par tranche : aucune coordination entre processus
+- Les données dérivées (lieux, index de recherche) ne sont pas calculées :
+  lancer les migrations 009 et 010 pour les reconstruire si besoin
+- La charge journalière et les résumés hebdomadaires (migration 011) sont
+  générés directement, avec les mêmes règles que les hooks de l'API
+
+Usage :
+    python database/seed_bulk.py --users 5000 --years 2
+    python database/seed_bulk.py --scale large --workers 8 --reset
+
+Tous les comptes générés (benchN@bench.local) ont le mot de passe Bench2024!
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Ajouter le dossier racine au path pour les imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.config import settings
+from backend.database import engine, init_db, drop_all_tables
+from benchmarks.dataset import BENCH_PASSWORD, SCALES, generate, password_hash, rows_per_user, scaled_config
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Génération rapide d'une base de test de charge")
+    parser.add_argument("--scale", choices=tuple(SCALES), default="small", help="Taille prédéfinie")
+    parser.add_argument("--users", type=int, help="Nombre d'utilisateurs")
+    parser.add_argument("--years", type=float, help="Années d'historique par utilisateur")
+    parser.add_argument("--training-per-week", type=float, help="Séances d'escalade par semaine")
+    parser.add_argument("--running-per-week", type=float, help="Sorties course par semaine")
+    parser.add_argument("--climbs-per-session", type=int, help="Voies détaillées par séance")
+    parser.add_argument("--routes-per-user", type=int, help="Grandes voies par utilisateur")
+    parser.add_argument("--planning-weeks", type=int, help="Semaines de planning par utilisateur")
+    parser.add_argument("--chunk-size", type=int, help="Lignes par executemany")
+    parser.add_argument("--seed", type=int, help="Graine aléatoire (jeu reproductible)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processus de génération")
+    parser.add_argument("--shard-size", type=int, default=250, help="Utilisateurs par tranche")
+    parser.add_argument("--reset", action="store_true", help="Supprimer toutes les tables avant génération (interdit en production)")
+    parser.add_argument("--yes", action="store_true", help="Ne pas demander de confirmation")
+    return parser.parse_args()
+
+
+def main():
+    """Fonction principale"""
+    args = parse_args()
+
+    print("\n" + "=" * 60)
+    print("🌱 SEED BULK - Base de test de charge")
+    print("=" * 60)
+
+    if settings.ENVIRONMENT == "production" and args.reset:
+        # drop_all_tables() refuse la production : on s'arrête avant de générer quoi que ce soit
+        print("\n❌ --reset est interdit en PRODUCTION (suppression de toutes les tables)")
+        sys.exit(1)
+
+    if settings.ENVIRONMENT == "production" and not args.yes:
+        print("\n⚠️  ATTENTION : Vous êtes en PRODUCTION")
+        confirm = input("Voulez-vous vraiment générer des données de test ? (yes/no) : ")
+        if confirm.lower() != "yes":
+            print("❌ Annulé")
+            return
+
+    config = scaled_config(
+        args.scale,
+        users=args.users,
+        years=args.years,
+        training_per_week=args.training_per_week,
+        running_per_week=args.running_per_week,
+        climbs_per_session=args.climbs_per_session,
+        routes_per_user=args.routes_per_user,
+        planning_weeks=args.planning_weeks,
+        chunk_size=args.chunk_size,
+        seed=args.seed,
+    )
+    expected = {table: count * config.users for table, count in rows_per_user(config).items()}
+    print(f"\n📊 {config.users} utilisateurs, {config.years} an(s) d'historique")
+    print(f"   ~{sum(expected.values()):,} lignes ({expected['training_sessions']:,} séances, "
+          f"{expected['session_climbs']:,} voies, {expected['running_sessions']:,} sorties course)")
+
+    if args.reset:
+        print("\n🗑️  Suppression des tables...")
+        init_db()  # Enregistre tous les modèles avant la suppression
+        drop_all_tables()
+    init_db()
+
+    started = time.perf_counter()
+    hashed_password = password_hash()
+    print(f"\n⚙️  Génération ({args.workers} processus)...")
+    counts = generate(
+        engine, config,
+        hashed_password=hashed_password,
+        progress=lambda done, total: print(f"   {done}/{total} utilisateurs", end="\r", flush=True),
+        workers=args.workers,
+        shard_size=args.shard_size,
+    )
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+
+    print("\n\n📋 Lignes insérées :")
+    for table, count in counts.items():
+        print(f"   • {table:<18} {count:>12,}")
+
+    print("\n" + "=" * 60)
+    print(f"✅ {total:,} LIGNES EN {elapsed:.1f}s ({total / max(elapsed, 1e-9):,.0f} lignes/s)")
+    print("=" * 60)
+    print(f"\n🔑 Comptes : bench<ID>@bench.local - Mot de passe : {BENCH_PASSWORD}")
+    print("")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interruption par l'utilisateur")
+        sys.exit(0)
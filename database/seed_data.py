@@ -22,6 +22,8 @@ from backend.models.session_template import SessionTemplate
 from backend.models.route import Route
 from backend.models.goal_category import GoalCategory
 from backend.models.running_session import RunningSession
+from backend.services.search import rebuild_search_index
+from backend.services.week_summary import rebuild_week_summaries
 from backend.config import settings, get_upload_path
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -332,6 +334,12 @@ def main():
             create_demo_goal_categories(db, user)
             create_demo_running_sessions(db, user)
         
+        # Résumés hebdomadaires puis index de recherche des données créées
+        # (rebuild_search_index détache les objets chargés et fait le commit)
+        for user in users:
+            rebuild_week_summaries(db, user.id)
+        rebuild_search_index(db)
+        
         print("\n" + "=" * 60)
         print("✅ DONNÉES D'EXEMPLE CRÉÉES !")
         print("=" * 60)
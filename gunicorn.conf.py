@@ -0,0 +1,61 @@
+"""
+Configuration gunicorn (production)
+Workers uvicorn, application pré-chargée dans le processus maître
+
+Usage (depuis la racine du projet, fichier lu automatiquement) :
+    gunicorn
+    gunicorn -c gunicorn.conf.py --workers 4
+
+- L'application (routes, schémas Pydantic, tables de cotations, templates
+  email, schéma OpenAPI) est construite une fois dans le maître puis gelée
+  (gc.freeze) : les workers la partagent en copy-on-write, le ramasse-miettes
+  ne parcourt plus ces objets et ne duplique donc pas leurs pages mémoire.
+- Le moteur de base de données et son pool sont créés dans chaque worker
+  après le fork (post_fork) : aucune connexion n'est partagée entre processus.
+- Les workers sont recyclés après WEB_MAX_REQUESTS requêtes ; un nouveau
+  worker part de l'application déjà construite (démarrage quasi immédiat).
+"""
+
+import gc
+import multiprocessing
+
+from backend.config import settings
+
+wsgi_app = "backend.main:app"
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = f"{settings.APP_HOST}:{settings.APP_PORT}"
+workers = settings.WEB_WORKERS or multiprocessing.cpu_count() * 2 + 1
+preload_app = True
+
+# Recyclage des workers (fuites mémoire éventuelles), décalé entre workers
+max_requests = settings.WEB_MAX_REQUESTS
+max_requests_jitter = settings.WEB_MAX_REQUESTS // 10
+
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+accesslog = "-"
+loglevel = "info" if settings.DEBUG else "warning"
+
+# Pas de collecte dans le maître pendant la construction de l'application :
+# les objets créés restent groupés et sont gelés en une fois (when_ready)
+gc.disable()
+
+
+def when_ready(server):
+    """Application pré-chargée, avant le premier fork"""
+    from backend.main import warm_up
+
+    warm_up(server.app.wsgi())
+    gc.collect()
+    gc.freeze()
+    gc.enable()
+    server.log.info(f"Application pré-chargée, {gc.get_freeze_count()} objets gelés")
+
+
+def post_fork(server, worker):
+    """Dans chaque worker : moteur et pool propres au worker"""
+    from backend.database import get_engine, reset_engine_after_fork
+
+    reset_engine_after_fork()
+    get_engine()
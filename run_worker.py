@@ -0,0 +1,98 @@
+"""
+Worker de traitement des photos
+Consomme la file image_jobs : dérivés WebP, EXIF, réencodage
+
+Usage :
+    python run_worker.py           # Tourne en continu
+    python run_worker.py --once    # Vide la file puis s'arrête
+
+Plusieurs workers peuvent tourner en parallèle (prise de tâche atomique).
+"""
+
+import argparse
+import logging
+import signal
+import time
+
+from backend.config import settings
+from backend.database import SessionLocal
+from backend.services.image_jobs import claim_job, run_job, requeue_stale_jobs
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger("image_worker")
+
+# Vérification des tâches abandonnées (secondes)
+STALE_CHECK_INTERVAL = 60
+
+stopping = False
+
+
+def request_stop(signum, frame):
+    """Arrêt propre : la tâche en cours est terminée avant de quitter"""
+    global stopping
+    stopping = True
+    logger.info("Arrêt demandé, fin de la tâche en cours...")
+
+
+def work(once: bool = False) -> int:
+    """
+    Boucle principale du worker
+
+    Args:
+        once: S'arrêter dès que la file est vide
+
+    Returns:
+        Nombre de tâches traitées
+    """
+    processed = 0
+    last_stale_check = 0.0
+
+    while not stopping:
+        db = SessionLocal()
+        try:
+            if time.monotonic() - last_stale_check > STALE_CHECK_INTERVAL:
+                requeued = requeue_stale_jobs(db)
+                if requeued:
+                    logger.warning(f"{requeued} tâche(s) abandonnée(s) remise(s) en file")
+                last_stale_check = time.monotonic()
+
+            job = claim_job(db)
+            if job is not None:
+                started = time.monotonic()
+                result = run_job(db, job)
+                processed += 1
+                logger.info(
+                    f"Job {job.id} (route {job.route_id}) -> {result} "
+                    f"en {time.monotonic() - started:.2f}s"
+                )
+                continue
+        except Exception as e:
+            logger.error(f"Erreur du worker : {e}", exc_info=True)
+            db.rollback()
+        finally:
+            db.close()
+
+        if once:
+            break
+        time.sleep(settings.IMAGE_JOB_POLL_SECONDS)
+
+    return processed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Worker de traitement des photos")
+    parser.add_argument("--once", action="store_true", help="Vider la file puis s'arrêter")
+    args = parser.parse_args()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    print("=" * 60)
+    print("🖼️  Training Escalade - Worker photos")
+    print("=" * 60)
+
+    count = work(once=args.once)
+    print(f"✅ {count} tâche(s) traitée(s)")
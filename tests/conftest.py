@@ -0,0 +1,70 @@
+"""
+Fixtures communes des tests
+Base SQLite temporaire (tables recréées à chaque test), client HTTP et
+utilisateur authentifié
+"""
+
+import os
+import tempfile
+
+# Configuration lue par backend.config : avant tout import backend
+_TMP_DIR = tempfile.mkdtemp(prefix="training-tests-")
+os.environ.update({
+    "ENVIRONMENT": "development",
+    "DATABASE_TYPE": "sqlite",
+    "SQLITE_PATH": os.path.join(_TMP_DIR, "test.db"),
+    "UPLOAD_DIR": os.path.join(_TMP_DIR, "uploads"),
+    "SMTP_ENABLED": "False",
+    "MAINTENANCE_ENABLED": "False",
+})
+for _name in ("SECRET_KEY", "DB_PASSWORD", "SMTP_PASSWORD"):
+    os.environ.setdefault(_name, "tests")
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.auth import create_access_token
+from backend.database import SessionLocal, init_db, drop_all_tables
+from backend.main import app
+from backend.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def database():
+    """Tables créées avant chaque test, supprimées après"""
+    init_db()
+    yield
+    drop_all_tables()
+
+
+@pytest.fixture
+def db():
+    """Session de base de données"""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client():
+    """Client HTTP sur l'application (sans serveur)"""
+    return TestClient(app)
+
+
+@pytest.fixture
+def user(db):
+    """Utilisateur actif (mot de passe non utilisé : le token est créé directement)"""
+    user = User(email="athlete@test.fr", username="athlete", password_hash="-", is_active=True, is_verified=True)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+@pytest.fixture
+def auth_headers(user):
+    """En-têtes d'authentification de l'utilisateur"""
+    token = create_access_token({"sub": user.email, "ver": user.token_version or 0})
+    return {"Authorization": f"Bearer {token}"}
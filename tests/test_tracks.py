@@ -0,0 +1,63 @@
+"""
+Tests des traces GPS des sorties course (upload GPX)
+"""
+
+GPX_POINT = '<trkpt lat="{lat}" lon="{lon}"><ele>{ele}</ele><time>2026-10-01T10:{minute:02d}:00Z</time></trkpt>'
+
+
+def gpx(*points):
+    """Fichier GPX d'un segment : (lat, lon) par point, une minute d'écart"""
+    body = "".join(
+        GPX_POINT.format(lat=lat, lon=lon, ele=200 + minute, minute=minute)
+        for minute, (lat, lon) in enumerate(points)
+    )
+    return (
+        '<?xml version="1.0"?><gpx xmlns="http://www.topografix.com/GPX/1/1">'
+        f"<trk><trkseg>{body}</trkseg></trk></gpx>"
+    ).encode()
+
+
+def create_run(client, auth_headers):
+    response = client.post("/api/running", headers=auth_headers, json={
+        "date": "2026-10-01", "duration_min": 30, "distance_km": 5.0, "rpe": 5,
+    })
+    assert response.status_code == 201
+    return response.json()
+
+
+def upload(client, auth_headers, session_id, content):
+    return client.post(
+        f"/api/running/{session_id}/track",
+        headers=auth_headers,
+        files={"file": ("run.gpx", content, "application/gpx+xml")},
+    )
+
+
+def test_upload_track_updates_session(client, auth_headers):
+    run = create_run(client, auth_headers)
+
+    response = upload(client, auth_headers, run["id"], gpx((45.0, 5.0), (45.001, 5.001), (45.002, 5.0025)))
+    assert response.status_code == 201
+    summary = response.json()
+    assert summary["point_count"] == 3
+    assert summary["duration_s"] == 120
+    assert 200 < summary["distance_m"] < 400
+
+    polyline = client.get(f"/api/running/{run['id']}/track", headers=auth_headers).json()
+    assert polyline["points"][0] == [45.0, 5.0]
+    assert polyline["bounds"] == [[45.0, 5.0], [45.002, 5.0025]]
+
+
+def test_upload_rejects_out_of_range_coordinates(client, auth_headers):
+    run = create_run(client, auth_headers)
+
+    for point in ((450, 5000), (45.0, 180.5), (-90.01, 5.0)):
+        response = upload(client, auth_headers, run["id"], gpx((45.0, 5.0), (45.001, 5.001), point))
+        assert response.status_code == 400
+        assert "Invalid coordinates" in response.json()["detail"]
+
+    # Ni trace enregistrée, ni résumé de la sortie modifié
+    assert client.get(f"/api/running/{run['id']}/track", headers=auth_headers).status_code == 404
+    session = client.get(f"/api/running/{run['id']}", headers=auth_headers).json()
+    assert session["distance_km"] == 5.0
+    assert session["duration_min"] == 30
@@ -0,0 +1,105 @@
+"""
+Tests des résumés hebdomadaires (user_week_summary)
+Les deltas appliqués par l'API doivent donner les mêmes lignes qu'un
+recalcul complet (rebuild_week_summaries)
+"""
+
+import json
+
+from backend.models.user_week_summary import UserWeekSummary
+from backend.services.week_summary import COUNTERS, rebuild_week_summaries
+
+
+def routes(*climbs):
+    """routes_json d'une séance : (cotation, style) par voie"""
+    return json.dumps([{"grade": grade, "style": style, "tries": 2} for grade, style in climbs])
+
+
+def summary_rows(db, user_id):
+    """
+    Lignes de l'utilisateur par (semaine, mois)
+    Une ligne dont tous les compteurs sont revenus à zéro équivaut à une
+    ligne absente (elle n'est pas supprimée, les statistiques l'ignorent)
+    """
+    db.expire_all()
+    rows = {}
+    for row in db.query(UserWeekSummary).filter(UserWeekSummary.user_id == user_id):
+        values = {name: getattr(row, name) for name in COUNTERS}
+        values["best_grade_rank"] = row.best_grade_rank
+        if any(values[name] for name in COUNTERS):
+            rows[(row.week_start, row.month_start)] = values
+    return rows
+
+
+def test_incremental_summaries_match_rebuild(client, auth_headers, user, db):
+    # Escalade : trois séances la même semaine, une autre à cheval sur deux mois
+    first = client.post("/api/sessions/training", headers=auth_headers, json={
+        "date": "2026-03-03", "duration_min": 90, "rpe": 7,
+        "routes_json": routes(("6c", "onsight"), ("7a", "redpoint"), ("7b", "project")),
+    }).json()
+    hardest = client.post("/api/sessions/training", headers=auth_headers, json={
+        "date": "2026-03-05", "duration_min": 120, "rpe": 8, "best_grade": "7b+",
+        "routes_json": routes(("7b+", "redpoint"), ("7a", "flash")),
+    }).json()
+    client.post("/api/sessions/training", headers=auth_headers, json={
+        "date": "2026-03-06", "duration_min": 45, "rpe": 4,
+        "routes_json": routes(("6a+", "flash"), ("6c", "project")),
+    })
+    boundary = client.post("/api/sessions/training", headers=auth_headers, json={
+        "date": "2026-03-31", "duration_min": 60, "rpe": 5,
+        "routes_json": routes(("6b", "flash")),
+    }).json()
+
+    # Course : durée, distance, dénivelé ; charge par RPE ou par fréquence cardiaque
+    run = client.post("/api/running", headers=auth_headers, json={
+        "date": "2026-03-04", "duration_min": 45, "distance_km": 8.4, "elevation_gain_m": 120, "rpe": 6,
+    }).json()
+    client.post("/api/running", headers=auth_headers, json={
+        "date": "2026-04-01", "duration_min": 70, "distance_km": 12.25,
+        "average_heart_rate": 150, "max_heart_rate": 185,
+    })
+    removed_run = client.post("/api/running", headers=auth_headers, json={
+        "date": "2026-03-05", "duration_min": 30, "distance_km": 5.0, "rpe": 4,
+    }).json()
+
+    # Modifications : changement de semaine, de voies, de durée
+    response = client.put(f"/api/sessions/training/{first['id']}", headers=auth_headers, json={
+        "date": "2026-03-12", "routes_json": routes(("7a+", "onsight"), ("6a", "redpoint")),
+    })
+    assert response.status_code == 200
+    response = client.put(f"/api/sessions/training/{boundary['id']}", headers=auth_headers, json={
+        "duration_min": 75, "rpe": 6,
+    })
+    assert response.status_code == 200
+    response = client.put(f"/api/running/{run['id']}", headers=auth_headers, json={
+        "date": "2026-03-30", "distance_km": 9.1,
+    })
+    assert response.status_code == 200
+
+    # Suppressions : dont la séance qui détenait la meilleure cotation de sa semaine
+    assert client.delete(f"/api/sessions/training/{hardest['id']}", headers=auth_headers).status_code == 200
+    assert client.delete(f"/api/running/{removed_run['id']}", headers=auth_headers).status_code == 200
+
+    incremental = summary_rows(db, user.id)
+    assert incremental
+
+    rebuild_week_summaries(db, user.id)
+    db.commit()
+
+    assert incremental == summary_rows(db, user.id)
+
+
+def test_delete_everything_leaves_no_activity(client, auth_headers, user, db):
+    created = client.post("/api/sessions/training", headers=auth_headers, json={
+        "date": "2026-05-06", "duration_min": 60, "rpe": 6,
+        "routes_json": routes(("6c+", "onsight")),
+    }).json()
+    run = client.post("/api/running", headers=auth_headers, json={
+        "date": "2026-05-07", "duration_min": 40, "distance_km": 7.0, "rpe": 5,
+    }).json()
+    assert summary_rows(db, user.id)
+
+    assert client.delete(f"/api/sessions/training/{created['id']}", headers=auth_headers).status_code == 200
+    assert client.delete(f"/api/running/{run['id']}", headers=auth_headers).status_code == 200
+
+    assert summary_rows(db, user.id) == {}